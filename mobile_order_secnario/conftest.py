@@ -1 +1,294 @@
+# -*- coding: utf-8 -*-
+# --- 필수 모듈 임포트 ---
+import pytest
+from utils.app_perf import app_perf_sampler
+from utils.appium_driver import device_session_started
+from utils.coverage import SelectionPolicy, coverage_store
+from utils.data_stream import DataStream
+from utils.evidence import EvidencePolicy, evidence_collector
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.locator_stats import locator_stats
+from utils.login_cache import login_cache
+from utils.run_history import run_history
+from utils.scenario_context import scenario_context
+from utils.scenario_matrix import expand_matrix, load_matrix, load_case_ids, parse_shard, shard_cases
+from utils.soak_monitor import soak_monitor
+from utils.throughput import throughput_meter
+from utils.timeout_policy import timeout_policy
+from utils.ui_idle import ui_idle_monitor
+from utils.verification import VerificationLevel, verification_settings
 
+# -> 성능 회귀 게이트(--perf-gate, --perf-baseline-update), 실행 타임라인 내보내기(--trace-export),
+#    sleep/대기 시간 프로파일러(--profile-waits), 일시 오류 재시도 리포트 플러그인
+pytest_plugins = ["utils.perf_gate", "utils.trace_export", "utils.wait_profiler", "utils.retry_policy"]
+
+
+# --- pytest 옵션 및 훅 ---
+def pytest_addoption(parser):
+    """
+    커맨드라인 옵션을 등록합니다.
+    """
+    parser.addoption(
+        "--evidence",
+        action="store",
+        default=None,
+        choices=list(EvidencePolicy.ALL),
+        help="실패 증거(스크린샷) 수집 정책: immediate(즉시) / deferred(테스트 실패 시 1회) / off",
+    )
+    parser.addoption(
+        "--verify-level",
+        action="store",
+        default=None,
+        choices=list(VerificationLevel.ALL),
+        help="검증 수준: smoke(화면 이동 필수 검증만) / standard(금액 계산 등 결과 검증까지) / audit(문구/표시 형식까지 전체, 기본값)",
+    )
+    parser.addoption(
+        "--start-at",
+        action="store",
+        default=None,
+        help="체크포인트 상태로 지정한 단계부터 시나리오 시작 (예: step3_discount, step4_payment)",
+    )
+    parser.addoption(
+        "--attach-session",
+        action="store",
+        nargs="?",
+        const="daemon",
+        default=None,
+        help="새 세션 대신 기존 Appium 세션에 연결 (값 생략 시 세션 데몬의 세션, 값을 주면 해당 세션 ID)",
+    )
+
+    parser.addoption(
+        "--record-cassette",
+        action="store",
+        default=None,
+        help="실행 중 WebDriver 명령/응답을 tests/cassettes/<이름>.json.gz 카세트로 기록",
+    )
+    parser.addoption(
+        "--replay-cassette",
+        action="store",
+        default=None,
+        help="기기 없이 카세트(tests/cassettes/<이름>.json.gz)의 응답으로 재생 실행",
+    )
+    parser.addoption(
+        "--fake-driver",
+        action="store",
+        default=None,
+        help="기기 없이 화면 계층 픽스처(tests/fixtures/ui/<이름>)로 동작하는 가짜 드라이버로 실행",
+    )
+    parser.addoption(
+        "--app-perf",
+        action="store_true",
+        default=False,
+        help="실행 중 앱의 CPU/메모리/프레임을 주기적으로 수집하여 단계별 리소스 프로파일 저장 및 직전 빌드와 비교",
+    )
+    parser.addoption(
+        "--app-build",
+        action="store",
+        default=None,
+        help="앱 성능 프로파일을 저장할 빌드 이름 (생략 시 기기에서 versionName 확인)",
+    )
+    parser.addoption(
+        "--login-profile",
+        action="store",
+        default=None,
+        help="세션 capability 프로파일: warm(로그인 상태 재사용) / clean(앱 데이터 초기화) / full(앱 재설치), config.json 'LoginCache'",
+    )
+    parser.addoption(
+        "--order-loop",
+        action="store",
+        type=int,
+        default=None,
+        help="test_order_throughput: 한 세션에서 연속 생성할 주문 수 (0이면 config.json 'Throughput.duration_minutes'까지)",
+    )
+    parser.addoption(
+        "--order-data",
+        action="store",
+        default=None,
+        help="테스트 데이터 스트림(JSONL/CSV) 경로. 연속 주문은 반복마다, 시나리오는 케이스마다 고객/제품 레코드를 한 건씩 사용",
+    )
+    parser.addoption(
+        "--data-worker",
+        action="store",
+        default=None,
+        help="테스트 데이터 스트림 중 이 워커 몫의 레코드만 사용 (형식: 번호/전체, 예: 1/3). 병렬 실행기가 기기별로 지정",
+    )
+    parser.addoption(
+        "--data-restart",
+        action="store_true",
+        default=False,
+        help="테스트 데이터 스트림을 이전 실행 위치에서 이어 읽지 않고 처음부터 읽음",
+    )
+    parser.addoption(
+        "--soak",
+        action="store",
+        nargs="?",
+        type=float,
+        const=0,
+        default=None,
+        help="연속 주문 모드에서 테스트 프로세스 메모리(RSS, tracemalloc) 증가 측정. 값을 주면 그 시간(분) 동안 반복",
+    )
+    parser.addoption(
+        "--matrix",
+        action="store_true",
+        default=False,
+        help="data/scenario_matrix.json의 조합을 케이스로 확장하여 시나리오를 매개변수화 실행",
+    )
+    parser.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        help="매트릭스 케이스 중 이 샤드의 케이스만 실행 (형식: 번호/전체, 예: 1/3)",
+    )
+    parser.addoption(
+        "--case-file",
+        action="store",
+        default=None,
+        help="실행할 매트릭스 케이스 ID 목록(JSON) 파일. 병렬 실행기가 기기별 배정 결과로 생성",
+    )
+    parser.addoption(
+        "--device",
+        action="store",
+        default=None,
+        help="사용할 config.json의 디바이스 설정 키 (예: Capabilities_Android)",
+    )
+    parser.addoption(
+        "--seed",
+        action="store",
+        type=int,
+        default=None,
+        help="매트릭스 미사용 시 랜덤 선택에 사용할 시드 (로그에 남은 시드로 재현)",
+    )
+    parser.addoption(
+        "--selection",
+        action="store",
+        default=None,
+        choices=list(SelectionPolicy.ALL),
+        help="케이스가 지정하지 않은 옵션 선택 정책: uniform(균등 랜덤) / coverage(덜 실행된 조합 우선). "
+             "미지정 시 매트릭스 케이스는 uniform(case_id로 재현), 그 외는 config.json 'Coverage.policy'. "
+             "coverage 정책의 실패는 --replay로만 재현됩니다.",
+    )
+    parser.addoption(
+        "--replay",
+        action="store",
+        default=None,
+        help="reports/coverage/runs의 선택 기록 파일 경로. 기록된 시드와 선택값으로 그대로 재실행",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """
+    --matrix 옵션이 있으면 scenario_case 픽스처를 매트릭스 케이스(샤드 적용)로 매개변수화합니다.
+    """
+    if "scenario_case" not in metafunc.fixturenames or not metafunc.config.getoption("--matrix"):
+        return
+    cases = expand_matrix(load_matrix())
+    case_file = metafunc.config.getoption("--case-file")
+    if case_file:
+        # -> 배정된 순서(예상 소요 시간이 긴 순)대로 실행합니다.
+        cases_by_id = {case.case_id: case for case in cases}
+        cases = [cases_by_id[case_id] for case_id in load_case_ids(case_file) if case_id in cases_by_id]
+    shard_option = metafunc.config.getoption("--shard")
+    if shard_option:
+        shard_index, shard_count = parse_shard(shard_option)
+        cases = shard_cases(cases, shard_index, shard_count)
+    metafunc.parametrize("scenario_case", cases, ids=[case.case_id for case in cases], indirect=True)
+
+
+@pytest.fixture
+def scenario_case(request):
+    """
+    현재 테스트의 매트릭스 케이스를 시나리오 컨텍스트에 활성화합니다. (매트릭스 미사용 시 None)
+    """
+    case = getattr(request, "param", None)
+    replay_path = request.config.getoption("--replay")
+    replay = coverage_store.load_run(replay_path) if replay_path else None
+    scenario_context.activate(case, seed=request.config.getoption("--seed"), replay=replay)
+    yield case
+    scenario_context.activate(None)
+
+
+@pytest.fixture(scope="session")
+def data_stream(request):
+    """
+    --order-data로 지정한 테스트 데이터 스트림에서 이 워커 몫의 레코드를 차례로 꺼내는 이터레이터입니다. (미지정 시 None)
+    세션 안의 모든 테스트가 같은 이터레이터를 공유하므로 케이스/반복마다 다른 레코드를 사용합니다.
+    """
+    path = request.config.getoption("--order-data")
+    if not path:
+        return None
+    worker = request.config.getoption("--data-worker")
+    worker_index, worker_count = parse_shard(worker) if worker else (0, 1)
+    stream = DataStream(path, worker_index, worker_count)
+    if request.config.getoption("--data-restart"):
+        stream.reset()
+    return iter(stream)
+
+
+def pytest_configure(config):
+    evidence_collector.set_policy(config.getoption("--evidence"))
+    verification_settings.set_level(config.getoption("--verify-level"))
+    coverage_store.set_policy(config.getoption("--selection"))
+    run_history.set_device(config.getoption("--device"))
+    app_perf_sampler.configure(config.getoption("--app-perf"), config.getoption("--app-build"))
+    login_cache.set_profile(config.getoption("--login-profile"))
+    soak_minutes = config.getoption("--soak")
+    if soak_minutes is not None:
+        soak_monitor.enabled = True
+        if soak_minutes:
+            throughput_meter.duration_minutes = soak_minutes
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    테스트 1건(setup/call/teardown 전체, 드라이버 생성과 종료 포함)을 test 측정 구간으로 엽니다.
+    """
+    with instrumentation.span(item.nodeid, SpanCategory.TEST):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    테스트 본문(call) 결과가 확정되면 보류된 증거를 처리합니다.
+    - 실패: 보류된 요청 중 마지막 화면으로 스크린샷 1회 저장 (드라이버 종료 전 시점)
+    - 성공: 보류된 요청을 버림
+    그리고 시나리오의 옵션 선택 기록을 커버리지 저장소에, 시나리오 전체 실행 시간을 실행 기록 DB에 남깁니다.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    # -> 픽스처 종료 처리에서 테스트 결과를 확인할 수 있도록 item.rep_setup / rep_call 등으로 남깁니다.
+    setattr(item, f"rep_{report.when}", report)
+    if report.when != "call":
+        return
+    if report.failed:
+        evidence_collector.flush()
+    else:
+        evidence_collector.discard()
+    callspec = getattr(item, "callspec", None)
+    case = callspec.params.get("scenario_case") if callspec else None
+    # -> 케이스 배정(LPT)의 예상 시간으로 쓰이므로, 드라이버를 사용하는 시나리오의 전체 실행만 기록합니다.
+    #    (단위 테스트나 --start-at으로 중간 단계부터 실행한 시간은 남기지 않음)
+    if "driver_setup" in item.fixturenames and not item.config.getoption("--start-at"):
+        run_history.record_scenario(item.nodeid, getattr(case, "case_id", item.name), report.duration,
+                                    passed=report.passed)
+    if "scenario_case" in item.fixturenames:
+        case_id = getattr(scenario_context.case, "case_id", None)
+        run_path = coverage_store.record(scenario_context.choices, scenario_context.seed, case_id=case_id,
+                                         test_name=item.nodeid, passed=report.passed)
+        if report.failed and run_path and coverage_store.policy_for(case_id) == SelectionPolicy.COVERAGE:
+            # -> coverage 정책의 선택은 커버리지 파일 상태에 따라 달라지므로 case_id만으로는 재현되지 않습니다.
+            report.sections.append(("선택 기록", f"이 실패는 --replay {run_path} 로 재현합니다. (선택값: {scenario_context.choices})"))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    세션 종료 시 옵션 커버리지와, 실기기 세션이 있었다면 화면 전환별 안정화 시간 리포트와 로케이터 전략 통계를 남깁니다.
+    """
+    coverage_store.report()
+    # -> 안정화 시간 리포트와 학습 통계는 실기기 세션의 기록만 남깁니다.
+    #    (단위 테스트/가짜 드라이버 실행이 실제 리포트와 통계 파일을 만들거나 덮어쓰지 않도록)
+    if device_session_started():
+        ui_idle_monitor.report()
+        locator_stats.report()
+        timeout_policy.save()
@@ -9,9 +9,10 @@ class OrderStatusPage(BasePage):
     모바일 주문의 '주문 현황' 페이지를 나타내는 클래스입니다.
     이 클래스는 특정 고객의 주문 상태를 확인하고 상호작용하는 동작을 정의합니다.
     """
+    SCREEN_NAME = "order_status"
 
-    def __init__(self, driver, platform):
-        super().__init__(driver, platform)
+    def __init__(self, driver, platform, wait_for_screen=False):
+        super().__init__(driver, platform, wait_for_screen)
         locator_manager.set_platform(platform)
         self.locators = locator_manager.get_locators("Order_Status")
 
@@ -3,6 +3,7 @@ from pages.base_page import BasePage
 # -> 싱글턴 locator_manager 인스턴스를 직접 임포트합니다.
 from utils.locator_manager import locator_manager
 from utils.logger import logger
+from utils.navigation import NavigationError, navigation_tracker
 
 
 class MobileOrderPage(BasePage):
@@ -10,8 +11,10 @@ class MobileOrderPage(BasePage):
     디지털세일즈 앱의 독바를 통해 모바일 주문에 접속하고
     일반 주문을 시작하는 페이지 객체입니다.
     """
-    def __init__(self, driver, platform):
-        super().__init__(driver, platform)
+    SCREEN_NAME = "main"
+
+    def __init__(self, driver, platform, wait_for_screen=False):
+        super().__init__(driver, platform, wait_for_screen)
         # -> 수정된 locator_manager 사용 방식에 맞춰 코드를 수정합니다.
         locator_manager.set_platform(platform)
         # -> 올바른 페이지 키('test_order')로 로케이터를 가져옵니다.
@@ -64,3 +67,25 @@ class MobileOrderPage(BasePage):
             logger.error(f"'일반 주문 진입' 시작 실패: {e}", exc_info=True)
             self.take_screenshot("start_general_order_failure")
             raise
+
+    def return_to_order_home(self, max_back=8):
+        """
+        주문을 마친 화면에서 뒤로 가기로 모바일 주문 홈('일반 주문하기' 화면)까지 돌아갑니다.
+        앱 메인 화면까지 나가면 독바로 모바일 주문에 다시 진입합니다. (같은 세션에서 다음 주문을 시작할 때 사용)
+        :param max_back: 뒤로 가기 최대 횟수
+        """
+        logger.info("모바일 주문 홈으로 복귀 시도.")
+        for _ in range(max_back):
+            screen = navigation_tracker.current_screen(self.driver)
+            if screen == "mobile_order_home":
+                logger.info("모바일 주문 홈 복귀 완료.")
+                return
+            if screen == "main":
+                self.access_mobile_order_via_docbar()
+                navigation_tracker.wait_for_screen(self.driver, "mobile_order_home")
+                return
+            self.driver.back()
+            self.short_sleep()
+        self.take_screenshot("return_to_order_home_failure")
+        raise NavigationError(f"뒤로 가기 {max_back}회 안에 모바일 주문 홈으로 돌아가지 못했습니다. "
+                              f"(현재 화면: {navigation_tracker.last_screen})")
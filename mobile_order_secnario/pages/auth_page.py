@@ -10,8 +10,10 @@ class AuthPage(BasePage):
     모바일 주문 서비스의 고객 인증 페이지를 나타내는 클래스입니다.
     이 클래스는 '개인'/'개인사업자' 선택, 고객명/휴대폰 번호 입력 등 인증 관련 동작을 정의합니다.
     """
-    def __init__(self, driver, platform):
-        super().__init__(driver, platform)
+    SCREEN_NAME = "customer_auth"
+
+    def __init__(self, driver, platform, wait_for_screen=False):
+        super().__init__(driver, platform, wait_for_screen)
         # -> 수정된 locator_manager 사용 방식에 맞춰 코드를 수정합니다.
         locator_manager.set_platform(platform)
         self.locators = locator_manager.get_locators("auth_page_locators")
@@ -2,20 +2,54 @@
 # -> 필요한 모듈들을 모두 임포트합니다.
 import os
 import time
-import random
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from utils.evidence import evidence_collector
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.locator_manager import locator_manager
+from utils.locator_stats import locator_stats
 from utils.logger import logger
+from utils.navigation import navigation_tracker
+from utils.scenario_context import scenario_context
+from utils.soft_assert import soft_assertions
+from utils.timeout_policy import timeout_policy
+from utils.ui_idle import ui_idle_monitor
+from utils.wait_budget import wait_budget
 
 class BasePage:
-    def __init__(self, driver, platform):
+    # -> 페이지 클래스에서 '있을 수도, 없을 수도 있는' 선택 요소(Probe)의 로케이터 키를 선언합니다.
+    #    Probe 조회가 실패하면 실패 스크린샷을 남기지 않고 조용히 예외만 발생시킵니다.
+    PROBE_LOCATORS = frozenset()
+    # -> 페이지가 담당하는 화면 이름 (locators/screen_locators.json의 키)
+    SCREEN_NAME = None
+
+    def __init_subclass__(cls, **kwargs):
+        # -> 페이지 클래스의 public 메서드를 자동으로 측정 구간(page span)으로 감쌉니다.
+        #    (성능 게이트 리포트에서 '클래스명.메서드명'으로 원인 메서드를 표시)
+        super().__init_subclass__(**kwargs)
+        instrumentation.trace_class_methods(cls, SpanCategory.PAGE)
+
+    def __init__(self, driver, platform, wait_for_screen=False):
         self.driver = driver
         # -> platform 값이 없을 경우를 대비하여 기본값을 설정합니다.
         self.platform = platform.lower() if platform else 'android'
-        # -> 기본 대기 시간을 10초로 늘려 안정성을 높입니다.
-        self.wait = WebDriverWait(self.driver, 10)
+        # -> wait_for_screen=True면 고정 sleep 없이 이 페이지의 화면이 활성화될 때까지만 기다립니다.
+        if wait_for_screen and self.SCREEN_NAME:
+            locator_manager.set_platform(self.platform)
+            self.wait_for_screen()
+
+    def wait_for_screen(self, screen_name=None, timeout=None):
+        """
+        화면 신호(단계 표시, 타이틀, Activity, URL)를 폴링하여 지정한 화면이 활성화될 때까지 기다립니다.
+        다른 화면으로 잘못 이동한 것이 확인되면 즉시 NavigationError가 발생합니다.
+        :param screen_name: 화면 이름 (None이면 이 페이지의 SCREEN_NAME)
+        :param timeout: 최대 대기 시간 (None이면 config.json 'Navigation.timeout')
+        """
+        screen_name = screen_name or self.SCREEN_NAME
+        with wait_budget.waiting(f"화면 대기: {screen_name}", timeout or navigation_tracker.timeout) as allowed:
+            return navigation_tracker.wait_for_screen(self.driver, screen_name, allowed)
 
     def _get_locator_tuples(self, locator):
         """
@@ -48,18 +82,58 @@ class BasePage:
         if not locators:
             raise ValueError(f"지원되지 않거나 유효하지 않은 로케이터 형식입니다: {locator}")
 
-        return locators
+        # -> 로케이터 키별 성공 기록이 있으면, 과거에 가장 빨리 성공한 전략부터 시도하도록 순서를 바꿉니다.
+        return locator_stats.order(locator, self.platform, locators)
+
+    def _is_probe_locator(self, locator, probe=None):
+        """
+        조회가 Probe(선택 요소 확인)인지 판단합니다.
+        probe 인자가 명시되면 그 값을 따르고, 없으면 페이지 클래스의 PROBE_LOCATORS 선언을 따릅니다.
+        """
+        if probe is not None:
+            return probe
+        return getattr(locator, 'key', None) in self.PROBE_LOCATORS
+
+    def _element_timeout(self, locator, timeout, default):
+        """
+        요소별 대기 시간을 반환합니다.
+        호출부가 timeout을 명시하면(짧은 Probe 확인 등) 그 값을 그대로 사용합니다.
+        명시하지 않으면 기록된 등장 지연 시간이 충분할 때 p99 + 여유 시간(config.json 'TimeoutPolicy'), 아니면 default를 사용합니다.
+        """
+        if timeout is not None:
+            return timeout
+        return timeout_policy.timeout_for(locator, self.platform, default)
+
+    def _wait_until(self, condition, timeout, label):
+        """
+        WebDriverWait 대기 1회를 시나리오 대기 예산(utils/wait_budget.py) 안에서 실행합니다.
+        대기 시간은 남은 예산 이내로 줄어들고, 예산 소진 후 실패하면 WaitBudgetExceeded가 발생합니다.
+        """
+        with wait_budget.waiting(label, timeout) as allowed:
+            return WebDriverWait(self.driver, allowed).until(condition)
+
+    def capture_failure_evidence(self, name, probe=False):
+        """
+        실패 증거(스크린샷)를 증거 수집 정책(config.json 'Evidence')에 따라 수집합니다.
+        Probe 조회의 실패는 정상 분기이므로 증거를 남기지 않습니다.
+        """
+        if probe:
+            return
+        evidence_collector.capture(self, name)
 
-    def find_element_with_fallback(self, locator, timeout=5):
+    def find_element_with_fallback(self, locator, timeout=None, probe=None):
         """
         여러 로케이터 전략을 순차적으로 시도하여 요소를 찾는 함수.
         반드시 있어야 하는 요소를 찾고 없으면 에러를 발생시키는 함수.
-        timeout(5초)까지 찾고 없으면 스킵
+        전략마다 timeout(5초)까지 찾고 없으면 스킵 (timeout을 지정하지 않았고 등장 지연 기록이 있으면 학습된 대기 시간 사용)
 
         :param locator: 로케이터 딕셔너리
-        :param timeout: 대기 시간 (기본값 5초)
+        :param timeout: 대기 시간 (None이면 학습된 대기 시간, 기록이 부족하면 5초)
+        :param probe: True면 선택 요소 확인용 조회로 보고 실패 스크린샷을 남기지 않음
+                      (None이면 PROBE_LOCATORS 선언을 따름)
         :return: 찾은 WebElement 객체
         """
+        is_probe = self._is_probe_locator(locator, probe)
         last_exception = None
         try:
             # _get_locator_tuples 함수로 로케이터 튜플 목록을 가져옵니다.
@@ -68,22 +142,31 @@ class BasePage:
             logger.error(f"유효하지 않은 로케이터: {locator}. 요소를 찾을 수 없습니다.")
             raise e
 
+        timeout = self._element_timeout(locator, timeout, 5)
+        label = getattr(locator, 'key', None) or "요소 찾기"
         # 각 로케이터 튜플을 순서대로 시도합니다.
         # by : ID, XPATH 등 선택
         # value : 로케이터 값
         for by, value in locator_tuples:
+            started = time.monotonic()
             try:
                 # 요소의 존재(presence) 여부를 확인합니다.
-                element = self.wait.until(EC.presence_of_element_located((by, value)))
+                element = self._wait_until(EC.presence_of_element_located((by, value)), timeout, label)
+                locator_stats.record(locator, self.platform, by, True, time.monotonic() - started)
+                timeout_policy.record(locator, self.platform, time.monotonic() - started)
                 logger.info(f"✅ '{by}:{value}' 전략으로 요소를 발견했습니다.")
                 return element
             except (TimeoutException, NoSuchElementException) as e:
+                locator_stats.record(locator, self.platform, by, False, time.monotonic() - started)
                 logger.warning(f"'{by}:{value}' 전략으로 요소 찾기 실패. 다음 전략으로 재시도합니다.")
                 last_exception = e
 
         # 모든 시도가 실패하면 예외를 발생시킵니다.
-        logger.error(f"모든 로케이터 전략으로 요소를 찾을 수 없습니다: {locator}")
-        self.take_screenshot("find_element_failure")
+        if is_probe:
+            logger.info(f"ℹ️ 선택 요소(Probe)가 화면에 없습니다: {locator}")
+        else:
+            logger.error(f"모든 로케이터 전략으로 요소를 찾을 수 없습니다: {locator}")
+        self.capture_failure_evidence("find_element_failure", probe=is_probe)
         raise TimeoutException(f"요소를 찾을 수 없습니다. (로케이터: {locator})", screen=getattr(last_exception, 'screen', None),
                                stacktrace=getattr(last_exception, 'stacktrace', None))
 
@@ -104,7 +187,9 @@ class BasePage:
             
             # 2. 뽑아온 전략으로 find_elements(복수형) 실행
             for by, value in locator_tuples:
+                started = time.monotonic()
                 elements = self.driver.find_elements(by, value)
+                locator_stats.record(locator, self.platform, by, bool(elements), time.monotonic() - started)
                 
                 # 하나라도 찾았으면 그 리스트 반환
                 if elements:
@@ -117,10 +202,12 @@ class BasePage:
             # 로그는 선택 사항
             return []
 
-    def wait_and_click(self, locator, element_name, timeout=10):
+    def wait_and_click(self, locator, element_name, timeout=None, probe=None):
         """
         -> id, xpath 등 여러 전략으로 요소를 찾아 클릭하는 함수로 개선합니다.
+        :param probe: True면 선택 요소 클릭 시도로 보고 실패 스크린샷을 남기지 않음
         """
+        is_probe = self._is_probe_locator(locator, probe)
         last_exception = None
         try:
             # -> locator가 유효한지 먼저 확인합니다.
@@ -130,17 +217,21 @@ class BasePage:
             # -> 에러를 다시 발생시켜 테스트가 실패하도록 합니다.
             raise e
 
+        timeout = self._element_timeout(locator, timeout, 10)
         for by, value in locator_tuples:
+            started = time.monotonic()
             try:
-                wait = WebDriverWait(self.driver, timeout)
                 # -> EC.element_to_be_clickable을 사용하여 클릭 가능한 상태까지 기다립니다.
-                element = wait.until(EC.element_to_be_clickable((by, value)))
+                element = self._wait_until(EC.element_to_be_clickable((by, value)), timeout, element_name)
+                locator_stats.record(locator, self.platform, by, True, time.monotonic() - started)
+                timeout_policy.record(locator, self.platform, time.monotonic() - started)
                 # 클릭 시도
                 element.click()
                 # 클릭이 성공적으로 실행되었을 때만 로그 출력
                 logger.info(f"✅ '{element_name}' 요소를 클릭했습니다. (전략: {by})")
                 return
             except (TimeoutException, NoSuchElementException) as e:
+                locator_stats.record(locator, self.platform, by, False, time.monotonic() - started)
                 logger.warning(f"'{by}:{value}' 전략으로 '{element_name}' 클릭 실패. 재시도합니다.")
                 last_exception = e
             except Exception as e:
@@ -148,12 +239,15 @@ class BasePage:
                 logger.error(f"❌ '{element_name}' 클릭 중 예외 발생: {e}")
                 last_exception = e
 
-        logger.error(f"모든 전략으로 '{element_name}' 요소를 클릭하지 못했습니다: {locator}")
-        self.take_screenshot(f"{element_name.replace(' ', '_')}_click_failure")
+        if is_probe:
+            logger.info(f"ℹ️ 선택 요소(Probe) '{element_name}'이(가) 화면에 없어 클릭하지 않았습니다.")
+        else:
+            logger.error(f"모든 전략으로 '{element_name}' 요소를 클릭하지 못했습니다: {locator}")
+        self.capture_failure_evidence(f"{element_name.replace(' ', '_')}_click_failure", probe=is_probe)
         raise TimeoutException(f"'{element_name}' 요소를 찾거나 클릭할 수 없습니다.", screen=getattr(last_exception, 'screen', None),
                                stacktrace=getattr(last_exception, 'stacktrace', None))
 
-    def wait_and_send_keys(self, locator, text, element_name, timeout=10):
+    def wait_and_send_keys(self, locator, text, element_name, timeout=None):
         """
         -> id, xpath 등 여러 전략으로 요소를 찾아 텍스트를 입력하는 함수로 개선합니다.
         """
@@ -164,11 +258,14 @@ class BasePage:
             logger.error(f"'{element_name}'에 대한 로케이터 값이 유효하지 않습니다.")
             raise e
 
+        timeout = self._element_timeout(locator, timeout, 10)
         for by, value in locator_tuples:
+            started = time.monotonic()
             try:
-                wait = WebDriverWait(self.driver, timeout)
                 # -> EC.visibility_of_element_located를 사용하여 요소가 보일 때까지 기다립니다.
-                element = wait.until(EC.visibility_of_element_located((by, value)))
+                element = self._wait_until(EC.visibility_of_element_located((by, value)), timeout, element_name)
+                locator_stats.record(locator, self.platform, by, True, time.monotonic() - started)
+                timeout_policy.record(locator, self.platform, time.monotonic() - started)
                 # [중요] 일부 입력창(특히 WebView 내 EditText)은 클릭(포커스) 후에만 입력이 정상 동작합니다.
                 try:
                     element.click()
@@ -179,11 +276,13 @@ class BasePage:
                 logger.info(f"'{element_name}' 요소에 텍스트 '{text}'를 입력했습니다. (전략: {by})")
                 return
             except (TimeoutException, NoSuchElementException) as e:
+                locator_stats.record(locator, self.platform, by, False, time.monotonic() - started)
                 logger.warning(f"'{by}:{value}' 전략으로 '{element_name}'에 텍스트 입력 실패. 재시도합니다.")
                 last_exception = e
 
         logger.error(f"모든 전략으로 '{element_name}' 요소에 텍스트를 입력하지 못했습니다: {locator}")
-        self.take_screenshot(f"{element_name.replace(' ', '_')}_input_failure")
+        self.capture_failure_evidence(f"{element_name.replace(' ', '_')}_input_failure",
+                                      probe=self._is_probe_locator(locator))
         raise TimeoutException(f"'{element_name}' 요소를 찾거나 입력할 수 없습니다.", screen=getattr(last_exception, 'screen', None),
                                stacktrace=getattr(last_exception, 'stacktrace', None))
 
@@ -196,11 +295,20 @@ class BasePage:
             os.makedirs(screenshot_dir, exist_ok=True)
             # -> 파일 이름에 시간값을 추가하여 중복을 방지합니다.
             file_path = os.path.join(screenshot_dir, f"{name}_{time.time()}.png")
-            self.driver.save_screenshot(file_path)
+            with instrumentation.span(name, SpanCategory.SCREENSHOT):
+                self.driver.save_screenshot(file_path)
             logger.info(f"스크린샷 저장 완료: {file_path}")
         except WebDriverException as e:
             logger.error(f"스크린샷 저장 실패: {e}")
 
+    def soft_check(self, condition, message):
+        """
+        흐름을 멈추지 않는 검증입니다. 조건이 거짓이면 실패를 기록하고 계속 진행하며, 시나리오가 끝날 때 모아서 실패 처리합니다.
+        (utils/soft_assert.py, 증거는 단계마다 첫 실패 때 한 번만 수집)
+        :return: 조건 결과
+        """
+        return soft_assertions.check(self, condition, message)
+
     def swipe_up(self, start_y_ratio=0.7, end_y_ratio=0.2, duration=800):
         """
         [추가] 화면을 아래에서 위로 스와이프하는 범용 함수입니다.
@@ -239,27 +347,41 @@ class BasePage:
             logger.error(f"❌ 스와이프 실패: {e}", exc_info=True)
             raise
 
-    def select_random_option(self, locator_info, element_name):
+    def choose_option(self, dimension, options, key=None):
+        """
+        시나리오 컨텍스트(매트릭스 케이스)에 따라 옵션 하나를 선택합니다.
+        케이스가 값을 지정하지 않은 차원은 케이스 시드 기반으로 선택하므로 같은 케이스는 항상 같은 선택을 합니다.
+        :param dimension: 차원 이름 (data/scenario_matrix.json의 키)
+        :param options: 선택 후보 목록
+        :param key: 후보를 차원 값(문자열)으로 바꾸는 함수
+        """
+        return scenario_context.choose(dimension, options, key)
+
+    def select_random_option(self, locator_info, element_name, dimension):
         """
         요소를 찾아 무작위로 하나를 선택하고 클릭하는 함수입니다.
         :param locator_info: 로케이터 정보 (딕셔너리 형태)
         :param element_name: 요소의 이름 (로그 출력용)
+        :param dimension: 선택 차원 이름 (data/scenario_matrix.json의 키, 매트릭스에 없으면 케이스 시드 기반으로 선택)
         """
         logger.info(f"'{element_name}' 목록에서 랜덤 선택 시도.")
         try:
             locator_tuples = self._get_locator_tuples(locator_info)
             # EC.presence_of_all_elements_located를 사용하여 요소 목록이 나타날 때까지 대기
-            elements = self.wait.until(EC.presence_of_all_elements_located(locator_tuples[0]))
+            started = time.monotonic()
+            elements = self._wait_until(EC.presence_of_all_elements_located(locator_tuples[0]),
+                                        self._element_timeout(locator_info, None, 10), element_name)
+            timeout_policy.record(locator_info, self.platform, time.monotonic() - started)
 
             if not elements:
                 # 목록을 찾았으나 비어있는 경우, 찾지 못한 것으로 간주
                 raise NoSuchElementException(f"'{element_name}' 목록을 찾았으나 요소가 비어있습니다.")
 
-            random_element = random.choice(elements)
-
             # [FIX: StaleElementReferenceException] 클릭 전에 텍스트를 미리 저장
             # 클릭 후 DOM이 변경되면 요소가 "Stale"해지므로 텍스트를 미리 가져옵니다.
-            selected_text = random_element.text
+            options = [(element, element.text) for element in elements]
+            random_element, selected_text = self.choose_option(
+                dimension, options, key=lambda option: option[1])
 
             random_element.click()
 
@@ -269,42 +391,71 @@ class BasePage:
 
         except (TimeoutException, NoSuchElementException) as e:
             # 요소를 찾지 못하면 바로 예외 발생 (재시도하지 않음)
-            logger.error(f"❌ {element_name} 선택 실패: {e}", exc_info=True)
-            self.take_screenshot(f"{element_name.replace(' ', '_')}_selection_failure")
+            if self._is_probe_locator(locator_info):
+                logger.info(f"ℹ️ 선택 요소(Probe) '{element_name}' 목록이 화면에 없습니다.")
+            else:
+                logger.error(f"❌ {element_name} 선택 실패: {e}", exc_info=True)
+            self.capture_failure_evidence(f"{element_name.replace(' ', '_')}_selection_failure",
+                                          probe=self._is_probe_locator(locator_info))
             raise
 
-    def check_element_exists(self, locator, timeout=3):
+    def check_element_exists(self, locator, timeout=None):
         """
         특정 요소가 화면에 존재하는지 확인(fallback함수와 달리 에러를 발생시키지 않음)
         분기 처리에 요소가 있는지 확인
         :param locator: 로케이터 딕셔너리
-        :param timeout: 확인 대기 시간 (초)
+        :param timeout: 확인 대기 시간 (초, None이면 학습된 대기 시간, 기록이 부족하면 3초)
         :return: True(존재함) / False(없음)
         """
         try:
             locator_tuples = self._get_locator_tuples(locator)
             # 짧은 시간만 대기하도록 설정
-            wait = WebDriverWait(self.driver, timeout)
+            timeout = self._element_timeout(locator, timeout, 3)
+            label = getattr(locator, 'key', None) or "요소 존재 확인"
             
             for by, value in locator_tuples:
+                started = time.monotonic()
                 try:
                     # 요소가 존재하는지 확인
-                    wait.until(EC.presence_of_element_located((by, value)))
+                    self._wait_until(EC.presence_of_element_located((by, value)), timeout, label)
+                    locator_stats.record(locator, self.platform, by, True, time.monotonic() - started)
+                    timeout_policy.record(locator, self.platform, time.monotonic() - started)
                     return True
                 except TimeoutException:
+                    locator_stats.record(locator, self.platform, by, False, time.monotonic() - started)
                     continue
             return False
         except Exception:
             return False
 
+    def ui_fingerprint(self):
+        """
+        현재 화면 지문을 반환합니다. 화면을 바꾸는 동작 직전에 구해 wait_for_ui_idle(baseline=...)에 넘깁니다.
+        """
+        return ui_idle_monitor.fingerprint(self.driver)
+
+    def wait_for_ui_idle(self, transition, timeout=None, baseline=None):
+        """
+        화면 전환 직후 고정 sleep 대신, 화면 지문이 안정될 때까지만 기다립니다.
+        전환별 안정화 시간은 세션 종료 시 리포트됩니다.
+        :param transition: 전환 이름 (예: '할인 정보 입력')
+        :param timeout: 최대 대기 시간 (None이면 config.json 'UiIdle.timeout')
+        :param baseline: 동작 직전 화면 지문(ui_fingerprint()). 주면 화면이 바뀐 뒤부터 안정 여부를 판단합니다.
+        :return: 안정화까지 걸린 시간(초) / 시간 초과 시 None
+        """
+        transition = f"{type(self).__name__}.{transition}"
+        with wait_budget.waiting(f"UI 안정화: {transition}", timeout or ui_idle_monitor.timeout) as allowed:
+            return ui_idle_monitor.wait_until_idle(self.driver, transition, allowed, baseline)
+
+    # -> 고정 sleep도 시나리오 대기 예산에서 차감합니다.
     def short_sleep(self):
-        time.sleep(1)
+        wait_budget.sleep(1, "short_sleep")
 
     def medium_sleep(self):
-        time.sleep(3)
+        wait_budget.sleep(3, "medium_sleep")
 
     def long_sleep(self):
-        time.sleep(5)
+        wait_budget.sleep(5, "long_sleep")
 
     def hide_keyboard(self):
         try:
@@ -313,3 +464,7 @@ class BasePage:
         except WebDriverException:
             # -> 키보드가 없어도 오류가 발생하지 않도록 pass 처리합니다.
             pass
+
+
+# -> BasePage 공통 메서드(요소 탐색/클릭/입력/스와이프/sleep 등)는 primitive 구간으로 측정합니다.
+instrumentation.trace_class_methods(BasePage, SpanCategory.PRIMITIVE)
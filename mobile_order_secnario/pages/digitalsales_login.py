@@ -5,11 +5,20 @@ from pages.base_page import BasePage
 from utils.config_manager import ConfigManager
 # -> 싱글턴 locator_manager 인스턴스를 직접 임포트합니다.
 from utils.locator_manager import locator_manager
+from utils.login_cache import login_cache
 from utils.logger import logger
 
 class DigitalSalesLoginPage(BasePage):
-    def __init__(self, driver, platform):
-        super().__init__(driver, platform)
+    SCREEN_NAME = "login"
+    # -> 앱 상태에 따라 노출되지 않을 수 있는 팝업 버튼들 (실패 스크린샷 미수집)
+    PROBE_LOCATORS = frozenset({
+        "access_button",
+        "location_permission_button",
+        "main_popup_done_button",
+    })
+
+    def __init__(self, driver, platform, wait_for_screen=False):
+        super().__init__(driver, platform, wait_for_screen)
         # -> 플랫폼을 설정하고 필요한 로케이터를 가져옵니다.
         locator_manager.set_platform(platform)
         self.locators = locator_manager.get_locators("digitalsales_locators")
@@ -55,8 +64,21 @@ class DigitalSalesLoginPage(BasePage):
                 logger.info("메인팝업 미노출")
 
             logger.info("디지털세일즈 앱 로그인 성공.")
+            login_cache.record(username_to_use)
         except Exception as e:
             # -> 실패 시 로그를 남기고 스크린샷을 찍은 후 예외를 다시 발생시켜 테스트를 중단합니다.
             logger.error(f"디지털세일즈 앱 로그인 실패: {e}", exc_info=True)
+            login_cache.invalidate(reason="로그인 실패")
             self.take_screenshot("login_failure")
             raise
+
+    def ensure_logged_in(self, username=None, password=None):
+        """
+        이전 세션의 로그인 상태를 재사용할 수 있으면 로그인을 건너뛰고, 아니면 로그인합니다. (utils/login_cache.py)
+        :return: 로그인을 실행했으면 True, 재사용했으면 False
+        """
+        username_to_use = username if username else self.test_data["UserData"]["VALID_INDIVIDUAL_ID"]
+        if login_cache.is_valid(self.driver, username_to_use):
+            return False
+        self.login(username, password)
+        return True
@@ -1,20 +1,36 @@
 from pages.base_page import BasePage
 from utils.locator_manager import locator_manager
 from utils.logger import logger
-import random
+from utils.retry_policy import retryable
+from utils.verification import VerificationLevel, check_level
 import re
 
 class DiscountSelectionPage(BasePage):
     """
     모바일 주문의 '할인 선택(Step3)' 페이지를 나타내는 클래스입니다.
     """
-
-    def __init__(self, driver, platform):
-        super().__init__(driver, platform)
+    SCREEN_NAME = "step3_discount"
+    # -> 할인 대상 여부에 따라 노출되지 않을 수 있는 요소들 (실패 스크린샷 미수집)
+    PROBE_LOCATORS = frozenset({
+        "regular_payment_discount",
+        "pre_pass_discount",
+        "rental_fee_agreement_discount",
+        "prepayment_discount_trigger",
+        "prepayment_warning_msg",
+        "prepayment_option_none",
+        "prepayment_option_1y",
+        "prepayment_option_2y",
+        "prepayment_option_3y",
+        "prepayment2_discount_trigger",
+    })
+
+    def __init__(self, driver, platform, wait_for_screen=False):
+        super().__init__(driver, platform, wait_for_screen)
         locator_manager.set_platform(platform)
         self.locators = locator_manager.get_locators("discount_select")
 
     # ⬇️ [추가] 페이지 진입 후 주요 요소(Step, Title, 고객명) 검증 함수
+    @retryable()
     def verify_page_components(self, expected_customer_name, expected_total_count):
         """
         할인 선택 페이지의 주요 요소를 검증합니다.
@@ -65,8 +81,8 @@ class DiscountSelectionPage(BasePage):
 
 
         except Exception as e:
+            # -> 실패 증거는 재시도가 모두 끝난 뒤 @retryable이 한 번만 수집합니다.
             logger.error(f"❌ 할인 선택 페이지 검증 실패: {e}")
-            self.take_screenshot("discount_page_verification_failure")
             raise
 
             
@@ -184,6 +200,7 @@ class DiscountSelectionPage(BasePage):
             # 비활성화 확인 실패는 치명적이지 않을 수 있으므로 pass 혹은 raise 결정
             pass
 
+    @check_level(VerificationLevel.AUDIT)
     def get_regular_payment_discount(self):
         """
         정기결제할인이 존재하면 금액을 추출하여 반환합니다.
@@ -230,6 +247,7 @@ class DiscountSelectionPage(BasePage):
             logger.error(f"❌ 텍스트 분석 중 오류: {e}")
             return None
 
+    @check_level(VerificationLevel.AUDIT)
     def get_prepass_discount(self): #TODO : 탭해서 팝업 랜덤선택 구현 필요
         """
         Pre-Pass 할인이 존재하면 금액을 추출하여 반환합니다.
@@ -280,6 +298,7 @@ class DiscountSelectionPage(BasePage):
             logger.error(f"❌ 텍스트 분석 중 오류: {e}")
             return None
 
+    @check_level(VerificationLevel.AUDIT)
     def get_rental_fee_agreement_discount(self):
         """
         렌탈료약정할인 프로그램이 존재하면 금액을 추출하여 반환합니다.
@@ -399,7 +418,7 @@ class DiscountSelectionPage(BasePage):
                     try:
                         # timeout을 짧게 주어 빠르게 검사
                         opt = self.find_element_with_fallback(self.locators.get(key), timeout=1)
-                        available_options.append(opt)
+                        available_options.append((key.replace("prepayment_option_", ""), opt))
                     except:
                         continue # 없으면 패스
 
@@ -407,8 +426,9 @@ class DiscountSelectionPage(BasePage):
                     logger.warning("⚠️ 선택 가능한 옵션이 없습니다.")
                     return
 
-                # 랜덤 선택
-                selected_element = random.choice(available_options)
+                # 랜덤 선택 (시나리오 케이스의 'prepayment_option' 값: none/1y/2y/3y)
+                _, selected_element = self.choose_option("prepayment_option", available_options,
+                                                         key=lambda option: option[0])
                 selected_text = selected_element.text
                 
                 logger.info(f"🎲 랜덤 선택된 옵션: '{selected_text}'")
@@ -536,7 +556,8 @@ class DiscountSelectionPage(BasePage):
             options_list = unique_options_list
 
             # 5. 랜덤 선택
-            selected_element = random.choice(options_list)
+            selected_element = self.choose_option("prepayment2_option", options_list,
+                                                  key=lambda element: element.text.strip())
             selected_text = selected_element.text.strip()
             logger.info(f"🎲 랜덤 선택한 옵션: '{selected_text}'")
 
@@ -601,6 +622,7 @@ class DiscountSelectionPage(BasePage):
         except Exception as e:
             logger.error(f"❌ [선납할인2] 로직 수행 중 오류 발생: {e}")
      
+    @check_level(VerificationLevel.STANDARD)
     def verify_price_calculation_logic(self):
         """
         [최적화] 금액 계산 및 상품 합계 검증 로직
@@ -677,22 +699,19 @@ class DiscountSelectionPage(BasePage):
             logger.info(f"📊 검증식 [월]  : {prod_y} + ({disc_y}) = {calc_y} (화면값: {total_y})")
 
             # [수납 금액 검증]
-            if calc_x != total_x:
-                logger.error(f"❌ 수납 금액 불일치! 계산: {calc_x}, 화면: {total_x}")
-            else:
+            if self.soft_check(calc_x == total_x, f"수납 금액 불일치! 계산: {calc_x}, 화면: {total_x}"):
                 logger.info(f"✅ [Pass] 수납 금액 일치: {total_x}원")
             
             # [월 금액 검증]
-            if calc_y != total_y:
-                logger.error(f"❌ 월 금액 불일치! 계산: {calc_y}, 화면: {total_y}")
-            else:
+            if self.soft_check(calc_y == total_y, f"월 금액 불일치! 계산: {calc_y}, 화면: {total_y}"):
                 logger.info(f"✅ [Pass] 월 금액 일치: {total_y}원")
 
             logger.info("🏁 금액 계산 검증 로직 종료")
 
         except Exception as e:
             logger.error(f"❌ 금액 검증 중 치명적 오류: {e}", exc_info=True)
-            self.take_screenshot("price_verification_fatal_error")
+            # -> 증거(화면 계층 + 스크린샷)는 소프트 검증이 단계당 한 번만 수집합니다.
+            self.soft_check(False, f"금액 검증 중 오류: {e}")
             return
 
     def click_next_button(self):
@@ -730,8 +749,8 @@ class DiscountSelectionPage(BasePage):
             return
 
         try:
-            # 1. 다음 버튼 클릭 후 step4이동 확인
-            self.find_element_with_fallback(self.locators.get("payment_info_select"))
+            # 1. 다음 버튼 클릭 후 step4이동 확인 (단계 표시/타이틀 신호 폴링)
+            self.wait_for_screen("step4_payment")
             logger.info("step4이동 완료")
             logger.info("✅ [Step3] 테스트가 완료되었습니다.")
         except Exception as e:
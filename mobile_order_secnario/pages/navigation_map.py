@@ -0,0 +1,86 @@
+# pages/navigation_map.py
+# -*- coding: utf-8 -*-
+from pages.digitalsales_login import DigitalSalesLoginPage
+from pages.discount_selection_page import DiscountSelectionPage
+from pages.Order_docbar import MobileOrderPage
+from pages.order_status_completed import OrderStatusCompletedPage
+from pages.product_selection_page import ProductSelectionPage
+from pages.step4_payment_info import Step4PaymentInfoPage
+from utils.navigation import navigation_tracker
+
+# -> 화면 전환 함수들은 모두 (driver, platform, state) 인자를 받습니다.
+#    state는 체크포인트에 저장된 시나리오 상태(고객, 제품, 선택값 등)입니다.
+
+
+def _login(driver, platform, state):
+    DigitalSalesLoginPage(driver, platform).login(state.get("user_id"), state.get("user_password"))
+
+
+def _open_mobile_order(driver, platform, state):
+    MobileOrderPage(driver, platform).access_mobile_order_via_docbar()
+
+
+def _open_order_status(driver, platform, state):
+    MobileOrderPage(driver, platform).start_general_count()
+
+
+def _continue_order(driver, platform, state):
+    page = OrderStatusCompletedPage(driver, platform)
+    page.send_input_customer(customer_name=state["customer_name"])
+    page.click_auth_completed_for_customer(customer_name=state["customer_name"])
+    page.click_order_continue()
+
+
+def _enter_discount(driver, platform, state):
+    # -> 진행 중인 주문에는 이미 담은 상품이 유지되므로 '할인정보 입력하기'만 누릅니다.
+    ProductSelectionPage(driver, platform).enter_discount_information()
+
+
+def _back_to_product(driver, platform, state):
+    page = DiscountSelectionPage(driver, platform)
+    page.wait_and_click(page.locators.get("previous_button"), "이전 버튼")
+
+
+def _enter_payment(driver, platform, state):
+    DiscountSelectionPage(driver, platform).click_next_button()
+
+
+def _back_to_discount(driver, platform, state):
+    page = Step4PaymentInfoPage(driver, platform)
+    page.wait_and_click(page.locators.get("prev_button"), "이전 버튼")
+
+
+def _back_to_main(driver, platform, state):
+    driver.back()
+
+
+def _return_to_order_home(driver, platform, state):
+    # -> 주문 화면 어디에서든 뒤로 가기로 모바일 주문 홈까지 돌아갑니다. (앱 메인까지 나가면 독바로 다시 진입)
+    MobileOrderPage(driver, platform).return_to_order_home()
+
+
+# -> {(출발 화면, 도착 화면): 전환 함수}
+#    역방향 전환은 단계 재시도(ScenarioRunner._prepare_retry)가 앞으로 진행한 화면에서 단계 시작 화면으로 돌아갈 때 사용합니다.
+SCREEN_TRANSITIONS = {
+    ("login", "main"): _login,
+    ("main", "mobile_order_home"): _open_mobile_order,
+    ("mobile_order_home", "order_status"): _open_order_status,
+    ("order_status", "step2_product"): _continue_order,
+    ("step2_product", "step3_discount"): _enter_discount,
+    ("step3_discount", "step2_product"): _back_to_product,
+    ("step3_discount", "step4_payment"): _enter_payment,
+    ("step4_payment", "step3_discount"): _back_to_discount,
+    # -> 역방향 전환
+    ("mobile_order_home", "main"): _back_to_main,
+    ("order_status", "mobile_order_home"): _return_to_order_home,
+    ("step2_product", "mobile_order_home"): _return_to_order_home,
+    ("step3_discount", "mobile_order_home"): _return_to_order_home,
+    ("step4_payment", "mobile_order_home"): _return_to_order_home,
+}
+
+
+def navigate_to(driver, platform, target_screen, state):
+    """
+    현재 화면에서 target_screen까지 알려진 최단 경로로 이동합니다.
+    """
+    navigation_tracker.navigate_to(driver, target_screen, SCREEN_TRANSITIONS, driver, platform, state)
@@ -12,10 +12,11 @@ class OrderStatusCompletedPage(BasePage):
     주문 현황에서 '인증완료' 단계의 주문을 관리하는 페이지 객체입니다.
     이 클래스는 '인증완료' 버튼을 클릭하고 고객 정보를 확인하는 기능을 제공합니다.
     """
+    SCREEN_NAME = "order_status"
     # -> [변경] __init__ 함수에서 self.locators를 초기화하여,
     #    다른 메서드들이 로케이터를 사용할 수 있도록 합니다.
-    def __init__(self, driver, platform):
-        super().__init__(driver, platform)
+    def __init__(self, driver, platform, wait_for_screen=False):
+        super().__init__(driver, platform, wait_for_screen)
         locator_manager.set_platform(platform)
         self.locators = locator_manager.get_locators("Order_Status")
 
@@ -66,11 +67,12 @@ class OrderStatusCompletedPage(BasePage):
         """
         logger.info("주문 이어서 하기 버튼 클릭 시도.")
         try:
+            baseline = self.ui_fingerprint()
             self.wait_and_click(
                 locator=self.locators.get("order_continue"),
                 element_name="'주문 이어서 하기' 버튼"
             )
-            self.medium_sleep()
+            self.wait_for_ui_idle("click_order_continue", baseline=baseline)
             logger.info("✅ '주문 이어서 하기' 버튼 클릭 완료.")
         except (TimeoutException, NoSuchElementException) as e:
             logger.error(f"❌ '주문 이어서 하기' 버튼을 찾거나 클릭하지 못했습니다.", exc_info=True)
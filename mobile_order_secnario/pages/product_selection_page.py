@@ -10,9 +10,19 @@ class ProductSelectionPage(BasePage):
     """
     상품 검색, 판매 구분, 관리 유형, 의무 사용 기간을 선택하는 페이지 객체입니다.
     """
-
-    def __init__(self, driver, platform):
-        super().__init__(driver, platform)
+    SCREEN_NAME = "step2_product"
+    # -> 제품에 따라 노출되지 않을 수 있는 선택 항목들 (실패 스크린샷 미수집)
+    PROBE_LOCATORS = frozenset({
+        "management_type_buttons",
+        "mandatory_period_buttons",
+        "separate_product_buttons",
+        "separate_product_details",
+        "additional_server_buttons",
+        "additional_server_details",
+    })
+
+    def __init__(self, driver, platform, wait_for_screen=False):
+        super().__init__(driver, platform, wait_for_screen)
         # -> 플랫폼 설정 및 'product_select' 로케이터 그룹 로드
         locator_manager.set_platform(platform)
         self.locators = locator_manager.get_locators("product_select")
@@ -67,7 +77,7 @@ class ProductSelectionPage(BasePage):
         """
         logger.info("판매구분 하위 속성 중 랜덤 선택 시도.")
         self.short_sleep()
-        self.selected_sale_type = self.select_random_option(self.locators.get("sale_type_buttons"), "'판매 구분' 버튼")
+        self.selected_sale_type = self.select_random_option(self.locators.get("sale_type_buttons"), "'판매 구분' 버튼", dimension="sale_type")
 
     def select_management_type_randomly(self):
         """
@@ -77,7 +87,7 @@ class ProductSelectionPage(BasePage):
             logger.info("관리 유형 하위 속성 중 랜덤 선택 시도.")
             self.swipe_up()
             self.short_sleep()
-            self.selected_management_type = self.select_random_option(self.locators.get("management_type_buttons"), "'관리 유형' 버튼")
+            self.selected_management_type = self.select_random_option(self.locators.get("management_type_buttons"), "'관리 유형' 버튼", dimension="management_type")
         except (TimeoutException, NoSuchElementException):
             # 💡 예외를 잡아서 실패 대신 스킵으로 처리
             logger.info("ℹ️ '관리 유형'이 노출되지 않아 스킵합니다.")
@@ -92,7 +102,7 @@ class ProductSelectionPage(BasePage):
             logger.info("의무사용 기간 하위 속성 중 랜덤 선택 시도.")
             self.swipe_up()
             self.short_sleep()
-            self.selected_mandatory_period = self.select_random_option(self.locators.get("mandatory_period_buttons"), "'의무 사용 기간' 버튼")
+            self.selected_mandatory_period = self.select_random_option(self.locators.get("mandatory_period_buttons"), "'의무 사용 기간' 버튼", dimension="mandatory_period")
         except (TimeoutException, NoSuchElementException):
             # 💡 예외를 잡아서 실패 대신 스킵으로 처리
             logger.info("ℹ️ '의무사용 기간'이 노출되지 않아 스킵합니다.")
@@ -111,7 +121,7 @@ class ProductSelectionPage(BasePage):
             logger.info("✅ '별매상품' 버튼 클릭 완료.")
             self.swipe_up()
             self.short_sleep()
-            self.selected_separate_product = self.select_random_option(self.locators.get("separate_product_details"), "'별매상품 랜덤 선택")
+            self.selected_separate_product = self.select_random_option(self.locators.get("separate_product_details"), "'별매상품 랜덤 선택", dimension="separate_product")
         except (TimeoutException, NoSuchElementException):
             logger.info("ℹ️ '별매상품'이 노출되지 않아 스킵합니다.")
             self.selected_separate_product = "SKIP (미노출)"
@@ -128,7 +138,7 @@ class ProductSelectionPage(BasePage):
             self.wait_and_click(self.locators.get("additional_server_buttons"), "부가서비스 클릭")
             logger.info("✅ '부가서비스' 버튼 클릭 완료.")
             self.short_sleep()
-            self.selected_additional_server = self.select_random_option(self.locators.get("additional_server_details"), "부가서비스 랜덤 선택")
+            self.selected_additional_server = self.select_random_option(self.locators.get("additional_server_details"), "부가서비스 랜덤 선택", dimension="additional_service")
         except (TimeoutException, NoSuchElementException):
             logger.info("ℹ️ '부가서비스'가 노출되지 않아 스킵합니다.")
             self.selected_additional_server = "SKIP (미노출)"
@@ -140,9 +150,10 @@ class ProductSelectionPage(BasePage):
         """
         logger.info("'상품담기' 버튼 클릭 시도.")
         try:
+            baseline = self.ui_fingerprint()
             self.wait_and_click(self.locators.get("containing_goods"), "상품담기 버튼")
             logger.info("✅ '상품담기' 버튼 클릭 완료.")
-            self.medium_sleep()
+            self.wait_for_ui_idle("containing_goods", baseline=baseline)
         except Exception as e:
             logger.error(f"❌ '상품담기' 버튼 클릭 실패: {e}", exc_info=True)
             self.take_screenshot("add_product_to_cart_failure")
@@ -154,9 +165,10 @@ class ProductSelectionPage(BasePage):
         """
         logger.info("'상품 추가하기' 버튼 클릭 시도.")
         try:
+            baseline = self.ui_fingerprint()
             self.wait_and_click(self.locators.get("adding_goods"), "상품추가 하기 버튼")
             logger.info("✅ '상품 추가하기' 버튼 클릭 완료.")
-            self.long_sleep()
+            self.wait_for_ui_idle("adding_goods", baseline=baseline)
         except Exception as e:
             logger.error(f"❌ '상품 추가하기' 버튼 클릭 실패: {e}", exc_info=True)
             self.take_screenshot("add_product_to_cart_failure")
@@ -168,9 +180,10 @@ class ProductSelectionPage(BasePage):
         """
         logger.info("'할인 정보 입력' 버튼 클릭 시도.")
         try:
+            baseline = self.ui_fingerprint()
             self.wait_and_click(self.locators.get("enter_discount_information"), "할인 정보 입력 버튼")
             logger.info("✅ '할인 정보 입력' 버튼 클릭 완료.")
-            self.long_sleep()
+            self.wait_for_ui_idle("enter_discount_information", baseline=baseline)
         except Exception as e:
             logger.error(f"❌ '할인 정보 입력' 버튼 클릭 실패: {e}", exc_info=True)
             self.take_screenshot("add_product_to_cart_failure")
@@ -1,24 +1,27 @@
 # -*- coding: utf-8 -*-
-import random
 import re
 import time
 from pages.base_page import BasePage
 from utils.locator_manager import locator_manager
 from utils.logger import logger
+from utils.retry_policy import retryable
+from utils.verification import VerificationLevel, check_level, verification_settings
 
 class Step4PaymentInfoPage(BasePage):
     """
     Step 4: 결제정보 선택 화면을 담당하는 페이지입니다.
     정기결제/수납결제 금액을 확인하고 결제 수단을 선택 버튼을 제어합니다.
     """
+    SCREEN_NAME = "step4_payment"
 
-    def __init__(self, driver, platform):
-        super().__init__(driver, platform)
+    def __init__(self, driver, platform, wait_for_screen=False):
+        super().__init__(driver, platform, wait_for_screen)
         
          # -> 플랫폼 설정 및 'payment_info_select' 로케이터 그룹 로드
         locator_manager.set_platform(platform)
         self.locators = locator_manager.get_locators("payment_info_select")
 
+    @retryable()
     def verify_page_compoenets(self, expected_customer_name):
         """
         결제정보입력 페이지의 주요 요소를 검증합니다.
@@ -51,6 +54,10 @@ class Step4PaymentInfoPage(BasePage):
                 raise Exception(f"고객명 불일치: '{expected_customer_name}'가 '{customer_text}'에 없음")
         logger.info(f"✅ 고객명 정보 확인 완료: {customer_text}")
 
+        # -> 여기까지(단계 표시, 고객명)가 화면 이동 확인이며, 아래 문구 확인은 감사(audit) 수준 검증입니다.
+        if not verification_settings.allows(VerificationLevel.AUDIT, "Step4PaymentInfoPage 문구 확인"):
+            return
+
         # 검증할 9가지 항목으로 딕셔너리 재구성 (JSON 파일의 key와 1:1 매칭)
         validation_items = {
             'page_title': "결제정보 선택",
@@ -70,14 +77,15 @@ class Step4PaymentInfoPage(BasePage):
                 actual_text = element.text
                 
                 # 3. 문구 비교 및 검증
-                if expected_text in actual_text:
+                if self.soft_check(expected_text in actual_text,
+                                   f"기대값('{expected_text}')이 실제 텍스트('{actual_text}')에 포함되어 있지 않습니다."):
                     logger.info(f"✅ 검증 성공: '{expected_text}' 문구가 화면에 정상적으로 표시되었습니다.")
-                else:
-                    logger.error(f"❌ 검증 실패: 기대값('{expected_text}')이 실제 텍스트('{actual_text}')에 포함되어 있지 않습니다.")
             except Exception as e:
-                logger.error(f"❌ 요소를 찾을 수 없습니다: {key} (기대문구: {expected_text}) - {e}")
+                self.soft_check(False, f"요소를 찾을 수 없습니다: {key} (기대문구: {expected_text}) - {e}")
 
 
+    @check_level(VerificationLevel.AUDIT)
+    @retryable()
     def check_payment_amounts(self):
         """
         1. 화면에 표시된 정기결제 금액과 수납 금액을 가져와 로그로 출력.
@@ -176,7 +184,7 @@ class Step4PaymentInfoPage(BasePage):
             logger.error("❌ '카드이체'가 기본 선택되어 있지 않습니다.")
 
         # 5. 카드이체, 은행이체 중 랜덤 선택
-        selected_method = random.choice(['card', 'bank'])
+        selected_method = self.choose_option("payment_method", ['card', 'bank'])
         logger.info(f"🎲 랜덤 선택된 결제 방식: {'카드이체' if selected_method == 'card' else '은행이체'}")
 
         if selected_method == 'card':
@@ -208,7 +216,7 @@ class Step4PaymentInfoPage(BasePage):
             self.hide_keyboard()
     
             # 2~5번 동작 수행
-            self._fill_common_info_and_submit(customer_name, payment_method='card')
+            self._fill_common_info_and_submit(customer_name, payment_method='card', day_dimension='transfer_day')
             
             # 6. 추가 확인 로직
             self._verify_added_method_text('card', card_company, card_number)
@@ -263,7 +271,7 @@ class Step4PaymentInfoPage(BasePage):
             self.hide_keyboard()
 
             # 2~5번 동작 수행
-            self._fill_common_info_and_submit(customer_name, payment_method='bank')
+            self._fill_common_info_and_submit(customer_name, payment_method='bank', day_dimension='transfer_day')
             
             # 6. 추가 확인 로직
             self._verify_added_method_text('bank', bank_name, account_number)
@@ -319,7 +327,7 @@ class Step4PaymentInfoPage(BasePage):
             logger.error("❌ '카드이체'가 기본 선택되어 있지 않습니다.")
 
         # 5. 카드이체, 은행이체 중 랜덤 선택
-        selected_method = random.choice(['card', 'bank'])
+        selected_method = self.choose_option("lump_sum_payment_method", ['card', 'bank'])
         logger.info(f"🎲 랜덤 선택된 결제 방식: {'카드이체' if selected_method == 'card' else '은행이체'}")
 
         if selected_method == 'card':
@@ -351,7 +359,7 @@ class Step4PaymentInfoPage(BasePage):
             self.hide_keyboard()
             
             # 2~5번 동작 수행
-            self._fill_common_info_and_submit(customer_name, payment_method='card')
+            self._fill_common_info_and_submit(customer_name, payment_method='card', day_dimension='lump_sum_transfer_day')
             
             # 6. 추가 확인 로직
             self._verify_added_method_text('card', card_company, card_number)
@@ -380,7 +388,7 @@ class Step4PaymentInfoPage(BasePage):
             self.hide_keyboard()
 
             # 2~5번 동작 수행
-            self._fill_common_info_and_submit(customer_name, payment_method='bank')
+            self._fill_common_info_and_submit(customer_name, payment_method='bank', day_dimension='lump_sum_transfer_day')
             
             # 6. 추가 확인 로직
             self._verify_added_method_text('bank', bank_name, account_number)
@@ -395,8 +403,11 @@ class Step4PaymentInfoPage(BasePage):
         logger.info("🚀 [설치정보 화면으로 이동] 버튼을 클릭합니다.")
         self.wait_and_click(self.locators['next_step5'], "설치정보 화면으로 이동 버튼")
 
-    def _fill_common_info_and_submit(self, customer_name, payment_method='bank'):
-        """이체일, 명의 선택 및 스와이프 후 최종 추가 버튼을 누릅니다."""
+    def _fill_common_info_and_submit(self, customer_name, day_dimension, payment_method='bank'):
+        """
+        이체일, 명의 선택 및 스와이프 후 최종 추가 버튼을 누릅니다.
+        :param day_dimension: 이체일 선택 차원 이름 (정기결제: 'transfer_day', 수납결제: 'lump_sum_transfer_day')
+        """
         # 2-1 이체일 랜덤 선택 (결제 방식에 따라 옵션 다름)
         if payment_method == 'card':
             # 카드이체: 10일, 20일만 가능 (15일 없음)
@@ -405,7 +416,7 @@ class Step4PaymentInfoPage(BasePage):
             # 은행이체: 10일, 15일, 20일 모두 가능
             available_days = ['10일', '15일', '20일']
         
-        selected_day = random.choice(available_days)
+        selected_day = self.choose_option(day_dimension, available_days)
         transfer_day_template = self.locators.get('transfer_day_template')
         dynamic_day_locator = {}
         for key, value in transfer_day_template.items():
@@ -439,10 +450,9 @@ class Step4PaymentInfoPage(BasePage):
         # 3. 명의자 확인
         owner_elem = self.find_element_with_fallback(self.locators.get('owner_name_input'))
         actual_name = owner_elem.text
-        if actual_name == customer_name:
+        if self.soft_check(actual_name == customer_name,
+                           f"명의자 불일치: 기대값({customer_name}), 실제값({actual_name})"):
             logger.info(f"✅ 명의자 일치: {actual_name}")
-        else:
-            logger.error(f"❌ 명의자 불일치: 기대값({customer_name}), 실제값({actual_name})")
 
         # 4. 법정생년월일 확인
         birth_elem = self.find_element_with_fallback(self.locators.get('birth_date_input'))
@@ -460,6 +470,7 @@ class Step4PaymentInfoPage(BasePage):
         3. 숫자 부분 추출 (카드: 6자리, 은행: 4자리)
         4. 마스킹 검증 (*로 표시되는지 확인)
         5. test_data.json의 PaymentData와 일치 여부 확인
+        불일치는 소프트 검증(soft_check)으로 기록하고 흐름을 계속 진행합니다. (시나리오 끝에서 모아서 실패 처리)
         """
         
         logger.info("🔍 이미 등록된 결제수단 정보를 확인합니다.")
@@ -470,7 +481,7 @@ class Step4PaymentInfoPage(BasePage):
             existing_text = existing_method_elem.text.strip()
             logger.info(f"📋 화면에 표시된 결제수단: {existing_text}")
         except Exception as e:
-            logger.error(f"❌ 이미 등록된 결제수단을 찾을 수 없습니다: {e}")
+            self.soft_check(False, f"이미 등록된 결제수단을 찾을 수 없습니다: {e}")
             return
         
         # 카드이체 또는 은행이체 구분
@@ -485,17 +496,16 @@ class Step4PaymentInfoPage(BasePage):
             expected_number = payment_data.get('ACCOUNT_NUMBER')
             expected_digits = 4  # 은행은 4자리까지 노출
         else:
-            logger.error(f"❌ 결제수단 형식을 인식할 수 없습니다: {existing_text}")
-            raise Exception(f"결제수단 형식 오류: {existing_text}")
+            self.soft_check(False, f"결제수단 형식을 인식할 수 없습니다: {existing_text}")
+            return
         
         # 회사명 추출 (예: "카드이체 : 신한카드 449911********")
         # 패턴: "카드이체 : {회사명} {숫자}***" 또는 "은행이체 : {은행명} {숫자}***"
         pattern = rf"{'카드이체' if method_type == 'card' else '은행이체'}\s*:\s*([^\s]+)\s+(\d+)\*+"
         match = re.search(pattern, existing_text)
         
-        if not match:
-            logger.error(f"❌ 결제수단 텍스트를 파싱할 수 없습니다: {existing_text}")
-            raise Exception(f"파싱 오류: {existing_text}")
+        if not self.soft_check(match is not None, f"결제수단 텍스트를 파싱할 수 없습니다: {existing_text}"):
+            return
         
         extracted_company = match.group(1)
         extracted_number = match.group(2)
@@ -503,25 +513,19 @@ class Step4PaymentInfoPage(BasePage):
         logger.info(f"📝 추출된 정보 - 회사명: {extracted_company}, 숫자: {extracted_number}")
         
         # 회사명 일치 확인
-        if extracted_company != expected_company:
-            logger.error(f"❌ 회사명 불일치: 기대값({expected_company}), 실제값({extracted_company})")
-            raise Exception(f"회사명 불일치: 기대값({expected_company}), 실제값({extracted_company})")
-        else:
+        if self.soft_check(extracted_company == expected_company,
+                           f"회사명 불일치: 기대값({expected_company}), 실제값({extracted_company})"):
             logger.info(f"✅ 회사명 일치: {extracted_company}")
         
         # 숫자 자릿수 확인 (카드: 6자리, 은행: 4자리)
-        if len(extracted_number) != expected_digits:
-            logger.error(f"❌ 숫자 자릿수 불일치: 기대값({expected_digits}자리), 실제값({len(extracted_number)}자리)")
-            raise Exception(f"숫자 자릿수 불일치: 기대값({expected_digits}자리), 실제값({len(extracted_number)}자리)")
-        else:
+        if self.soft_check(len(extracted_number) == expected_digits,
+                           f"숫자 자릿수 불일치: 기대값({expected_digits}자리), 실제값({len(extracted_number)}자리)"):
             logger.info(f"✅ 숫자 자릿수 일치: {len(extracted_number)}자리")
         
         # 추출된 숫자가 test_data.json의 앞부분과 일치하는지 확인
         expected_prefix = expected_number[:expected_digits]
-        if extracted_number != expected_prefix:
-            logger.error(f"❌ 숫자 불일치: 기대값({expected_prefix}), 실제값({extracted_number})")
-            raise Exception(f"숫자 불일치: 기대값({expected_prefix}), 실제값({extracted_number})")
-        else:
+        if self.soft_check(extracted_number == expected_prefix,
+                           f"숫자 불일치: 기대값({expected_prefix}), 실제값({extracted_number})"):
             logger.info(f"✅ 숫자 일치: {extracted_number}")
         
         # 마스킹 검증 (*로 표시되는지 확인)
@@ -530,10 +534,8 @@ class Step4PaymentInfoPage(BasePage):
         remaining_text = existing_text[number_start_idx:].strip()
         
         # 숫자 다음에 *만 있는지 확인
-        if remaining_text and not all(c == '*' for c in remaining_text if c != ' '):
-            logger.error(f"❌ 마스킹 형식 오류: 숫자 다음이 모두 *가 아닙니다. ({remaining_text})")
-            raise Exception(f"마스킹 형식 오류: {remaining_text}")
-        else:
+        if self.soft_check(all(c == '*' for c in remaining_text if c != ' '),
+                           f"마스킹 형식 오류: 숫자 다음이 모두 *가 아닙니다. ({remaining_text})"):
             logger.info(f"✅ 마스킹 형식 확인: 숫자 다음이 *로 표시됨")
         
         # 전체 번호 길이 확인 (마스킹된 부분 포함)
@@ -548,6 +550,7 @@ class Step4PaymentInfoPage(BasePage):
         
         logger.info(f"✅ 이미 등록된 결제수단 검증 완료: {extracted_company} {extracted_number}***")
 
+    @check_level(VerificationLevel.STANDARD)
     def _verify_added_method_text(self, method_type, company, number):
         """카드는 6자리, 은행은 4자리 노출 후 마스킹 처리하여 검증합니다."""
         if method_type == 'card':
@@ -567,7 +570,5 @@ class Step4PaymentInfoPage(BasePage):
         # 6-1, 6-2 동일한 텍스트를 가진 요소가 나타나는지 대기하며 확인 (check_element_exists 활용)
         is_added = self.check_element_exists(dynamic_locator, timeout=10)
         
-        if is_added:
+        if self.soft_check(is_added, f"결제수단을 화면에서 찾을 수 없습니다: {expected_text}"):
             logger.info(f"✅ [검증 성공] 결제수단이 정상적으로 노출되었습니다: {expected_text}")
-        else:
-            logger.error(f"❌ [검증 실패] 결제수단을 화면에서 찾을 수 없습니다: {expected_text}")
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import pytest
+from pages.order_status_completed import OrderStatusCompletedPage
+from utils.cassette import (CassetteMismatch, deterministic_policies, load_cassette, replay_appium_driver,
+                            start_recording)
+from utils.evidence import evidence_collector
+from utils.fake_driver import fake_appium_driver
+from utils.locator_stats import locator_stats
+from utils.scenario_context import scenario_context
+from utils.timeout_policy import timeout_policy
+from utils.ui_idle import ui_idle_monitor
+from utils.wait_budget import wait_budget
+
+# -> tests/cassettes/order_status.json.gz는 가짜 드라이버(order_flow) 위에서 _order_status_flow를 기록한 카세트입니다.
+#    흐름을 바꾸면 _record_order_status_flow(cassette_path("order_status"), seed=20240501)로 다시 기록합니다.
+_COMMITTED_CASSETTE = "order_status"
+_COMMITTED_SEED = 20240501
+
+
+@pytest.fixture
+def isolated(monkeypatch, tmp_path):
+    """
+    고정 sleep/증거 수집을 없애고, 로케이터 통계/등장 지연/화면 안정화 기록을 임시 기록으로 바꿉니다.
+    학습 기반 조정은 켜 둔 상태에서 시작하여 기록/재생 중에만 꺼지는지 확인합니다.
+    """
+    monkeypatch.setattr(wait_budget, "sleep", lambda seconds, label="sleep": None)
+    monkeypatch.setattr(evidence_collector, "capture", lambda page, name: None)
+    monkeypatch.setattr(locator_stats, "stats", {})
+    monkeypatch.setattr(locator_stats, "_dirty", False)
+    monkeypatch.setattr(locator_stats, "file_path", str(tmp_path / "locator_stats.json"))
+    monkeypatch.setattr(locator_stats, "enabled", True)
+    monkeypatch.setattr(timeout_policy, "samples", {})
+    monkeypatch.setattr(timeout_policy, "_dirty", False)
+    monkeypatch.setattr(ui_idle_monitor, "settle_times", {})
+    monkeypatch.setattr(ui_idle_monitor, "report_dir", str(tmp_path / "ui_idle"))
+    monkeypatch.setattr(timeout_policy, "file_path", str(tmp_path / "appearance_latency.json"))
+    monkeypatch.setattr(timeout_policy, "enabled", True)
+    yield tmp_path
+    scenario_context.activate(None)
+
+
+def _order_status_flow(page):
+    """
+    주문 현황 화면에서 고객 검색 → 인증완료 클릭 → 결제 방법 선택 → 주문 이어서 하기를 실행합니다.
+    """
+    page.send_input_customer("홍길동")
+    page.click_auth_completed_for_customer("홍길동")
+    selected_method = page.choose_option("payment_method", ['card', 'bank'])
+    page.click_order_continue()
+    return selected_method
+
+
+def _record_order_status_flow(path, seed):
+    scenario_context.activate(None, seed=seed)
+    driver, platform = fake_appium_driver("order_flow", start_screen="order_status")
+    recorder = start_recording(driver, path)
+    with deterministic_policies():
+        selected_method = _order_status_flow(OrderStatusCompletedPage(driver, platform))
+    recorder.save()
+    return selected_method
+
+
+class TestCassetteReplay:
+    """
+    카세트 기록/재생이 기기 없이 같은 명령 순서와 시나리오 선택을 재현하는지 확인합니다.
+    """
+
+    def test_committed_cassette_replays_offline(self, isolated):
+        scenario_context.activate(None)
+        with deterministic_policies():
+            driver, platform = replay_appium_driver(_COMMITTED_CASSETTE)
+            _order_status_flow(OrderStatusCompletedPage(driver, platform))
+        driver.command_executor.assert_consumed()
+        assert scenario_context.seed == _COMMITTED_SEED
+        assert scenario_context.choices == load_cassette(_COMMITTED_CASSETTE)["scenario"]["choices"]
+
+    def test_replay_restores_recorded_seed_and_choices(self, isolated):
+        path = str(isolated / "order_status.json.gz")
+        recorded_method = _record_order_status_flow(path, seed=7)
+        # -> 매트릭스 없이 실행하면 시드를 새로 만들므로, 재생 드라이버가 기록된 시드/선택값을 복원해야 합니다.
+        scenario_context.activate(None)
+        with deterministic_policies():
+            driver, platform = replay_appium_driver(path)
+            replayed_method = _order_status_flow(OrderStatusCompletedPage(driver, platform))
+        driver.command_executor.assert_consumed()
+        assert scenario_context.seed == 7
+        assert replayed_method == recorded_method
+
+    def test_different_command_raises_mismatch(self, isolated):
+        with deterministic_policies():
+            driver, platform = replay_appium_driver(_COMMITTED_CASSETTE)
+            page = OrderStatusCompletedPage(driver, platform)
+            with pytest.raises(CassetteMismatch):
+                page.click_order_continue()
+
+    def test_adaptive_policies_are_disabled_only_while_recording(self, isolated):
+        with deterministic_policies():
+            assert not locator_stats.enabled and not timeout_policy.enabled
+        assert locator_stats.enabled and timeout_policy.enabled
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import pytest
+from utils.coverage import SelectionPolicy, coverage_store
+from utils.scenario_context import scenario_context
+from utils.scenario_matrix import ScenarioCase
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    """
+    커버리지 저장소를 빈 기록과 임시 폴더로 바꿉니다.
+    """
+    monkeypatch.setattr(coverage_store, "data", {"values": {}, "combinations": {}})
+    monkeypatch.setattr(coverage_store, "dimensions", ["payment_method", "transfer_day"])
+    monkeypatch.setattr(coverage_store, "coverage_dir", str(tmp_path))
+    monkeypatch.setattr(coverage_store, "file_path", str(tmp_path / "coverage.json"))
+    monkeypatch.setattr(coverage_store, "policy", SelectionPolicy.COVERAGE)
+    monkeypatch.setattr(coverage_store, "matrix_policy", SelectionPolicy.UNIFORM)
+    yield coverage_store
+    scenario_context.activate(None)
+
+
+class TestCoverageRanking:
+    """
+    덜 실행된 조합 우선 선택(rank)과 정책 적용 범위 단위 테스트입니다.
+    """
+
+    def test_rank_prefers_uncovered_combination(self, store):
+        store.record({"payment_method": "card", "transfer_day": "10일"}, seed=1)
+        store.record({"payment_method": "bank", "transfer_day": "10일"}, seed=2)
+        # -> card와 함께 실행된 적 없는 이체일만 후보로 남음
+        assert store.rank("transfer_day", ["10일", "15일", "20일"], {"payment_method": "card"}) == ["15일", "20일"]
+
+    def test_failed_runs_do_not_count_as_covered(self, store):
+        store.record({"payment_method": "card"}, seed=1, passed=False)
+        assert store.value_count("payment_method", "card") == 0
+
+    def test_matrix_cases_use_matrix_policy(self, store):
+        assert store.policy_for("card-10일") == SelectionPolicy.UNIFORM
+        assert store.policy_for(None) == SelectionPolicy.COVERAGE
+        store.set_policy(SelectionPolicy.COVERAGE)
+        assert store.policy_for("card-10일") == SelectionPolicy.COVERAGE
+
+    def test_matrix_case_choice_does_not_depend_on_coverage_file(self, store):
+        case = ScenarioCase({"payment_method": "*"})
+        picks = []
+        for seed in range(6):
+            scenario_context.activate(case)
+            picks.append(scenario_context.choose("payment_method", ["card", "bank"]))
+            store.record(scenario_context.choices, seed)
+        assert len(set(picks)) == 1
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import json
+import pytest
+from utils.data_stream import DataStream
+
+
+def _write_jsonl(path, records):
+    path.write_text("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records), encoding="utf-8")
+    return path
+
+
+def _stream(path, tmp_path, worker_index=0, worker_count=1, resume=True):
+    stream = DataStream(str(path), worker_index, worker_count, resume=resume, partition_key="customer_phone")
+    stream.progress_path = str(tmp_path / "progress" / f"{worker_index}.json")
+    return stream
+
+
+def _take(stream, count):
+    """
+    count건을 받은 뒤 읽기를 멈춥니다. (마지막으로 받은 레코드는 처리 중이던 레코드로 남음)
+    """
+    records = []
+    iterator = iter(stream)
+    for record in iterator:
+        records.append(record["record_id"])
+        if len(records) == count:
+            break
+    iterator.close()
+    return records
+
+
+@pytest.fixture
+def customers(tmp_path):
+    records = [{"record_id": f"c{index}", "customer_phone": f"0101234{index % 15:04d}"} for index in range(30)]
+    return _write_jsonl(tmp_path / "customers.jsonl", records)
+
+
+class TestPartitioning:
+    """
+    워커 분할 단위 테스트입니다.
+    """
+
+    def test_workers_are_disjoint_and_complete(self, customers, tmp_path):
+        parts = [[record["record_id"] for record in _stream(customers, tmp_path, index, 3)] for index in range(3)]
+        assert sorted(sum(parts, [])) == sorted(f"c{index}" for index in range(30))
+        assert sum(len(part) for part in parts) == 30
+
+    def test_same_customer_goes_to_same_worker(self, customers, tmp_path):
+        owners = {}
+        for index in range(3):
+            for record in _stream(customers, tmp_path, index, 3):
+                owners.setdefault(record["customer_phone"], set()).add(index)
+        assert all(len(workers) == 1 for workers in owners.values())
+
+    def test_records_without_key_are_split_by_line(self, tmp_path):
+        path = _write_jsonl(tmp_path / "products.jsonl", [{"product": f"p{index}"} for index in range(10)])
+        parts = [[record["record_id"] for record in _stream(path, tmp_path, index, 2)] for index in range(2)]
+        assert sorted(sum(parts, [])) == sorted(f"line-{index}" for index in range(1, 11))
+
+
+class TestResume:
+    """
+    다 쓴 레코드 위치(바이트 오프셋) 기록과 이어 읽기 단위 테스트입니다.
+    """
+
+    def test_resume_rereads_record_in_progress(self, customers, tmp_path):
+        assert _take(_stream(customers, tmp_path), 3) == ["c0", "c1", "c2"]
+        # -> c0, c1만 다 쓴 것으로 기록되고, 처리 중이던 c2부터 다시 읽음
+        resumed = _stream(customers, tmp_path)
+        assert _take(resumed, 2) == ["c2", "c3"]
+        assert resumed.consumed == 3
+
+    def test_resume_disabled_starts_over(self, customers, tmp_path):
+        _take(_stream(customers, tmp_path), 5)
+        assert _take(_stream(customers, tmp_path, resume=False), 1) == ["c0"]
+
+    def test_truncated_file_starts_over(self, customers, tmp_path):
+        _take(_stream(customers, tmp_path), 20)
+        _write_jsonl(customers, [{"record_id": "new0"}, {"record_id": "new1"}])
+        assert _take(_stream(customers, tmp_path), 1) == ["new0"]
+
+    def test_reset_clears_progress(self, customers, tmp_path):
+        stream = _stream(customers, tmp_path)
+        _take(stream, 5)
+        stream.reset()
+        assert _take(_stream(customers, tmp_path), 1) == ["c0"]
+
+    def test_csv_resume_skips_header(self, tmp_path):
+        path = tmp_path / "customers.csv"
+        path.write_text("customer_name,customer_phone,memo\n홍길동,01011112222,\n김철수,01033334444,VIP\n",
+                        encoding="utf-8")
+        # -> 처음 읽을 때와 이어 읽을 때 모두 헤더를 레코드로 읽지 않음
+        assert _take(_stream(path, tmp_path), 1) == ["line-2"]
+        assert _take(_stream(path, tmp_path), 1) == ["line-2"]
+        records = list(_stream(path, tmp_path, resume=False))
+        assert records[0] == {"customer_name": "홍길동", "customer_phone": "01011112222", "record_id": "line-2"}
+        assert records[1]["memo"] == "VIP"
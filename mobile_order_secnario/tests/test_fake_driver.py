@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import (InvalidSelectorException, NoSuchElementException,
+                                        StaleElementReferenceException, TimeoutException)
+from pages.order_status_completed import OrderStatusCompletedPage
+from utils.evidence import evidence_collector
+from utils.fake_driver import fake_appium_driver
+from utils.locator_manager import locator_manager
+from utils.locator_stats import locator_stats
+from utils.navigation import navigation_tracker
+from utils.timeout_policy import timeout_policy
+from utils.ui_idle import ui_idle_monitor
+from utils.wait_budget import wait_budget
+
+_SCREENS = ["login", "main", "mobile_order_home", "order_status", "step2_product", "step3_discount", "step4_payment"]
+
+
+@pytest.fixture
+def evidence(monkeypatch, tmp_path):
+    """
+    고정 sleep을 없애고, 로케이터 통계/등장 지연/화면 안정화 기록을 임시 기록으로 바꾸며, 증거 수집 요청을 목록에 모읍니다.
+    """
+    captured = []
+    monkeypatch.setattr(wait_budget, "sleep", lambda seconds, label="sleep": None)
+    monkeypatch.setattr(evidence_collector, "capture", lambda page, name: captured.append(name))
+    monkeypatch.setattr(locator_stats, "stats", {})
+    monkeypatch.setattr(locator_stats, "_dirty", False)
+    monkeypatch.setattr(locator_stats, "file_path", str(tmp_path / "locator_stats.json"))
+    monkeypatch.setattr(timeout_policy, "samples", {})
+    monkeypatch.setattr(timeout_policy, "_dirty", False)
+    monkeypatch.setattr(ui_idle_monitor, "settle_times", {})
+    monkeypatch.setattr(ui_idle_monitor, "report_dir", str(tmp_path / "ui_idle"))
+    monkeypatch.setattr(timeout_policy, "file_path", str(tmp_path / "appearance_latency.json"))
+    return captured
+
+
+def _order_status_page():
+    driver, platform = fake_appium_driver("order_flow", start_screen="order_status")
+    return OrderStatusCompletedPage(driver, platform), driver.command_executor
+
+
+class TestFixtureScreens:
+    """
+    order_flow 픽스처의 화면 계층이 screen_locators.json의 화면 정의와 일치하는지 확인합니다.
+    """
+
+    @pytest.mark.parametrize("screen", _SCREENS)
+    def test_fixture_screen_is_recognized(self, screen):
+        driver, platform = fake_appium_driver("order_flow", start_screen=screen)
+        locator_manager.set_platform(platform)
+        assert navigation_tracker.current_screen(driver) == screen
+
+
+class TestFakeDriverPage:
+    """
+    가짜 드라이버 위에서 페이지 객체의 조회/입력/클릭 전환/요소 없음 처리를 확인합니다.
+    """
+
+    def test_find_element_with_locator(self, evidence):
+        page, _ = _order_status_page()
+        element = page.find_element_with_fallback(page.locators.get("order_continue"))
+        assert element.text == "주문 이어서 하기"
+        assert element.is_displayed() and element.is_enabled()
+
+    def test_send_keys_sets_text(self, evidence):
+        page, connection = _order_status_page()
+        page.send_input_customer("홍길동")
+        assert page.find_element_with_fallback(page.locators.get("customer_search")).text == "홍길동"
+        assert ("send_keys", "order_status", "홍길동") in connection.actions
+
+    def test_dynamic_xpath_clicks_matching_row(self, evidence):
+        page, connection = _order_status_page()
+        page.click_auth_completed_for_customer("홍길동")
+        assert connection.actions[-1] == ("click", "order_status", "인증완료")
+
+    def test_click_transition_changes_screen(self, evidence):
+        page, connection = _order_status_page()
+        stale = page.find_element_with_fallback(page.locators.get("order_continue"))
+        page.click_order_continue()
+        assert connection.screen == "step2_product"
+        assert navigation_tracker.current_screen(page.driver) == "step2_product"
+        with pytest.raises(StaleElementReferenceException):
+            stale.click()
+
+    def test_back_follows_declared_transition(self, evidence):
+        driver, _ = fake_appium_driver("order_flow", start_screen="order_status")
+        driver.back()
+        assert driver.command_executor.screen == "mobile_order_home"
+
+    def test_missing_element(self, evidence):
+        page, _ = _order_status_page()
+        with pytest.raises(NoSuchElementException):
+            page.driver.find_element(AppiumBy.XPATH, "//android.widget.Button[@text='결제하기']")
+        with pytest.raises(TimeoutException):
+            page.find_element_with_fallback({"xpath": "//android.widget.Button[@text='결제하기']"}, timeout=0.2)
+        assert evidence == ["find_element_failure"]
+
+    def test_unsupported_xpath_is_invalid_selector(self, evidence):
+        page, _ = _order_status_page()
+        with pytest.raises(InvalidSelectorException):
+            page.driver.find_element(AppiumBy.XPATH, "(//android.widget.Button)[last()]")
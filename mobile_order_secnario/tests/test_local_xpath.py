@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import xml.etree.ElementTree as ET
+import pytest
+from utils import local_xpath
+from utils.config_manager import ConfigManager
+
+_SOURCE = """
+<hierarchy>
+  <android.view.View resource-id="root">
+    <android.view.View>
+      <android.widget.Button text="인증완료"/>
+      <android.view.View><android.widget.TextView text="홍길동"/></android.view.View>
+    </android.view.View>
+    <android.view.View>
+      <android.widget.Button text="인증완료"/>
+      <android.view.View><android.widget.TextView text="김철수"/></android.view.View>
+    </android.view.View>
+    <android.widget.TextView text="일반주문"/>
+    <android.widget.Button text="  2건 "/>
+    <android.widget.Button text="다음" enabled="false"/>
+  </android.view.View>
+</hierarchy>"""
+
+
+def _texts(expression, root=None):
+    root = root if root is not None else ET.fromstring(_SOURCE)
+    return [element.get("text") for element in local_xpath.select(root, expression)]
+
+
+def _project_xpaths():
+    """
+    locators/*.json에 선언된 모든 XPath를 모읍니다.
+    """
+    locators_dir = os.path.join(ConfigManager().project_root, 'locators')
+    found = []
+
+    def collect(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in ("xpath", "step_indicator") and isinstance(value, str) and value:
+                    found.append(value)
+                else:
+                    collect(value)
+    for name in sorted(os.listdir(locators_dir)):
+        if name.endswith(".json"):
+            with open(os.path.join(locators_dir, name), 'r', encoding='utf-8') as f:
+                collect(json.load(f))
+    return found
+
+
+class TestLocalXPath:
+    """
+    로컬 XPath 평가기의 문법 지원 범위와 오류 처리 단위 테스트입니다.
+    """
+
+    def test_attribute_predicate(self):
+        assert _texts("//android.widget.Button[@text='인증완료']") == ["인증완료", "인증완료"]
+
+    def test_positional_predicate_on_group(self):
+        assert _texts("(//android.widget.Button[@text='인증완료'])[2]/following-sibling::*//*") == ["김철수"]
+
+    def test_sibling_condition_with_and(self):
+        expression = ("//android.widget.Button[@text='인증완료' and following-sibling::android.view.View"
+                      "[./android.widget.TextView[@text='김철수']]]/..//android.widget.TextView")
+        assert _texts(expression) == ["김철수"]
+
+    def test_functions(self):
+        assert _texts("//android.widget.TextView[@text='일반주문']/following-sibling::android.widget.Button"
+                      "[contains(@text, '건')]") == ["  2건 "]
+        assert _texts("//*[normalize-space(@text)='2건']") == ["  2건 "]
+        assert _texts("//*[starts-with(@text, '김')]") == ["김철수"]
+        assert _texts("//android.widget.Button[not(@enabled='false')][@text='다음']") == []
+
+    def test_top_level_element_is_selectable(self):
+        root = ET.fromstring(_SOURCE)
+        assert local_xpath.select(root, "//hierarchy") == [root]
+
+    def test_relative_path_uses_context(self):
+        root = ET.fromstring(_SOURCE)
+        row = local_xpath.select(root, "//android.view.View[.//android.widget.TextView[@text='홍길동']]")[-1]
+        assert [element.get("text") for element in local_xpath.select(root, ".//android.widget.TextView",
+                                                                      context=row)] == ["홍길동"]
+
+    @pytest.mark.parametrize("expression", ["//a[last()]", "count(//a)", "//a/last()", "//a[position()=1]",
+                                            "//a/following::b", "//a[@text='x'"])
+    def test_unsupported_syntax_raises(self, expression):
+        with pytest.raises(local_xpath.XPathError):
+            local_xpath.compile_xpath(expression)
+
+    def test_non_element_result_raises(self):
+        with pytest.raises(local_xpath.XPathError):
+            local_xpath.select(ET.fromstring(_SOURCE), "string(//android.widget.Button)")
+
+    def test_project_locators_compile(self):
+        # -> {customer_name} 같은 자리표시자는 실제 값으로 바뀐 뒤 평가되므로 문자열 그대로 해석만 확인
+        for expression in _project_xpaths():
+            local_xpath.compile_xpath(expression)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from utils.locator_manager import LocatorSpec
+from utils.locator_stats import locator_stats
+
+_LOCATOR = LocatorSpec({"id": "btn", "xpath": "//android.widget.Button"}, key="next_button", group="test_group")
+_TUPLES = [(AppiumBy.ID, "btn"), (AppiumBy.XPATH, "//android.widget.Button")]
+
+
+@pytest.fixture
+def stats(monkeypatch, tmp_path):
+    """
+    로케이터 통계를 빈 기록과 임시 폴더로 바꿉니다.
+    """
+    monkeypatch.setattr(locator_stats, "stats", {})
+    monkeypatch.setattr(locator_stats, "_dirty", False)
+    monkeypatch.setattr(locator_stats, "stats_dir", str(tmp_path))
+    monkeypatch.setattr(locator_stats, "file_path", str(tmp_path / "locator_stats.json"))
+    monkeypatch.setattr(locator_stats, "enabled", True)
+    monkeypatch.setattr(locator_stats, "dead_after_failures", 5)
+    monkeypatch.setattr(locator_stats, "retry_demoted_every", 10)
+    return locator_stats
+
+
+def _lookup(stats, working):
+    """
+    BasePage처럼 정렬된 순서대로 전략을 시도하고, working 전략에서 찾으면 멈춥니다.
+    :return: 시도한 전략 순서
+    """
+    tried = []
+    for by, _ in stats.order(_LOCATOR, "android", _TUPLES):
+        tried.append(by)
+        stats.record(_LOCATOR, "android", by, by == working, 0.1)
+        if by == working:
+            break
+    return tried
+
+
+class TestLocatorStats:
+    """
+    전략 순서 학습과 삭제 후보(dead strategy) 리포트 단위 테스트입니다.
+    """
+
+    def test_successful_strategy_moves_first(self, stats):
+        assert _lookup(stats, AppiumBy.XPATH) == [AppiumBy.ID, AppiumBy.XPATH]
+        assert _lookup(stats, AppiumBy.XPATH) == [AppiumBy.XPATH]
+
+    def test_demoted_strategy_is_retried_and_reported_dead(self, stats):
+        for _ in range(50):
+            _lookup(stats, AppiumBy.XPATH)
+        entries = stats.stats["android:test_group.next_button"]
+        assert entries["id"]["failure"] == 5
+        assert entries["xpath"]["success"] == 50
+        dead = stats.dead_strategies()
+        assert [(item["strategy"], item["working_strategies"]) for item in dead] == [("id", ["xpath"])]
+
+    def test_dead_strategy_is_no_longer_retried(self, stats):
+        for _ in range(100):
+            _lookup(stats, AppiumBy.XPATH)
+        assert stats.stats["android:test_group.next_button"]["id"]["failure"] == 5
+
+    def test_recovered_strategy_is_promoted(self, stats):
+        for _ in range(10):
+            _lookup(stats, AppiumBy.XPATH)
+        # -> 재확인 차례에 id가 성공하면 평균 시간 순 정렬에 다시 포함됨
+        assert _lookup(stats, AppiumBy.ID) == [AppiumBy.ID]
+        assert stats.stats["android:test_group.next_button"]["id"]["success"] == 1
+
+    def test_report_writes_dead_strategies(self, stats):
+        for _ in range(50):
+            _lookup(stats, AppiumBy.XPATH)
+        assert stats.report() is not None
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import pytest
+from utils.locator_manager import locator_manager
+from utils.navigation import navigation_tracker
+
+_STEP3_HEADER = """
+    <android.view.View>
+      <android.widget.TextView text="3"/>
+      <android.widget.TextView text="할인 선택"/>
+    </android.view.View>"""
+
+
+class _Hierarchy:
+    """
+    page_source만 제공하는 화면 계층 드라이버입니다.
+    """
+
+    def __init__(self, body):
+        self.page_source = f"<hierarchy><android.widget.FrameLayout>{body}</android.widget.FrameLayout></hierarchy>"
+
+
+class TestStepIndicatorScope:
+    """
+    단계 표시(step_indicator)가 헤더 컨테이너 안의 텍스트로만 인정되는지 확인합니다.
+    """
+
+    @pytest.fixture(autouse=True)
+    def android(self):
+        locator_manager.set_platform("Android")
+
+    def test_step_indicator_in_header(self):
+        assert navigation_tracker.current_screen(_Hierarchy(_STEP3_HEADER)) == "step3_discount"
+
+    def test_same_text_outside_header_is_ignored(self):
+        # -> 수량/가격 등 다른 곳의 '3'은 단계 표시로 보지 않음
+        body = """
+            <android.view.View><android.widget.TextView text="할인 선택"/></android.view.View>
+            <android.view.View><android.widget.TextView text="3"/></android.view.View>"""
+        assert navigation_tracker.current_screen(_Hierarchy(body)) is None
+
+    def test_other_step_number_in_header_is_not_step3(self):
+        body = _STEP3_HEADER.replace('text="3"', 'text="4"')
+        assert navigation_tracker.current_screen(_Hierarchy(body)) is None
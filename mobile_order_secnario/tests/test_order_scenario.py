@@ -1,14 +1,24 @@
 # -*- coding: utf-8 -*-
+from contextlib import nullcontext
 import pytest
+from selenium.common.exceptions import WebDriverException
 
 # ➡️ 필요한 페이지 객체들을 모두 임포트
 from pages.Order_docbar import MobileOrderPage
 from pages.digitalsales_login import DigitalSalesLoginPage
 from pages.order_status_completed import OrderStatusCompletedPage
 from pages.Order_Status_page import OrderStatusPage
-from utils.appium_driver import init_appium_driver
+from pages.navigation_map import navigate_to
+from utils.app_perf import app_perf_sampler
+from utils.appium_driver import attach_appium_driver, init_appium_driver
+from utils.cassette import deterministic_policies, replay_appium_driver, start_recording
 from utils.config_manager import ConfigManager
+from utils.device_health import device_health
+from utils.fake_driver import fake_appium_driver
 from utils.logger import logger
+from utils.scenario_runner import ScenarioRunner
+from utils.session_daemon import load_session_info
+from utils.throughput import order_records, throughput_meter
 from pages.product_selection_page import ProductSelectionPage
 from pages.auth_page import AuthPage
 from pages.discount_selection_page import DiscountSelectionPage
@@ -20,161 +30,344 @@ class TestMobileOrderScenario:
     """
 
     @pytest.fixture(scope="function")
-    def driver_setup(self):
+    def driver_setup(self, request):
         """
         -> 테스트 함수마다 독립적인 Appium 드라이버를 생성하고 종료하는 fixture.
+        -> --attach-session 옵션이 있으면 기존 세션(세션 데몬)에 연결하고, 종료 시 세션을 유지합니다.
+        -> --replay-cassette 옵션이 있으면 기기 없이 카세트를 재생하고, --record-cassette 옵션이 있으면 명령을 기록합니다.
+           (기록/재생 중에는 학습 기반 로케이터 순서/대기 시간을 끄고, 시나리오 시드와 선택값을 카세트에 저장/복원)
+        -> --fake-driver 옵션이 있으면 기기 없이 화면 계층 픽스처 위에서 동작하는 가짜 드라이버를 사용합니다.
+        -> 새로 생성한 드라이버는 'reconnect'로 다시 연결할 수 있습니다. (세션이 끊어진 단계를 재시도할 때 사용)
         """
-        # -> Android 플랫폼으로 드라이버를 초기화합니다.
-        appium_driver, platform = init_appium_driver(platform_name='Android')
+        fake_driver = request.config.getoption("--fake-driver")
+        if fake_driver:
+            appium_driver, platform = fake_appium_driver(fake_driver)
+            yield {"driver": appium_driver, "platform": platform}
+            appium_driver.quit()
+            return
+
+        replay_cassette = request.config.getoption("--replay-cassette")
+        if replay_cassette:
+            # -> 시나리오 컨텍스트를 먼저 활성화해야 카세트의 시드/선택값으로 덮어쓸 수 있습니다.
+            request.getfixturevalue("scenario_case")
+            with deterministic_policies():
+                appium_driver, platform = replay_appium_driver(replay_cassette)
+                yield {"driver": appium_driver, "platform": platform}
+            # -> 기록된 명령을 모두 재생했는지 확인합니다. (테스트가 중간에 실패한 경우는 확인하지 않음)
+            call_report = getattr(request.node, "rep_call", None)
+            if call_report is not None and call_report.passed:
+                appium_driver.command_executor.assert_consumed()
+            return
+
+        attach_session = request.config.getoption("--attach-session")
+        if attach_session:
+            session_info = load_session_info() or {}
+            if attach_session == "daemon":
+                if not session_info:
+                    pytest.fail("실행 중인 세션 데몬이 없습니다. 'python -m utils.session_daemon start'로 먼저 실행하세요.")
+                session_id = session_info["session_id"]
+            else:
+                session_id = attach_session
+            appium_driver, platform = attach_appium_driver(
+                session_id,
+                platform_name=session_info.get("platform", "Android"),
+                server_url=session_info.get("server_url"),
+                capabilities=session_info.get("capabilities"),
+                device_config_key=session_info.get("device_key") or request.config.getoption("--device"))
+            yield {"driver": appium_driver, "platform": platform}
+            device_health.stop()
+            # -> 기존 세션은 데몬이 소유하므로 종료하지 않습니다.
+            logger.info("기존 Appium 세션 연결을 해제합니다. (세션 유지)")
+            return
+
+        # -> Android 플랫폼으로 드라이버를 초기화합니다. (--device 옵션이 있으면 해당 기기 설정 사용)
+        device_config_key = request.config.getoption("--device")
+        # -> 격리된 기기는 병렬 실행기의 기기별 프로세스(--data-worker 지정)에서만 건너뛰고, 그 외에는 실패 처리합니다.
+        skip_quarantined = request.config.getoption("--data-worker") is not None
+        appium_driver, platform = init_appium_driver(platform_name='Android', device_config_key=device_config_key,
+                                                     skip_quarantined=skip_quarantined)
+        record_cassette = request.config.getoption("--record-cassette")
+        if record_cassette:
+            # -> 저장 시점(드라이버 종료)까지 시나리오 컨텍스트가 유지되도록 먼저 활성화합니다.
+            request.getfixturevalue("scenario_case")
+        recorder = start_recording(appium_driver, record_cassette) if record_cassette else None
+        # -> 앱 성능 수집(--app-perf)은 별도 스레드에서 명령을 보내므로 카세트 기록 중에는 사용하지 않습니다.
+        if not recorder:
+            app_perf_sampler.start(appium_driver, platform)
+        session = {"driver": appium_driver, "platform": platform}
+
+        def reconnect():
+            try:
+                session["driver"].quit()
+            except WebDriverException:
+                pass
+            session["driver"], _ = init_appium_driver(platform_name='Android', device_config_key=device_config_key,
+                                                      skip_quarantined=skip_quarantined)
+            return session["driver"]
+
+        # -> 카세트 기록 중에는 명령 순서가 달라지지 않도록 재연결하지 않습니다.
+        if not recorder:
+            session["reconnect"] = reconnect
         # -> 테스트 함수에서 사용할 수 있도록 driver와 platform 정보를 딕셔너리 형태로 반환합니다.
-        yield {"driver": appium_driver, "platform": platform}
+        with deterministic_policies() if recorder else nullcontext():
+            yield session
+        app_perf_sampler.stop()
+        device_health.stop()
+        if recorder:
+            recorder.save()
         # -> 테스트 함수가 끝나면 드라이버를 종료합니다.
         logger.info("Appium 드라이버를 종료합니다.")
-        appium_driver.quit()
+        session["driver"].quit()
 
-    def test_full_order_scenario(self, driver_setup):
+    @staticmethod
+    def _initial_state(scenario_case=None, record=None):
         """
-        -> 로그인부터 고객 인증까지 전체 시나리오를 테스트합니다.
+        -> test_data.json에서 시나리오 초기 상태(체크포인트로 저장되는 값)를 구성합니다.
+        -> 테스트 데이터 스트림(--order-data)의 레코드가 있으면 고객/제품 정보를 레코드 값으로 덮어씁니다.
+        -> 매트릭스 케이스가 제품을 지정하면 해당 값으로 덮어씁니다.
+        """
+        test_data = ConfigManager().get_test_data()
+        user_data = test_data["UserData"]
+        customer_data = test_data["CustomerData"]
+        params = scenario_case.params if scenario_case else {}
+        record = record or {}
+        return {
+            "user_id": user_data["VALID_INDIVIDUAL_ID"],
+            "user_password": user_data["VALID_INDIVIDUAL_PASSWORD"],
+            "customer_type": record.get("customer_type", customer_data["VALID_CUSTORMER_TYPE"]),
+            "customer_name": record.get("customer_name", customer_data["VALID_CUSTORMER_NAME"]),
+            "customer_phone": record.get("customer_phone", customer_data["VALID_CUSTORMER_PHONE"]),
+            "product_name": params.get("product", record.get("product_name", test_data["ProductData"]["product_name"])),
+            "payment_data": test_data["PaymentData"],
+            # 제품 n개 선택할 때 변수로서 일단은 1로 하드코딩 TODO : 추후 step2에서 선택한 수만큼 추가 필요
+            "product_count": 1,
+        }
+
+    # --- 시나리오 단계 함수: (driver, platform, state) -> 상태에 병합할 dict ---
+    @staticmethod
+    def _step_login(driver, platform, state):
+        # 1. 로그인 단계 (이전 세션의 로그인 상태가 유효하면 재사용)
+        login_page = DigitalSalesLoginPage(driver, platform)
+        login_page.ensure_logged_in(state["user_id"], state["user_password"])
+
+    @staticmethod
+    def _step_order_status(driver, platform, state):
+        # 2. 모바일 주문 서비스 이동 단계
+        order_page = MobileOrderPage(driver, platform)
+        order_page.access_mobile_order_via_docbar()  # Docbar로 모바일 주문 진입
+        #order_page.start_general_order()             #일반 주문하기 진입
+        order_page.start_general_count()            #주문 이어하기 통해 주문 현황 진입
+        #
+        # 3. 고객 인증(고입확)
+        # auth_page = AuthPage(driver, platform)
+        # auth_page.perform_customer_authentication(
+        #     customer_type=state["customer_type"],
+        #     name=state["customer_name"],
+        #     phone_number=state["customer_phone"]
+        # )
+
+        # # 4. 주문현황 상태 확인(인증입력)
+        # order_status_page = OrderStatusPage(driver, platform)
+        # order_status_page.verify_auth_button_for_customer(
+        #     customer_name=state["customer_name"]
+        #)
+        #TODO:PASS앱 인증 함수 생성 필요
+
+    @staticmethod
+    def _step_new_order(driver, platform, state):
+        # 연속 주문: 이전 주문(또는 실패한) 화면에서 모바일 주문 홈으로 돌아가 새 일반 주문 시작 후 고객 인증
+        order_page = MobileOrderPage(driver, platform)
+        order_page.return_to_order_home()
+        order_page.start_general_order()
+        auth_page = AuthPage(driver, platform)
+        auth_page.perform_customer_authentication(
+            customer_type=state["customer_type"],
+            name=state["customer_name"],
+            phone_number=state["customer_phone"]
+        )
+        #TODO:PASS앱 인증 함수 생성 필요
+
+    @staticmethod
+    def _step_order_continue(driver, platform, state):
+        #6. 주문현황 상태 확인(인증완료)
+        order_status_completed_page = OrderStatusCompletedPage(driver, platform)
+        order_status_completed_page.send_input_customer(customer_name=state["customer_name"])
+        order_status_completed_page.click_auth_completed_for_customer(customer_name=state["customer_name"])
+        # 주문 이어서 하기 클릭
+        order_status_completed_page.click_order_continue()
+
+    @staticmethod
+    def _step_product(driver, platform, state):
+        # 7. 상품 선택(Step2) 페이지 시나리오
+        product_page = ProductSelectionPage(driver, platform)
+        product_page.search_product(state["product_name"]) # 제품 검색
+        product_page.select_first_product(state["product_name"]) #첫번째 제품 선택
+        #TODO : 현재는 랜덤으로 판매구분 선택하지만 나중엔 GCP연동해서 판매구분 받아오고 판매 구분에 따라 step3까지 분기 처리 필요
+        product_page.select_sale_type_randomly()            #하위 판매구분 하위 속성 중 랜덤 선택
+        product_page.select_management_type_randomly()      #관리 유형이 노출되면 랜덤 선택
+        product_page.select_mandatory_period_randomly()     # 의무 사용 기간이 노출되면 랜덤 선택
+        product_page.select_separate_product_randomly()     #별매 상품 랜덤 선택
+        product_page.additional_server_buttons_randomly()   #부가서비스 랜덤 선택
+        product_page.containing_goods()                     #상품 담기
+        #TODO : 다건 주문에 대한 고려 필요 GCP연동 시 시나리오 탭 읽어와서 다건 주문할지 단건 주문할지에 따라 분기 처리
+        #product_page.adding_goods() #상품 추가하기(다건 주문시 필요)
+        product_page.enter_discount_information()   #할인정보 입력 클릭(step3이동)
+        return {
+            "selected_sale_type": product_page.selected_sale_type,
+            "selected_management_type": product_page.selected_management_type,
+            "selected_mandatory_period": product_page.selected_mandatory_period,
+            "selected_separate_product": product_page.selected_separate_product,
+            "selected_additional_server": product_page.selected_additional_server,
+        }
+
+    @staticmethod
+    def _step_discount(driver, platform, state):
+        # 8. 할인 선택(Step3) 페이지 시나리오
+        discount_page = DiscountSelectionPage(driver, platform, wait_for_screen=True)
+        discount_page.verify_page_components(
+            expected_customer_name=state["customer_name"],
+            expected_total_count=state["product_count"])
+        discount_page.check_simultaneous_discount(product_count=state["product_count"])
+        discount_page.check_and_configure_combination_discount()
+        discount_page.get_regular_payment_discount()
+        discount_page.get_prepass_discount()
+        discount_page.get_rental_fee_agreement_discount()
+        discount_page.select_prepayment_discount_option()
+        #discount_page.check_and_select_prepayment2_discount()
+        #TODO: 선납할인, 선납할인2 중복적용 불가로 랜덤으로 둘 중하나 선택할 수 있도록 코드 변경 필요
+        discount_page.verify_price_calculation_logic()
+        #TODO : 제품을 2개이상 선택했을 때 할인선택 등 하는 것 작업 필요
+        discount_page.click_next_button()
+
+    @staticmethod
+    def _step_payment(driver, platform, state):
+        #9 결제정보 입력(step4) 페이지 시나리오
+        step4_page = Step4PaymentInfoPage(driver, platform, wait_for_screen=True)
+         # 2. 페이지 진입 확인 및 세부 텍스트 검증
+        step4_page.verify_page_compoenets(expected_customer_name=state["customer_name"])
+        # 3. 결제 금액 정보 확인(정기결제, 수납금액)
+        step4_page.check_payment_amounts()
+        # 4. 정기결제 수단 선택 및 추가
+        step4_page.regular_payment_method_selection(state["payment_data"], customer_name=state["customer_name"])
+        # 5. 수납결제 수단 선택 및 추가
+        step4_page.lump_sum_payment_method_selection(state["payment_data"], customer_name=state["customer_name"])
+        # 6. 다음 버튼 클릭
+        step4_page.click_next_button()
+
+        #10 설치정보 입력(step5) 페이지 시나리오
+
+    def _build_runner(self, driver, platform, scenario_case=None, reconnect=None, record=None):
+        """
+        -> 전체 주문 시나리오의 단계와 각 단계의 시작 화면을 정의합니다.
+        -> 매트릭스 케이스별로 체크포인트를 따로 저장합니다.
+        -> 다시 실행해도 주문 상태가 바뀌지 않는 단계(화면 진입)만 재시도 정책을 선언합니다.
+           (상품 담기/할인 적용/결제수단 추가는 중복 적용될 수 있어 재시도하지 않음)
+        -> 로그인 단계는 시작 화면/재시도를 선언하지 않습니다. 로그인 상태를 재사용하면 앱이 이미 메인 화면이고
+           로그인 화면으로 가는 전환이 없어, 재시도 전 화면 이동이 실패하며 원래 오류를 가리기 때문입니다.
+        """
+        scenario_name = "full_order_scenario"
+        if scenario_case:
+            scenario_name = f"{scenario_name}[{scenario_case.case_id}]"
+        runner = ScenarioRunner(scenario_name, driver, platform,
+                                state=self._initial_state(scenario_case, record), navigator=navigate_to,
+                                reconnect=reconnect)
+        runner.add_step("login", self._step_login)
+        runner.add_step("order_status", self._step_order_status, screen="main", retry="step")
+        runner.add_step("order_continue", self._step_order_continue, screen="order_status", retry="step")
+        runner.add_step("step2_product", self._step_product, screen="step2_product")
+        runner.add_step("step3_discount", self._step_discount, screen="step3_discount")
+        runner.add_step("step4_payment", self._step_payment, screen="step4_payment")
+        return runner
+
+    def test_full_order_scenario(self, driver_setup, request, scenario_case, data_stream):
+        """
+        -> 로그인부터 결제정보 입력(Step4)까지 전체 시나리오를 테스트합니다.
+        -> --start-at=<단계 이름> 옵션을 주면 체크포인트 상태로 해당 단계부터 시작합니다.
+        -> --matrix 옵션을 주면 data/scenario_matrix.json의 케이스별로 실행합니다.
+        -> --order-data 옵션을 주면 케이스마다 테스트 데이터 스트림에서 고객/제품 레코드를 한 건씩 사용합니다.
         """
         logger.info("🚀 모바일 주문 전체 시나리오 테스트를 시작합니다.")
+        record = next(data_stream, None) if data_stream is not None else None
+        if data_stream is not None and record is None:
+            pytest.skip("테스트 데이터 스트림의 레코드를 모두 사용했습니다.")
         try:
-            appium_driver = driver_setup["driver"]
-            platform = driver_setup["platform"]
-            config_manager = ConfigManager()
-            test_data = config_manager.get_test_data()
-            user_data = test_data["UserData"]
-            customer_data = test_data["CustomerData"]
-            product_data = test_data["ProductData"]
-            payment_data = test_data["PaymentData"]
-
-            # 1. 로그인 단계
-            login_page = DigitalSalesLoginPage(appium_driver, platform)
-            login_page.login(user_data["VALID_INDIVIDUAL_ID"], user_data["VALID_INDIVIDUAL_PASSWORD"])
-
-            # 2. 모바일 주문 서비스 이동 단계
-            order_page = MobileOrderPage(appium_driver, platform)
-            order_page.access_mobile_order_via_docbar()  # Docbar로 모바일 주문 진입
-            #order_page.start_general_order()             #일반 주문하기 진입
-            order_page.start_general_count()            #주문 이어하기 통해 주문 현황 진입
-            #
-            # 3. 고객 인증(고입확)
-            # auth_page = AuthPage(appium_driver, platform)
-            # auth_page.perform_customer_authentication(
-            #     customer_type=customer_data["VALID_CUSTORMER_TYPE"],
-            #     name=customer_data["VALID_CUSTORMER_NAME"],
-            #     phone_number=customer_data["VALID_CUSTORMER_PHONE"]
-            # )
-            
-            # # 4. 주문현황 상태 확인(인증입력)
-            # order_status_page = OrderStatusPage(appium_driver, platform)
-            # order_status_page.verify_auth_button_for_customer(
-            #     customer_name=customer_data["VALID_CUSTORMER_NAME"]
-            #)
-            #TODO:PASS앱 인증 함수 생성 필요
-
-            #6. 주문현황 상태 확인(인증완료)
-            order_status_completed_page = OrderStatusCompletedPage(appium_driver, platform)
-            order_status_completed_page.send_input_customer(
-                customer_name=customer_data["VALID_CUSTORMER_NAME"]
-            )
-            order_status_completed_page.click_auth_completed_for_customer(
-                customer_name=customer_data["VALID_CUSTORMER_NAME"]
-            )
-            # 주문 이어서 하기 클릭
-            order_status_completed_page.click_order_continue()
-
-            # 7. 상품 선택(Step2) 페이지 시나리오
-            product_page = ProductSelectionPage(appium_driver, platform)
-            product_page.search_product(product_data["product_name"]) # 제품 검색
-            product_page.select_first_product(product_data["product_name"]) #첫번째 제품 선택
-            #TODO : 현재는 랜덤으로 판매구분 선택하지만 나중엔 GCP연동해서 판매구분 받아오고 판매 구분에 따라 step3까지 분기 처리 필요
-            product_page.select_sale_type_randomly()            #하위 판매구분 하위 속성 중 랜덤 선택
-            product_page.select_management_type_randomly()      #관리 유형이 노출되면 랜덤 선택
-            product_page.select_mandatory_period_randomly()     # 의무 사용 기간이 노출되면 랜덤 선택
-            product_page.select_separate_product_randomly()     #별매 상품 랜덤 선택
-            product_page.additional_server_buttons_randomly()   #부가서비스 랜덤 선택
-            product_page.containing_goods()                     #상품 담기
-            #TODO : 다건 주문에 대한 고려 필요 GCP연동 시 시나리오 탭 읽어와서 다건 주문할지 단건 주문할지에 따라 분기 처리
-            #product_page.adding_goods() #상품 추가하기(다건 주문시 필요)
-            PRODUCT_COUNT = 1   # 제품 n개 선택할 때 변수로서 일단은 1로 하드코딩 TODO : 추후 step2에서 선택한 수만큼 추가 필요
-            product_page.enter_discount_information()   #할인정보 입력 클릭(step3이동)
-
-            # 8. 할인 선택(Step3) 페이지 시나리오
-            discount_page = DiscountSelectionPage(appium_driver, platform)
-            discount_page.verify_page_components(
-                expected_customer_name=customer_data["VALID_CUSTORMER_NAME"],
-                expected_total_count=PRODUCT_COUNT)
-            discount_page.check_simultaneous_discount(product_count=PRODUCT_COUNT)
-            discount_page.check_and_configure_combination_discount()
-            discount_page.get_regular_payment_discount()
-            discount_page.get_prepass_discount()
-            discount_page.get_rental_fee_agreement_discount()
-            discount_page.select_prepayment_discount_option()
-            #discount_page.check_and_select_prepayment2_discount()
-            #TODO: 선납할인, 선납할인2 중복적용 불가로 랜덤으로 둘 중하나 선택할 수 있도록 코드 변경 필요
-            discount_page.verify_price_calculation_logic()
-            #TODO : 제품을 2개이상 선택했을 때 할인선택 등 하는 것 작업 필요
-            discount_page.click_next_button()
-
-            #9 결제정보 입력(step4) 페이지 시나리오
-            step4_page = Step4PaymentInfoPage(appium_driver, platform)
-             # 2. 페이지 진입 확인 및 세부 텍스트 검증
-            step4_page.verify_page_compoenets(expected_customer_name=customer_data["VALID_CUSTORMER_NAME"])
-            # 3. 결제 금액 정보 확인(정기결제, 수납금액)
-            step4_page.check_payment_amounts()
-            # 4. 정기결제 수단 선택 및 추가
-            step4_page.regular_payment_method_selection(payment_data, customer_name=customer_data["VALID_CUSTORMER_NAME"])
-            # 5. 수납결제 수단 선택 및 추가
-            step4_page.lump_sum_payment_method_selection(payment_data, customer_name=customer_data["VALID_CUSTORMER_NAME"])
-            # 6. 다음 버튼 클릭
-            step4_page.click_next_button()
-            
-            #10 설치정보 입력(step5) 페이지 시나리오
-
+            runner = self._build_runner(driver_setup["driver"], driver_setup["platform"], scenario_case,
+                                        reconnect=driver_setup.get("reconnect"), record=record)
+            runner.run(start_at=request.config.getoption("--start-at"))
 
             logger.info("✅ 모바일 주문 전체 시나리오 테스트가 성공적으로 완료되었습니다.")
-        
+
         except Exception as e:
             # -> 테스트 실패 시 로그를 남기고 pytest를 통해 테스트를 실패 처리합니다.
             logger.error(f"❌ 모바일 주문 전체 시나리오 테스트 실패: {e}", exc_info=True)
             pytest.fail(str(e))
 
+    def _build_order_runner(self, driver, platform, state):
+        """
+        -> 연속 주문 모드에서 주문 1건을 만드는 단계를 정의합니다. (로그인은 반복 전에 1회만 수행)
+        """
+        runner = ScenarioRunner("order_loop", driver, platform, state=state, navigator=navigate_to)
+        runner.add_step("new_order", self._step_new_order)
+        runner.add_step("order_continue", self._step_order_continue, screen="order_status")
+        runner.add_step("step2_product", self._step_product, screen="step2_product")
+        runner.add_step("step3_discount", self._step_discount, screen="step3_discount")
+        runner.add_step("step4_payment", self._step_payment, screen="step4_payment")
+        return runner
+
+    @pytest.fixture(scope="function")
+    def order_loop(self, request):
+        """
+        -> --order-loop 옵션이 없으면 드라이버를 만들기 전에 연속 주문 테스트를 건너뜁니다.
+        """
+        iterations = request.config.getoption("--order-loop")
+        if iterations is None:
+            pytest.skip("--order-loop 옵션을 지정할 때만 실행합니다.")
+        return iterations
+
+    def test_order_throughput(self, order_loop, driver_setup, data_stream):
+        """
+        -> [연속 주문 모드] 한 세션에서 주문을 반복 생성하여 시간당 주문 수/반복 소요 시간/실패율을 측정합니다.
+        -> --order-loop=<주문 수> 옵션을 줄 때만 실행합니다. (--order-data로 주문 데이터 스트림 지정)
+        """
+        driver, platform = driver_setup["driver"], driver_setup["platform"]
+        state = self._initial_state()
+        DigitalSalesLoginPage(driver, platform).ensure_logged_in(state["user_id"], state["user_password"])
+
+        records = order_records(state, data_stream)
+        summary = throughput_meter.run(records, lambda record: self._build_order_runner(driver, platform, record),
+                                       iterations=order_loop)
+        if not summary["passed"]:
+            pytest.fail(f"연속 주문이 한 건도 성공하지 못했습니다. ({summary['iterations']}건 시도)")
+
     def test_step5_only_exec(self, driver_setup):
         """
         [디버깅용] Step 4 결제정보 선택 화면 테스트
-        - pytest -k test_step4_only_exec 명령어로 실행
+        - pytest -k test_step5_only_exec 명령어로 실행
+        - 현재 화면에서 체크포인트 상태로 Step 4 화면까지 최단 경로로 이동한 뒤 실행합니다.
         """
-        import time
         try:
             driver = driver_setup["driver"]
             platform = driver_setup["platform"]
 
-            config_manager = ConfigManager()
-            test_data = config_manager.get_test_data()
-            customer_data = test_data["CustomerData"]
-            payment_data = test_data["PaymentData"]
-
+            state = self._initial_state()
             logger.info("🚀 [Step 4] 결제정보 선택 화면 디버깅 시작")
-            
-            # 1. 페이지 객체 생성
-            step4_page = Step4PaymentInfoPage(driver, platform)
-            
-            # 2. 페이지 진입 확인 및 타이틀 검증
-            time.sleep(1)
-            driver.press_keycode(4)  # Android KEYCODE_BACK
-            time.sleep(2)
+
+            # 1. Step 4 화면으로 이동 후 페이지 객체 생성 (화면 진입까지 대기)
+            navigate_to(driver, platform, "step4_payment", state)
+            step4_page = Step4PaymentInfoPage(driver, platform, wait_for_screen=True)
+
             # step4_page.verify_page_compoenets(
-            #     expected_customer_name=customer_data["VALID_CUSTORMER_NAME"]
+            #     expected_customer_name=state["customer_name"]
             # )
-            
+
             # 3. 결제 금액 정보 로깅 (금액이 잘 뜨는지 확인)
             #step4_page.check_payment_amounts()
-            
-            step4_page.regular_payment_method_selection(payment_data, 
-            customer_name=customer_data["VALID_CUSTORMER_NAME"])
+
+            step4_page.regular_payment_method_selection(state["payment_data"],
+            customer_name=state["customer_name"])
 
             logger.info("✅ [Step 4] 디버깅 완료")
 
         except Exception as e:
             logger.error(f"❌ [Step 4] 테스트 실패: {e}", exc_info=True)
-            pytest.fail(str(e))
\ No newline at end of file
+            pytest.fail(str(e))
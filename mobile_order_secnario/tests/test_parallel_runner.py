@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+import pytest
+from utils.parallel_runner import build_commands, split_trace_export
+
+
+class TestTraceExportArgs:
+    """
+    병렬 실행기가 --trace-export 옵션을 값과 함께 분리하고 기기별 경로로 다시 전달하는지 확인합니다.
+    """
+
+    @pytest.mark.parametrize("args, expected", [
+        (["-k", "full", "--trace-export"], (["-k", "full"], True, None)),
+        (["--trace-export", "-k", "full"], (["-k", "full"], True, None)),
+        (["--trace-export", "reports/traces/my.json", "-x"], (["-x"], True, "reports/traces/my.json")),
+        (["--trace-export=reports/traces/my.json", "-x"], (["-x"], True, "reports/traces/my.json")),
+        (["--trace-export", "auto"], ([], True, None)),
+        (["-k", "full"], (["-k", "full"], False, None)),
+    ])
+    def test_split_trace_export(self, args, expected):
+        assert split_trace_export(args) == expected
+
+    def test_each_device_gets_its_own_trace_path(self):
+        pytest_args, _, _ = split_trace_export(["--trace-export=reports/traces/my.json", "-x"])
+        commands = build_commands({"Capabilities_Android": "a.json", "Capabilities_Android_2": "b.json"}, pytest_args,
+                                  {"Capabilities_Android": "a_trace.json", "Capabilities_Android_2": "b_trace.json"})
+        for device_key, trace_file in (("Capabilities_Android", "a_trace.json"),
+                                       ("Capabilities_Android_2", "b_trace.json")):
+            command = commands[device_key]
+            assert command.count("--trace-export") == 1 and command[-2:] == ["--trace-export", trace_file]
+            assert "reports/traces/my.json" not in command and "-x" in command
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import pytest
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.perf_gate import perf_gate
+
+_BASELINE = {
+    "tests/test_order.py::test_order": {
+        "step3_discount": {
+            "duration": 10.0, "commands": 100,
+            "methods": {"DiscountSelectionPage.verify_page_components": {"duration": 5.0, "commands": 50},
+                        "DiscountSelectionPage.click_next_button": {"duration": 4.0, "commands": 40}},
+        },
+    },
+}
+
+
+def _metrics(duration, commands, methods):
+    return {"step3_discount": {"duration": duration, "commands": commands, "methods": methods}}
+
+
+@pytest.fixture
+def gate(monkeypatch):
+    """
+    기준값과 허용 범위를 고정합니다. (실행 시간 +25% +2초, 명령 수 +10% +5회)
+    """
+    monkeypatch.setattr(perf_gate, "baseline", _BASELINE)
+    monkeypatch.setattr(perf_gate, "metrics", {})
+    monkeypatch.setattr(perf_gate, "duration_tolerance_percent", 25)
+    monkeypatch.setattr(perf_gate, "duration_tolerance_seconds", 2)
+    monkeypatch.setattr(perf_gate, "command_tolerance_percent", 10)
+    monkeypatch.setattr(perf_gate, "command_tolerance_count", 5)
+    return perf_gate
+
+
+class TestPerfGateCompare:
+    """
+    단계별 측정값과 기준값 비교 단위 테스트입니다.
+    """
+
+    def test_within_tolerance(self, gate):
+        metrics = _metrics(14.5, 115, {})
+        assert gate.compare("tests/test_order.py::test_order", metrics) == []
+
+    def test_duration_regression_names_responsible_method(self, gate):
+        metrics = _metrics(15.0, 90, {"DiscountSelectionPage.verify_page_components": {"duration": 5.5, "commands": 50},
+                                      "DiscountSelectionPage.click_next_button": {"duration": 8.0, "commands": 40}})
+        violations = gate.compare("tests/test_order.py::test_order", metrics)
+        assert len(violations) == 1
+        assert "허용 14.50s" in violations[0]
+        assert "DiscountSelectionPage.click_next_button (+4.00s)" in violations[0]
+
+    def test_command_regression(self, gate):
+        metrics = _metrics(10.0, 116, {"DiscountSelectionPage.verify_page_components": {"duration": 5.0,
+                                                                                         "commands": 66}})
+        violations = gate.compare("tests/test_order.py::test_order", metrics)
+        assert len(violations) == 1
+        assert "WebDriver 명령 116회 > 허용 115회" in violations[0]
+        assert "verify_page_components (+16회)" in violations[0]
+
+    def test_steps_without_baseline_are_skipped(self, gate):
+        assert gate.compare("tests/test_order.py::test_order", {"step9": _metrics(99, 999, {})["step3_discount"]}) == []
+        assert gate.compare("tests/other.py::test_new", _metrics(99, 999, {})) == []
+
+
+class TestPerfGateCollect:
+    """
+    측정 구간(span)에서 단계/페이지 메서드별 실행 시간과 명령 수를 집계하는지 확인합니다.
+    """
+
+    def test_commands_are_charged_to_outermost_page_method(self, gate):
+        instrumentation.add_listener(gate.on_span)
+        with instrumentation.span("step3_discount", SpanCategory.STEP):
+            with instrumentation.span("DiscountSelectionPage.verify_page_components", SpanCategory.PAGE):
+                with instrumentation.span("BasePage.find_element_with_fallback", SpanCategory.PAGE):
+                    with instrumentation.span("findElement", SpanCategory.COMMAND):
+                        pass
+            with instrumentation.span("getPageSource", SpanCategory.COMMAND):
+                pass
+        step = gate.metrics["step3_discount"]
+        assert step["commands"] == 2
+        assert list(step["methods"]) == ["DiscountSelectionPage.verify_page_components"]
+        assert step["methods"]["DiscountSelectionPage.verify_page_components"]["commands"] == 1
+        assert step["duration"] >= step["methods"]["DiscountSelectionPage.verify_page_components"]["duration"]
+
+    def test_spans_outside_steps_are_ignored(self, gate):
+        instrumentation.add_listener(gate.on_span)
+        with instrumentation.span("findElement", SpanCategory.COMMAND):
+            pass
+        assert gate.metrics == {}
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+import random
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from pages.discount_selection_page import DiscountSelectionPage
+from utils.evidence import evidence_collector
+from utils.retry_policy import CircuitOpen, RetryPolicy, retry_engine
+from utils.wait_budget import wait_budget
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """
+    재시도 대기를 없애고, 서킷 브레이커/재시도 기록을 빈 상태로 바꿉니다.
+    """
+    monkeypatch.setattr(wait_budget, "sleep", lambda seconds, label="sleep": None)
+    monkeypatch.setattr(retry_engine, "enabled", True)
+    monkeypatch.setattr(retry_engine, "events", [])
+    monkeypatch.setattr(retry_engine, "consecutive_failures", 0)
+    monkeypatch.setattr(retry_engine, "opened_at", None)
+    monkeypatch.setattr(retry_engine, "failure_threshold", 5)
+    monkeypatch.setattr(retry_engine, "cooldown_seconds", 300)
+    monkeypatch.setattr(retry_engine, "quarantine_device", False)
+    monkeypatch.setattr(retry_engine, "policies", {
+        "page": RetryPolicy("page", attempts=3, base_delay=0.5, max_delay=4, jitter=0,
+                            retry_on=(StaleElementReferenceException,)),
+    })
+    return retry_engine
+
+
+def _failing(error, times):
+    """
+    처음 times번은 error를 발생시키고 이후에는 'ok'를 반환하는 함수를 만듭니다.
+    """
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= times:
+            raise error
+        return "ok"
+    func.calls = calls
+    return func
+
+
+class TestRetryPolicy:
+    """
+    지수 백오프와 지터 계산 단위 테스트입니다.
+    """
+
+    def test_backoff_doubles_until_max_delay(self):
+        policy = RetryPolicy("test", base_delay=1, max_delay=5, jitter=0)
+        assert [policy.delay(attempt, random.Random(0)) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+    def test_jitter_stays_in_range(self):
+        policy = RetryPolicy("test", base_delay=2, max_delay=10, jitter=0.3)
+        rng = random.Random(1)
+        delays = [policy.delay(1, rng) for _ in range(200)]
+        assert all(1.4 <= delay <= 2.6 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_should_retry_only_listed_errors_within_attempts(self):
+        policy = RetryPolicy("test", attempts=2, retry_on=(StaleElementReferenceException,))
+        assert policy.should_retry(StaleElementReferenceException(), 1)
+        assert not policy.should_retry(StaleElementReferenceException(), 2)
+        assert not policy.should_retry(TimeoutException(), 1)
+
+
+class TestRetryEngine:
+    """
+    재시도 실행과 서킷 브레이커 단위 테스트입니다.
+    """
+
+    def test_transient_error_is_retried(self, engine):
+        func = _failing(StaleElementReferenceException(), 2)
+        assert engine.call("page", "page", "label", func) == "ok"
+        assert len(func.calls) == 3
+        assert [event["outcome"] for event in engine.events] == ["retried", "retried"]
+        assert engine.consecutive_failures == 0
+
+    def test_other_errors_are_not_retried(self, engine):
+        func = _failing(TimeoutException(), 1)
+        with pytest.raises(TimeoutException):
+            engine.call("page", "page", "label", func)
+        assert len(func.calls) == 1
+
+    def test_circuit_opens_after_consecutive_failures(self, engine):
+        engine.failure_threshold = 2
+        func = _failing(StaleElementReferenceException(), 10)
+        with pytest.raises(CircuitOpen):
+            engine.call("page", "page", "label", func)
+        assert len(func.calls) == 2
+        assert engine.opened_at is not None
+        # -> 열린 동안에는 첫 실패에서 바로 중단
+        with pytest.raises(CircuitOpen):
+            engine.call("page", "page", "label", _failing(StaleElementReferenceException(), 10))
+
+    def test_circuit_half_opens_after_cooldown(self, engine):
+        engine.opened_at = 0.0
+        engine.consecutive_failures = engine.failure_threshold
+        engine.cooldown_seconds = 0
+        assert not engine.is_open
+        assert engine.call("page", "page", "label", _failing(StaleElementReferenceException(), 0)) == "ok"
+        assert engine.consecutive_failures == 0
+
+
+class TestRetryableEvidence:
+    """
+    @retryable 페이지 메서드가 재시도마다가 아니라 최종 실패 후 한 번만 증거를 남기는지 확인합니다.
+    """
+
+    @pytest.fixture
+    def captured(self, engine, monkeypatch):
+        captured = []
+        monkeypatch.setattr(evidence_collector, "capture", lambda page, name: captured.append(name))
+        return captured
+
+    def test_evidence_once_after_final_failure(self, captured, monkeypatch):
+        page = DiscountSelectionPage(None, "Android")
+        lookups = []
+
+        def stale(locator, timeout=None, probe=None):
+            lookups.append(locator)
+            raise StaleElementReferenceException("화면 갱신")
+        monkeypatch.setattr(page, "find_element_with_fallback", stale)
+
+        with pytest.raises(StaleElementReferenceException):
+            page.verify_page_components("홍길동", 1)
+        assert len(lookups) == 3
+        assert captured == ["verify_page_components_failure"]
+
+    def test_no_evidence_when_retry_recovers(self, captured, monkeypatch):
+        page = DiscountSelectionPage(None, "Android")
+        texts = {"page_title": "할인 선택", "step_indicator": "3", "customer_name": "고객명: 홍길동",
+                 "total_count": "총 1개"}
+        lookups = []
+
+        def stale_once(locator, timeout=None, probe=None):
+            lookups.append(locator.key)
+            if len(lookups) == 1:
+                raise StaleElementReferenceException("화면 갱신")
+            return _Element(texts[locator.key])
+        monkeypatch.setattr(page, "find_element_with_fallback", stale_once)
+
+        page.verify_page_components("홍길동", 1)
+        assert lookups[:2] == ["page_title", "page_title"]
+        assert captured == []
+
+
+class _Element:
+    def __init__(self, text):
+        self.text = text
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import pytest
+from utils.coverage import SelectionPolicy, coverage_store
+from utils.scenario_context import scenario_context
+from utils.scenario_matrix import (ScenarioCase, expand_matrix, load_matrix, parse_shard, schedule_longest_first,
+                                   shard_cases)
+
+_MATRIX = {
+    "dimensions": {"payment_method": ["card", "bank"], "transfer_day": ["10일", "15일"], "sale_type": ["*"]},
+    "exclude": [{"payment_method": "card", "transfer_day": "15일"}],
+}
+
+
+class TestScenarioMatrix:
+    """
+    매트릭스 확장, 샤드 분배, 최장 우선(LPT) 배정 단위 테스트입니다.
+    """
+
+    def test_expand_applies_exclude_rules_in_declaration_order(self):
+        cases = expand_matrix(_MATRIX)
+        assert [case.case_id for case in cases] == ["card-10일-*", "bank-10일-*", "bank-15일-*"]
+
+    def test_case_seed_depends_only_on_params(self):
+        assert ScenarioCase({"a": 1, "b": 2}).seed == ScenarioCase({"b": 2, "a": 1}).seed
+        assert ScenarioCase({"a": 1}).seed != ScenarioCase({"a": 2}).seed
+
+    def test_shards_are_disjoint_and_complete(self):
+        cases = expand_matrix(_MATRIX)
+        shards = [shard_cases(cases, index, 2) for index in range(2)]
+        assert sorted(case.case_id for shard in shards for case in shard) == sorted(case.case_id for case in cases)
+        assert not {case.case_id for case in shards[0]} & {case.case_id for case in shards[1]}
+
+    @pytest.mark.parametrize("option", ["0/2", "3/2", "1-2", None])
+    def test_parse_shard_rejects_invalid(self, option):
+        with pytest.raises(ValueError):
+            parse_shard(option)
+
+    def test_parse_shard(self):
+        assert parse_shard("2/3") == (1, 3)
+
+    def test_longest_first_balances_workers(self):
+        cases = [ScenarioCase({"case": name}) for name in "abcde"]
+        durations = {"a": 7, "b": 5, "c": 4, "d": 3, "e": None}
+        assignments, loads = schedule_longest_first(cases, ["w1", "w2"],
+                                                    lambda case: durations[case.params["case"]])
+        # -> 기록이 없는 e는 평균(4.75초)으로 예상하며, 긴 케이스부터 누적 시간이 짧은 작업자에게 배정
+        assert [case.case_id for case in assignments["w1"]] == ["a", "c"]
+        assert [case.case_id for case in assignments["w2"]] == ["b", "e", "d"]
+        assert loads == {"w1": 11, "w2": 12.75}
+
+    def test_project_matrix_declares_page_dimensions(self):
+        dimensions = load_matrix()["dimensions"]
+        assert "lump_sum_payment_method" in dimensions
+        assert "customer_type" not in dimensions
+
+    def test_project_matrix_cases_are_selectable(self):
+        # -> 카드이체는 15일을 제공하지 않으므로, 정기/수납 결제 모두 '카드 + 15일' 케이스가 없어야 함
+        cases = expand_matrix(load_matrix())
+        for method, day in (("payment_method", "transfer_day"), ("lump_sum_payment_method", "lump_sum_transfer_day")):
+            assert not [case.case_id for case in cases if case.params[method] == "card" and case.params[day] == "15일"]
+
+
+class TestScenarioContext:
+    """
+    케이스 지정값/시드 기반 옵션 선택 단위 테스트입니다.
+    """
+
+    @pytest.fixture(autouse=True)
+    def uniform_policy(self, monkeypatch):
+        monkeypatch.setattr(coverage_store, "policy", SelectionPolicy.UNIFORM)
+        yield
+        scenario_context.activate(None)
+
+    def test_case_value_is_selected(self):
+        scenario_context.activate(ScenarioCase({"payment_method": "bank"}))
+        assert scenario_context.choose("payment_method", ["card", "bank"]) == "bank"
+        assert scenario_context.choices == {"payment_method": "bank"}
+
+    def test_same_case_makes_same_free_choices(self):
+        case = ScenarioCase({"payment_method": "*"})
+        picks = []
+        for _ in range(2):
+            scenario_context.activate(case)
+            picks.append([scenario_context.choose("transfer_day", ["10일", "15일", "20일", "25일"])
+                          for _ in range(5)])
+        assert picks[0] == picks[1]
+
+    def test_replay_restores_recorded_choices(self):
+        scenario_context.activate(ScenarioCase({}), replay={"seed": 7, "choices": {"transfer_day": "20일"}})
+        assert scenario_context.choose("transfer_day", ["10일", "20일"]) == "20일"
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import pytest
+from selenium.common.exceptions import TimeoutException
+from pages.navigation_map import navigate_to
+from pages.Order_docbar import MobileOrderPage
+from utils.checkpoint import checkpoint_store
+from utils.evidence import evidence_collector
+from utils.fake_driver import fake_appium_driver
+from utils.locator_stats import locator_stats
+from utils.retry_policy import retry_engine
+from utils.run_history import run_history
+from utils.scenario_runner import ScenarioRunner
+from utils.timeout_policy import timeout_policy
+from utils.ui_idle import ui_idle_monitor
+from utils.wait_budget import wait_budget
+
+
+@pytest.fixture
+def isolated(monkeypatch, tmp_path):
+    """
+    고정 sleep/재시도 대기를 없애고, 체크포인트·실행 기록·재시도 기록·화면 안정화 시간이 실제 리포트에 남지 않게 합니다.
+    """
+    monkeypatch.setattr(wait_budget, "sleep", lambda seconds, label="sleep": None)
+    monkeypatch.setattr(evidence_collector, "capture", lambda page, name: None)
+    monkeypatch.setattr(checkpoint_store, "checkpoint_dir", str(tmp_path))
+    monkeypatch.setattr(run_history, "record_step", lambda *args, **kwargs: None)
+    monkeypatch.setattr(locator_stats, "stats", {})
+    monkeypatch.setattr(locator_stats, "_dirty", False)
+    monkeypatch.setattr(timeout_policy, "samples", {})
+    monkeypatch.setattr(timeout_policy, "_dirty", False)
+    monkeypatch.setattr(ui_idle_monitor, "settle_times", {})
+    monkeypatch.setattr(ui_idle_monitor, "report_dir", str(tmp_path / "ui_idle"))
+    monkeypatch.setattr(retry_engine, "events", [])
+    monkeypatch.setattr(retry_engine, "consecutive_failures", 0)
+    monkeypatch.setattr(retry_engine, "opened_at", None)
+
+
+class TestStepRetry:
+    """
+    재시도 단계가 앞으로 진행한 화면에서 단계 시작 화면으로 돌아가 다시 실행되는지 확인합니다.
+    """
+
+    def test_retry_after_forward_transition_returns_to_step_screen(self, isolated):
+        driver, platform = fake_appium_driver("order_flow", start_screen="main")
+        connection = driver.command_executor
+        started_on = []
+
+        def open_order_status(driver, platform, state):
+            started_on.append(connection.screen)
+            page = MobileOrderPage(driver, platform)
+            page.access_mobile_order_via_docbar()
+            page.start_general_count()
+            if len(started_on) == 1:
+                # -> 주문 현황 화면까지 진행한 뒤 일시 오류
+                raise TimeoutException("주문 현황 로딩 지연")
+
+        runner = ScenarioRunner("retry_navigation", driver, platform, navigator=navigate_to)
+        runner.add_step("order_status", open_order_status, screen="main", retry="step")
+        runner.run()
+
+        assert started_on == ["main", "main"]
+        assert connection.screen == "order_status"
+        assert [action[0] for action in connection.actions].count("back") == 2
+        assert [event["outcome"] for event in retry_engine.events] == ["retried"]
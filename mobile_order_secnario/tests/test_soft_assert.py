@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import os
+from types import SimpleNamespace
+import pytest
+from pages.base_page import BasePage
+from pages.step4_payment_info import Step4PaymentInfoPage
+from utils.checkpoint import checkpoint_store
+from utils.evidence import EvidencePolicy, evidence_collector
+from utils.fake_driver import fake_appium_driver
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.run_history import run_history
+from utils.scenario_runner import ScenarioRunner
+from utils.soft_assert import SoftAssertionError, soft_assertions
+
+
+@pytest.fixture
+def captured(monkeypatch, tmp_path):
+    """
+    소프트 검증 기록을 비우고, 화면 계층은 임시 폴더에 저장하며, 스크린샷 요청은 목록에 모읍니다.
+    """
+    requests = []
+    monkeypatch.setattr(soft_assertions, "enabled", True)
+    monkeypatch.setattr(soft_assertions, "capture_hierarchy", True)
+    monkeypatch.setattr(soft_assertions, "capture_screenshot", True)
+    monkeypatch.setattr(soft_assertions, "evidence_dir", str(tmp_path))
+    monkeypatch.setattr(evidence_collector, "policy", EvidencePolicy.IMMEDIATE)
+    monkeypatch.setattr(evidence_collector, "capture", lambda page, name: requests.append(name))
+    soft_assertions.reset()
+    yield requests
+    soft_assertions.reset()
+
+
+@pytest.fixture
+def page():
+    driver, platform = fake_appium_driver("order_flow", start_screen="step3_discount")
+    return BasePage(driver, platform)
+
+
+def _in_step(step_name, func):
+    with instrumentation.span(step_name, SpanCategory.STEP):
+        with instrumentation.span("DiscountSelectionPage.verify_page_components", SpanCategory.PAGE):
+            return func()
+
+
+class TestSoftAssertions:
+    """
+    소프트 검증 실패 누적, 단계별 증거 1회 수집, 시나리오 끝 일괄 실패 단위 테스트입니다.
+    """
+
+    def test_passing_check_records_nothing(self, captured, page):
+        assert page.soft_check(True, "통과")
+        assert soft_assertions.failures == [] and captured == []
+
+    def test_evidence_is_captured_once_per_step(self, captured, page):
+        _in_step("step3_discount", lambda: page.soft_check(False, "첫 번째 불일치"))
+        _in_step("step3_discount", lambda: page.soft_check(False, "두 번째 불일치"))
+        _in_step("step4_payment", lambda: page.soft_check(False, "세 번째 불일치"))
+        assert captured == ["soft_assert_step3_discount", "soft_assert_step4_payment"]
+        first, second, third = soft_assertions.failures
+        assert (first["step"], first["page_method"]) == ("step3_discount", "DiscountSelectionPage.verify_page_components")
+        assert os.path.exists(first["hierarchy"]) and second["hierarchy"] is None
+        with open(first["hierarchy"], encoding="utf-8") as f:
+            assert "할인 선택" in f.read()
+
+    def test_assert_all_reports_every_failure(self, captured, page):
+        page.soft_check(False, "고객명 불일치")
+        page.soft_check(False, "금액 불일치")
+        with pytest.raises(SoftAssertionError) as error:
+            soft_assertions.assert_all()
+        message = str(error.value)
+        assert "2건" in message and message.index("고객명 불일치") < message.index("금액 불일치")
+
+    def test_discard_step_forgets_previous_attempt(self, captured, page):
+        _in_step("step3_discount", lambda: page.soft_check(False, "재시도 전 실패"))
+        soft_assertions.discard_step("step3_discount")
+        assert soft_assertions.failures == []
+        _in_step("step3_discount", lambda: page.soft_check(False, "재시도 후 실패"))
+        assert len(captured) == 2
+
+    def test_disabled_only_logs(self, captured, page, monkeypatch):
+        monkeypatch.setattr(soft_assertions, "enabled", False)
+        assert not page.soft_check(False, "불일치")
+        soft_assertions.assert_all()
+        assert captured == []
+
+    def test_evidence_off_still_records_failure(self, captured, page, monkeypatch):
+        monkeypatch.setattr(evidence_collector, "policy", EvidencePolicy.OFF)
+        page.soft_check(False, "불일치")
+        assert captured == [] and len(soft_assertions.failures) == 1
+
+    def test_existing_payment_method_mismatch_is_soft(self, captured, page, monkeypatch):
+        step4_page = Step4PaymentInfoPage(page.driver, page.platform)
+        shown = SimpleNamespace(text="카드이체 : 국민카드 123456**********")
+        monkeypatch.setattr(step4_page, "find_element_with_fallback", lambda locator, **kwargs: shown)
+        step4_page._verify_existing_payment_method({"CARD_COMPANY": "신한카드", "CARD_NUMBER": "4499112233445566"})
+        messages = [failure["message"] for failure in soft_assertions.failures]
+        assert len(messages) == 2
+        assert messages[0].startswith("회사명 불일치") and messages[1].startswith("숫자 불일치")
+
+
+class TestSoftAssertionsInRunner:
+    """
+    소프트 검증 실패가 흐름을 멈추지 않고, 모든 단계가 끝난 뒤 한 번에 실패 처리되는지 확인합니다.
+    """
+
+    def test_runner_finishes_all_steps_before_failing(self, captured, page, monkeypatch, tmp_path):
+        monkeypatch.setattr(checkpoint_store, "checkpoint_dir", str(tmp_path))
+        monkeypatch.setattr(run_history, "record_step", lambda *args, **kwargs: None)
+        executed = []
+
+        def step(name, passed):
+            def func(driver, platform, state):
+                executed.append(name)
+                page.soft_check(passed, f"{name} 불일치")
+            return func
+
+        runner = ScenarioRunner("soft_assert", page.driver, page.platform)
+        runner.add_step("step3_discount", step("step3_discount", False))
+        runner.add_step("step4_payment", step("step4_payment", True))
+        with pytest.raises(SoftAssertionError, match="step3_discount 불일치"):
+            runner.run()
+        assert executed == ["step3_discount", "step4_payment"]
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import pytest
+from utils.device_health import DeviceUnhealthy
+from utils.retry_policy import CircuitOpen
+from utils.throughput import throughput_meter
+from utils.wait_budget import WaitBudgetExceeded
+
+
+class _Runner:
+    """
+    run()에서 지정한 예외를 발생시키는(None이면 성공하는) 주문 1건 러너입니다.
+    """
+
+    def __init__(self, error=None):
+        self.error = error
+        self.current_step = "step2_product"
+
+    def run(self):
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.fixture
+def meter(monkeypatch, tmp_path):
+    """
+    반복 제한/실패율 중단 조건을 고정하고 처리량 리포트를 임시 폴더에 남깁니다.
+    """
+    monkeypatch.setattr(throughput_meter, "duration_minutes", 0)
+    monkeypatch.setattr(throughput_meter, "max_failure_rate", 1.0)
+    monkeypatch.setattr(throughput_meter, "min_iterations_for_stop", 5)
+    monkeypatch.setattr(throughput_meter, "throughput_dir", str(tmp_path))
+    return throughput_meter
+
+
+def _run(meter, errors):
+    records = ({"record_id": f"r{index}"} for index in range(1, len(errors) + 1))
+    runners = iter([_Runner(error) for error in errors])
+    return meter.run(records, lambda state: next(runners), iterations=0)
+
+
+class TestThroughputLoop:
+    """
+    연속 주문 반복이 예외 종류에 따라 실패로 기록하고 계속하거나 중단하는지 확인합니다.
+    """
+
+    def test_wait_budget_exceeded_is_iteration_failure(self, meter):
+        summary = _run(meter, [None, WaitBudgetExceeded("예산 초과"), None])
+        assert (summary["iterations"], summary["passed"], summary["failed"]) == (3, 2, 1)
+        assert meter.results[1]["error"] == "예산 초과"
+
+    @pytest.mark.parametrize("error", [DeviceUnhealthy("배터리 부족"), CircuitOpen("서킷 열림")])
+    def test_device_or_circuit_failure_stops_loop(self, meter, error):
+        with pytest.raises(type(error)):
+            _run(meter, [None, error, None])
+        assert [result["passed"] for result in meter.results] == [True, False]
+        assert meter.results[1]["failed_step"] == "step2_product"
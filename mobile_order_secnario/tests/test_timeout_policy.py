@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import pytest
+from pages.base_page import BasePage
+from utils.locator_manager import LocatorSpec
+from utils.timeout_policy import timeout_policy
+
+_LOCATOR = LocatorSpec({"id": "btn"}, key="next_button", group="test_group")
+
+
+@pytest.fixture
+def policy(monkeypatch, tmp_path):
+    """
+    요소 등장 지연 기록을 빈 기록과 임시 파일로 바꿉니다.
+    """
+    monkeypatch.setattr(timeout_policy, "samples", {})
+    monkeypatch.setattr(timeout_policy, "_dirty", False)
+    monkeypatch.setattr(timeout_policy, "file_path", str(tmp_path / "appearance_latency.json"))
+    monkeypatch.setattr(timeout_policy, "enabled", True)
+    monkeypatch.setattr(timeout_policy, "margin_factor", 1.5)
+    monkeypatch.setattr(timeout_policy, "margin_seconds", 1.0)
+    monkeypatch.setattr(timeout_policy, "floor", 2)
+    monkeypatch.setattr(timeout_policy, "ceiling", 30)
+    monkeypatch.setattr(timeout_policy, "min_samples", 5)
+    return timeout_policy
+
+
+def _record(policy, latencies):
+    for latency in latencies:
+        policy.record(_LOCATOR, "android", latency)
+
+
+class TestTimeoutPolicy:
+    """
+    등장 지연 시간 기반 요소별 대기 시간 계산 단위 테스트입니다.
+    """
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert timeout_policy.percentile(values, 99) == 99
+        assert timeout_policy.percentile(values, 50) == 50
+        assert timeout_policy.percentile([3], 99) == 3
+
+    def test_default_until_min_samples(self, policy):
+        _record(policy, [0.5] * 4)
+        assert policy.timeout_for(_LOCATOR, "android", 10) == 10
+
+    def test_learned_timeout_from_p99(self, policy):
+        _record(policy, [1.0, 1.0, 1.0, 1.0, 4.0])
+        assert policy.timeout_for(_LOCATOR, "android", 10) == 7.0
+
+    def test_learned_timeout_is_clamped(self, policy):
+        _record(policy, [0.1] * 5)
+        assert policy.timeout_for(_LOCATOR, "android", 10) == 2
+        _record(policy, [40.0] * 5)
+        assert policy.timeout_for(_LOCATOR, "android", 10) == 30
+
+    def test_samples_are_kept_per_platform(self, policy):
+        _record(policy, [0.1] * 5)
+        assert policy.timeout_for(_LOCATOR, "ios", 10) == 10
+
+
+class TestElementTimeout:
+    """
+    BasePage가 학습된 대기 시간을 timeout을 명시하지 않은 조회에만 적용하는지 확인합니다.
+    """
+
+    @pytest.fixture
+    def page(self, policy):
+        _record(policy, [0.1] * 5)
+        return BasePage(None, "Android")
+
+    def test_explicit_short_probe_is_kept(self, page):
+        # -> 학습된 floor(2초)가 명시적인 1초 Probe 확인을 늘리지 않아야 함
+        assert page._element_timeout(_LOCATOR, 1, 5) == 1
+
+    def test_learned_timeout_when_not_given(self, page):
+        assert page._element_timeout(_LOCATOR, None, 5) == 2
+
+    def test_default_without_samples(self, page, policy):
+        policy.samples.clear()
+        assert page._element_timeout(_LOCATOR, None, 5) == 5
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from utils.ui_idle import UiSettled
+
+
+def _sequence(fingerprints):
+    """
+    호출할 때마다 다음 지문을 반환하는 지문 함수를 만듭니다. (마지막 지문은 계속 반복)
+    """
+    values = list(fingerprints)
+
+    def fingerprint(driver):
+        return values.pop(0) if len(values) > 1 else values[0]
+    return fingerprint
+
+
+def _polls_until_settled(condition, limit=20):
+    for poll in range(1, limit + 1):
+        if condition(None):
+            return poll
+    return None
+
+
+class TestUiSettled:
+    """
+    화면 지문 안정 판단(UiSettled) 단위 테스트입니다.
+    """
+
+    def test_settles_after_n_identical_samples(self):
+        condition = UiSettled(_sequence(["a", "b", "b", "b"]), stable_samples=2)
+        assert _polls_until_settled(condition) == 3
+
+    def test_single_sample_settles_immediately(self):
+        assert _polls_until_settled(UiSettled(_sequence(["a"]), stable_samples=1)) == 1
+
+    def test_none_fingerprint_never_counts(self):
+        assert _polls_until_settled(UiSettled(_sequence([None]), stable_samples=2), limit=5) is None
+
+    def test_waits_for_change_from_baseline(self):
+        # -> 전환 전 화면(old)이 잠시 유지되어도 안정으로 판단하지 않고, 새 화면이 안정된 뒤에 끝나야 함
+        condition = UiSettled(_sequence(["old", "old", "old", "new", "new"]), stable_samples=2,
+                              baseline="old", change_timeout=60)
+        assert _polls_until_settled(condition) == 5
+        assert condition.changed
+
+    def test_no_change_falls_back_after_change_timeout(self):
+        condition = UiSettled(_sequence(["old"]), stable_samples=2, baseline="old", change_timeout=0)
+        assert _polls_until_settled(condition) == 2
+        assert not condition.changed
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import time
+import pytest
+from selenium.common.exceptions import TimeoutException
+from utils.wait_budget import WaitBudgetExceeded, wait_budget
+
+
+@pytest.fixture
+def slept(monkeypatch):
+    """
+    실제 sleep 대신 요청한 시간을 기록합니다.
+    """
+    requested = []
+    monkeypatch.setattr(time, "sleep", requested.append)
+    return requested
+
+
+@pytest.fixture
+def budget(monkeypatch, slept):
+    """
+    시나리오 예산 10초, 단계 예산 4초로 시나리오를 시작합니다.
+    """
+    monkeypatch.setattr(wait_budget, "enabled", True)
+    monkeypatch.setattr(wait_budget, "scenario_seconds", 10)
+    monkeypatch.setattr(wait_budget, "step_seconds", 4)
+    wait_budget.start_scenario("budget_test")
+    wait_budget.start_step("step1")
+    yield wait_budget
+    wait_budget.end_scenario()
+
+
+class TestWaitBudget:
+    """
+    단계/시나리오 대기 예산 차감과 소진 시 중단 단위 테스트입니다.
+    """
+
+    def test_inactive_budget_does_not_limit_or_charge(self, monkeypatch):
+        monkeypatch.setattr(wait_budget, "scenario_name", None)
+        assert wait_budget.clamp(30) == 30
+        spent = wait_budget.scenario_spent
+        wait_budget.charge("label", 5)
+        assert wait_budget.scenario_spent == spent
+
+    def test_sleep_charges_step_and_scenario(self, budget, slept):
+        budget.sleep(1, "short_sleep")
+        budget.sleep(1, "short_sleep")
+        assert slept == [1, 1]
+        assert (budget.step_spent, budget.scenario_spent) == (2, 2)
+
+    def test_sleep_is_clamped_to_step_budget(self, budget, slept):
+        budget.sleep(3)
+        budget.sleep(3)
+        assert slept == [3, 1]
+        assert budget.remaining() == 0
+
+    def test_new_step_resets_step_budget_only(self, budget):
+        budget.sleep(4)
+        budget.start_step("step2")
+        assert budget.remaining() == 4
+        budget.sleep(4)
+        budget.start_step("step3")
+        # -> 시나리오 예산(10초) 중 남은 2초가 단계 예산(4초)보다 작음
+        assert budget.remaining() == 2
+
+    def test_waiting_yields_clamped_timeout_and_charges_timeout(self, budget):
+        budget.charge("earlier", 3)
+        with pytest.raises(TimeoutException):
+            with budget.waiting("next_button", 10) as allowed:
+                assert allowed == 1
+                raise TimeoutException()
+        assert budget.charges[-1][:2] == ("step1", "next_button")
+
+    def test_exhausted_budget_aborts(self, budget):
+        budget.charge("slow_popup", 4)
+        with pytest.raises(WaitBudgetExceeded) as error:
+            with budget.waiting("next_button", 10):
+                pass
+        assert "slow_popup" in str(error.value)
+        with pytest.raises(WaitBudgetExceeded):
+            budget.sleep(1)
+
+    def test_exceeded_is_not_swallowed_by_page_handlers(self, budget):
+        budget.charge("slow_popup", 4)
+        with pytest.raises(WaitBudgetExceeded):
+            try:
+                budget.sleep(1)
+            except Exception:
+                pass
+
+    def test_report_ranks_largest_waits(self, budget):
+        budget.charge("a", 1)
+        budget.charge("b", 2)
+        budget.charge("a", 0.5)
+        lines = budget.report(top=2).splitlines()
+        assert lines[1].strip().startswith("- [step1] b: 2.0s")
+        assert lines[2].strip().startswith("- [step1] a: 1.5s (2회)")
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from selenium.common.exceptions import WebDriverException
+from utils.config_manager import ConfigManager
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.logger import logger
+
+_OUTSIDE_STEP = "(단계 밖)"
+_TOTAL_FRAMES = re.compile(r"Total frames rendered:\s*(\d+)")
+_JANKY_FRAMES = re.compile(r"Janky frames:\s*(\d+)")
+
+
+def _table_value(table, *names):
+    """
+    getPerformanceData 응답([[헤더...], [값...]])에서 첫 번째로 존재하는 헤더의 값을 숫자로 반환합니다.
+    """
+    if not table or len(table) < 2:
+        return None
+    row = dict(zip(table[0], table[1]))
+    for name in names:
+        value = row.get(name)
+        if value not in (None, ""):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+class AppPerfSampler:
+    """
+    [싱글턴 패턴 적용] 시나리오 실행 중 테스트 대상 앱(appPackage)의 CPU/메모리/프레임(jank)을 주기적으로 수집하는 클래스입니다.
+    (config.json 'AppPerf', Android 전용)
+    - cpuinfo/memoryinfo: Appium 'mobile: getPerformanceData'
+    - gfxinfo: 'mobile: shell' dumpsys gfxinfo <패키지> reset (Appium 서버 --relaxed-security 필요)
+    각 샘플에는 그 시점에 실행 중인 시나리오 단계를 기록하고, 종료 시 단계별 리소스 프로파일을
+    reports/app_perf/builds.json에 앱 빌드별로 저장합니다. 직전 빌드 대비 단계의 메모리/CPU가 허용 범위를 넘게 늘면 경고합니다.
+    사용할 수 없는 수집 항목(권한 없음 등)은 첫 실패 후 이번 실행에서 제외합니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    perf_config = config_manager.config.get("AppPerf", {})
+                    self.enabled = perf_config.get("enabled", False)
+                    self.interval = perf_config.get("interval", 5)
+                    self.sources = list(perf_config.get("sources", ["cpuinfo", "memoryinfo", "gfxinfo"]))
+                    self.memory_regression_percent = perf_config.get("memory_regression_percent", 20)
+                    self.cpu_regression_percent = perf_config.get("cpu_regression_percent", 30)
+                    self.perf_dir = os.path.join(config_manager.project_root, 'reports', 'app_perf')
+                    self.builds_path = os.path.join(self.perf_dir, 'builds.json')
+                    self.build = None
+                    self.driver = None
+                    self.package = None
+                    self.samples = []
+                    self._active_sources = []
+                    self._stop_event = threading.Event()
+                    self._thread = None
+                    self._initialized = True
+
+    def configure(self, enabled=False, build=None):
+        if enabled:
+            self.enabled = True
+        if build:
+            self.build = build
+
+    # --- 수집 ---
+    def _app_package(self, driver):
+        capabilities = driver.capabilities or {}
+        return capabilities.get("appPackage") or capabilities.get("appium:appPackage")
+
+    def _shell(self, *args):
+        return self.driver.execute_script("mobile: shell", {"command": args[0], "args": list(args[1:])}) or ""
+
+    def _detect_build(self):
+        """
+        앱 빌드 이름(versionName)을 확인합니다. 확인할 수 없으면 'unknown'을 사용합니다. (--app-build로 지정 가능)
+        """
+        try:
+            match = re.search(r"versionName=(\S+)", self._shell("dumpsys", "package", self.package))
+            if match:
+                return match.group(1)
+        except WebDriverException:
+            pass
+        return "unknown"
+
+    def _collect(self, source):
+        if source == "cpuinfo":
+            table = self.driver.get_performance_data(self.package, "cpuinfo", 5)
+            user, kernel = _table_value(table, "user"), _table_value(table, "kernel")
+            return {"cpu_percent": (user or 0) + (kernel or 0)} if user is not None or kernel is not None else {}
+        if source == "memoryinfo":
+            memory = _table_value(self.driver.get_performance_data(self.package, "memoryinfo", 5),
+                                  "totalPss", "totalPrivateDirty")
+            return {"memory_kb": memory} if memory is not None else {}
+        if source == "gfxinfo":
+            # -> reset으로 매 샘플 사이의 프레임만 집계합니다.
+            output = self._shell("dumpsys", "gfxinfo", self.package, "reset")
+            total, janky = _TOTAL_FRAMES.search(output), _JANKY_FRAMES.search(output)
+            return {"frames": int(total.group(1)), "janky_frames": int(janky.group(1))} if total and janky else {}
+        raise ValueError(f"알 수 없는 앱 성능 수집 항목: {source}")
+
+    def sample(self):
+        """
+        샘플 1건을 수집하여 현재 시나리오 단계와 함께 기록합니다.
+        """
+        step = instrumentation.active(SpanCategory.STEP)
+        sample = {"time": round(time.time(), 3), "step": step.name if step else _OUTSIDE_STEP}
+        for source in list(self._active_sources):
+            try:
+                sample.update(self._collect(source))
+            except WebDriverException as e:
+                self._active_sources.remove(source)
+                logger.warning(f"⚠️ 앱 성능 수집 항목 '{source}'을(를) 사용할 수 없어 제외합니다: {e.msg or e}")
+        with self._lock:
+            self.samples.append(sample)
+        return sample
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except WebDriverException as e:
+                logger.warning(f"⚠️ 앱 성능 샘플 수집 실패: {e.msg or e}")
+
+    def start(self, driver, platform):
+        """
+        백그라운드 수집 스레드를 시작합니다. (비활성화 상태이거나 Android가 아니면 아무것도 하지 않음)
+        """
+        if not self.enabled:
+            return
+        if (platform or "").lower() != "android":
+            logger.info("앱 성능 수집은 Android에서만 지원합니다.")
+            return
+        self.driver = driver
+        self.package = self._app_package(driver)
+        if not self.package:
+            logger.warning("⚠️ appPackage capability가 없어 앱 성능 수집을 건너뜁니다.")
+            return
+        self.build = self.build or self._detect_build()
+        self.samples = []
+        self._active_sources = list(self.sources)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="app-perf-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"📈 앱 성능 수집 시작: {self.package} (빌드 {self.build}, {self.interval}초 간격)")
+
+    def stop(self):
+        """
+        수집을 멈추고 단계별 프로파일을 저장/비교합니다. (드라이버 종료 전에 호출)
+        """
+        if self._thread is None:
+            return None
+        self._stop_event.set()
+        self._thread.join(timeout=self.interval + 10)
+        self._thread = None
+        profile = self.step_profile()
+        if profile:
+            self._save_and_compare(profile)
+        return profile
+
+    # --- 집계/비교 ---
+    def step_profile(self):
+        """
+        단계별 리소스 프로파일을 반환합니다. {단계: {samples, cpu_avg, cpu_max, memory_avg_kb, memory_max_kb, frames, janky_frames}}
+        """
+        profile = {}
+        with self._lock:
+            samples = list(self.samples)
+        for sample in samples:
+            entry = profile.setdefault(sample["step"], {"samples": 0, "cpu": [], "memory": [], "frames": 0,
+                                                        "janky_frames": 0})
+            entry["samples"] += 1
+            if "cpu_percent" in sample:
+                entry["cpu"].append(sample["cpu_percent"])
+            if "memory_kb" in sample:
+                entry["memory"].append(sample["memory_kb"])
+            entry["frames"] += sample.get("frames", 0)
+            entry["janky_frames"] += sample.get("janky_frames", 0)
+        for entry in profile.values():
+            cpu, memory = entry.pop("cpu"), entry.pop("memory")
+            entry["cpu_avg"] = round(sum(cpu) / len(cpu), 2) if cpu else None
+            entry["cpu_max"] = max(cpu) if cpu else None
+            entry["memory_avg_kb"] = round(sum(memory) / len(memory)) if memory else None
+            entry["memory_max_kb"] = max(memory) if memory else None
+        return profile
+
+    def _load_builds(self):
+        if not os.path.exists(self.builds_path):
+            return {}
+        with open(self.builds_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def compare(self, profile, baseline):
+        """
+        단계별 메모리 최대값/CPU 평균이 기준 프로파일 대비 허용 비율을 넘게 늘어난 항목의 메시지 목록을 반환합니다.
+        """
+        alerts = []
+        checks = (("memory_max_kb", self.memory_regression_percent, "메모리 최대", "KB"),
+                  ("cpu_avg", self.cpu_regression_percent, "CPU 평균", "%"))
+        for step_name, current in profile.items():
+            previous = baseline.get(step_name)
+            if not previous:
+                continue
+            for field, percent, label, unit in checks:
+                before, after = previous.get(field), current.get(field)
+                if before and after is not None and after > before * (1 + percent / 100):
+                    alerts.append(f"{step_name}: {label} {before:g}{unit} → {after:g}{unit} "
+                                  f"(+{(after / before - 1) * 100:.0f}%, 허용 {percent}%)")
+        return alerts
+
+    def _save_and_compare(self, profile):
+        builds = self._load_builds()
+        previous_build = next((name for name in reversed(list(builds)) if name != self.build), None)
+        if previous_build:
+            alerts = self.compare(profile, builds[previous_build]["steps"])
+            for alert in alerts:
+                logger.warning(f"📈 앱 리소스 회귀 (빌드 {previous_build} → {self.build}) {alert}")
+        # -> 빌드별 최신 프로파일을 유지합니다. (같은 빌드를 다시 실행하면 갱신되고 순서상 가장 뒤로 이동)
+        builds.pop(self.build, None)
+        builds[self.build] = {"recorded_at": datetime.now().isoformat(timespec='seconds'),
+                              "package": self.package, "steps": profile}
+        os.makedirs(self.perf_dir, exist_ok=True)
+        with open(self.builds_path, 'w', encoding='utf-8') as f:
+            json.dump(builds, f, ensure_ascii=False, indent=2)
+        logger.info(f"📈 앱 성능 프로파일 저장: {self.builds_path} (빌드 {self.build}, {len(profile)}개 단계)")
+
+
+app_perf_sampler = AppPerfSampler()
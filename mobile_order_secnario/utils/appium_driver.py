@@ -6,9 +6,23 @@ from appium import webdriver
 from appium.options.android import UiAutomator2Options
 from appium.options.ios import XCUITestOptions
 from utils.config_manager import ConfigManager
+from utils.device_health import device_health
+from utils.instrumentation import instrumentation
 from utils.logger import logger
+from utils.login_cache import login_cache
 import os
 
+# -> 이 프로세스에서 실기기 Appium 세션을 만들거나 연결한 기기 설정 키 (가짜 드라이버/카세트 재생은 포함하지 않음)
+_device_sessions = set()
+
+
+def device_session_started():
+    """
+    이 프로세스에서 실기기 세션이 한 번이라도 시작되었는지 반환합니다.
+    학습 통계(로케이터 순서/등장 지연)와 실행 리포트는 실기기 실행에서만 저장하는 데 사용합니다.
+    """
+    return bool(_device_sessions)
+
 
 # --- 헬퍼 함수: 설정 유효성 검사 ---
 def get_platform_from_config(device_config):
@@ -25,22 +39,19 @@ def get_platform_from_config(device_config):
     return platform.lower()
 
 
-# --- 메인 드라이버 초기화 함수 ---
-# CHANGED: platform_name 인자를 추가하여 플랫폼을 명시적으로 지정합니다.
-def init_appium_driver(platform_name=None):
+# --- 헬퍼 함수: 플랫폼별 Options 생성 ---
+def _build_driver_options(config_manager, platform_name, device_config_key=None, overrides=None):
     """
-    Appium WebDriver 인스턴스를 초기화하고 반환합니다.
-    :return: 초기화된 Appium WebDriver 인스턴스 및 플랫폼 이름
+    config.json의 'Capabilities_{플랫폼}' 설정으로 Appium 서버 주소와 Options 객체를 만듭니다.
+    :param device_config_key: 사용할 디바이스 설정 키 (None이면 'Capabilities_{플랫폼}', 병렬 실행 시 기기별 키)
+    :param overrides: 기기 설정 위에 덮어쓸 capability (로그인 재사용 프로파일 등)
+    :return: (Appium 서버 URL, Options 객체)
     """
-    config_manager = ConfigManager()
     appium_server_url = config_manager.config.get("Appium", {}).get("server_url", "http://127.0.0.1:4723/wd/hub")
 
-    # CHANGED: 플랫폼 이름이 명시적으로 주어지지 않으면, config.json의 기본 Android 설정을 사용합니다.
-    if not platform_name:
-        platform_name = "Android"
-
-    device_config_key = f"Capabilities_{platform_name}"
-    device_config = config_manager.config.get(device_config_key, {})
+    device_config_key = device_config_key or f"Capabilities_{platform_name}"
+    device_config = dict(config_manager.config.get(device_config_key, {}))
+    device_config.update(overrides or {})
 
     if 'platformName' not in device_config:
         device_config['platformName'] = platform_name
@@ -52,12 +63,97 @@ def init_appium_driver(platform_name=None):
     else:
         # 이 예외는 위 로직으로 인해 거의 발생하지 않습니다.
         raise ValueError("유효하지 않은 플랫폼입니다. 'Android' 또는 'iOS'여야 합니다.")
+    return appium_server_url, options
+
+
+# --- 메인 드라이버 초기화 함수 ---
+# CHANGED: platform_name 인자를 추가하여 플랫폼을 명시적으로 지정합니다.
+def init_appium_driver(platform_name=None, device_config_key=None, skip_quarantined=False):
+    """
+    Appium WebDriver 인스턴스를 초기화하고 반환합니다.
+    :param device_config_key: config.json의 디바이스 설정 키 (예: 'Capabilities_Android_2')
+    :param skip_quarantined: 격리 중인 기기면 테스트를 건너뜁니다. (병렬 실행기의 기기별 프로세스에서만 사용,
+                             그 외에는 격리 사유로 실패 처리하여 단일 기기/CI 실행이 '모두 스킵'으로 통과하지 않도록 함)
+    :return: 초기화된 Appium WebDriver 인스턴스 및 플랫폼 이름
+    """
+    config_manager = ConfigManager()
+
+    # CHANGED: 플랫폼 이름이 명시적으로 주어지지 않으면, config.json의 기본 Android 설정을 사용합니다.
+    if not platform_name:
+        platform_name = "Android"
+
+    # -> 로그인 재사용 프로파일(noReset/fullReset)을 기기 설정 위에 적용합니다. (utils/login_cache.py)
+    appium_server_url, options = _build_driver_options(config_manager, platform_name, device_config_key,
+                                                       overrides=login_cache.capabilities())
+
+    # -> 상태 불량으로 격리된 기기는 세션을 만들지 않습니다. (utils/device_health.py)
+    device_config_key = device_config_key or f"Capabilities_{platform_name}"
+    if device_health.is_quarantined(device_config_key):
+        entry = device_health.quarantined()[device_config_key]
+        message = f"격리 중인 기기입니다: {device_config_key} ({entry['until']}까지, {'; '.join(entry['reasons'])})"
+        if skip_quarantined:
+            pytest.skip(message)
+        logger.error(f"❌ {message}")
+        pytest.fail(f"❌ {message} - 'python -m utils.device_health release {device_config_key}'로 해제할 수 있습니다.")
 
     try:
-        driver = webdriver.Remote(appium_server_url, options=options)
+        driver = instrumentation.instrument_driver(webdriver.Remote(appium_server_url, options=options))
         logger.info(f"✅ Appium 드라이버가 성공적으로 초기화되었습니다. (플랫폼: {platform_name})")
+        device_health.start(device_config_key)
+        login_cache.start(device_config_key)
+        _device_sessions.add(device_config_key)
         return driver, platform_name
     except Exception as e:
         error_message = f"❌ Appium 드라이버 초기화 실패: {e}"
         logger.error(error_message)
-        pytest.fail(error_message)
\ No newline at end of file
+        pytest.fail(error_message)
+
+
+class _AttachedRemote(webdriver.Remote):
+    """
+    새 세션을 만들지 않고 이미 떠 있는 Appium 세션(session_id)에 붙는 드라이버입니다.
+    start_session을 재정의하여 NEW_SESSION 명령 대신 기존 세션 정보를 그대로 사용합니다.
+    """
+
+    def __init__(self, command_executor, session_id, capabilities, options):
+        self._attach_session_id = session_id
+        self._attach_capabilities = capabilities
+        super().__init__(command_executor, options=options)
+
+    def start_session(self, capabilities, browser_profile=None):
+        self.session_id = self._attach_session_id
+        self.caps = self._attach_capabilities
+
+
+def attach_appium_driver(session_id, platform_name=None, server_url=None, capabilities=None, device_config_key=None):
+    """
+    세션 데몬(utils/session_daemon.py) 등이 유지 중인 기존 Appium 세션에 연결합니다.
+    앱 실행/로그인 없이 현재 기기 화면 상태에서 바로 테스트를 이어갈 수 있습니다.
+    새 세션과 마찬가지로 기기 상태 점검(device_health)과 로그인 재사용 기록(login_cache)에 기기를 등록합니다.
+    :param session_id: 연결할 Appium 세션 ID
+    :param server_url: Appium 서버 URL (None이면 config.json 'Appium.server_url')
+    :param capabilities: 세션 생성 시 반환된 capabilities (None이면 config.json 설정)
+    :param device_config_key: 세션을 만든 기기 설정 키 (None이면 'Capabilities_{플랫폼}')
+    :return: 연결된 Appium WebDriver 인스턴스 및 플랫폼 이름
+    """
+    config_manager = ConfigManager()
+    if not platform_name:
+        platform_name = "Android"
+
+    device_config_key = device_config_key or f"Capabilities_{platform_name}"
+    appium_server_url, options = _build_driver_options(config_manager, platform_name, device_config_key)
+    try:
+        driver = instrumentation.instrument_driver(
+            _AttachedRemote(server_url or appium_server_url, session_id,
+                            capabilities or options.to_capabilities(), options))
+        # -> 세션이 살아 있는지 가벼운 명령으로 확인합니다.
+        driver.get_window_size()
+        logger.info(f"✅ 기존 Appium 세션에 연결했습니다. (세션: {session_id}, 플랫폼: {platform_name})")
+        device_health.start(device_config_key)
+        login_cache.start(device_config_key)
+        _device_sessions.add(device_config_key)
+        return driver, platform_name
+    except Exception as e:
+        error_message = f"❌ 기존 Appium 세션 연결 실패 (세션: {session_id}): {e}"
+        logger.error(error_message)
+        pytest.fail(error_message)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+WebDriver 명령 기록/재생(카세트)입니다.
+실기기 실행 중 드라이버가 Appium 서버와 주고받은 모든 명령과 응답을 tests/cassettes/<이름>.json.gz에 기록하고,
+기기 없이 같은 응답을 순서대로 돌려주는 재생 드라이버로 페이지 객체 로직(파싱/검증)을 빠르게 다시 실행합니다.
+
+사용법
+    pytest -k test_full_order_scenario --record-cassette full_order      # 실기기 실행 + 기록
+    pytest -k test_full_order_scenario --replay-cassette full_order      # 기기 없이 재생
+
+카세트에는 기록 실행의 시나리오 시드와 선택값도 함께 저장하여 재생 시 같은 선택을 하도록 복원합니다.
+"""
+import base64
+import copy
+import gzip
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from appium import webdriver
+from appium.options.common import AppiumOptions
+from appium.webdriver.appium_connection import AppiumConnection
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.command import Command
+from utils.config_manager import ConfigManager
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.locator_stats import locator_stats
+from utils.logger import logger
+from utils.scenario_context import scenario_context
+from utils.timeout_policy import timeout_policy
+
+# -> 기록 파일 크기를 줄이기 위해 스크린샷 응답은 1x1 PNG로 대체합니다.
+_PLACEHOLDER_PNG = base64.b64encode(bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082")).decode('ascii')
+_SCREENSHOT_COMMANDS = {Command.SCREENSHOT, Command.ELEMENT_SCREENSHOT}
+
+
+class CassetteMismatch(AssertionError):
+    """
+    재생 중 실제 명령이 기록된 명령과 다를 때 발생합니다. 몇 번째 상호작용에서 무엇이 달랐는지를 담습니다.
+    """
+
+
+def cassette_path(name):
+    """
+    카세트 이름을 파일 경로로 변환합니다. (경로가 주어지면 그대로 사용)
+    """
+    if name.endswith('.json.gz') or os.sep in name:
+        return name
+    return os.path.join(ConfigManager().project_root, 'tests', 'cassettes', f"{name}.json.gz")
+
+
+def _normalize_params(params):
+    """
+    비교/저장용 파라미터: 세션마다 달라지는 sessionId를 제외합니다.
+    """
+    return {key: value for key, value in (params or {}).items() if key != 'sessionId'}
+
+
+@contextmanager
+def deterministic_policies():
+    """
+    기록/재생 중에는 로케이터 전략 순서(locator_stats)와 요소별 대기 시간(timeout_policy)의 학습 기반 조정을 끕니다.
+    기록 실행이 통계를 갱신하면 재생 시 전략 순서나 대기 시간이 달라져 명령 순서가 기록과 어긋나기 때문입니다.
+    """
+    previous = (locator_stats.enabled, timeout_policy.enabled)
+    locator_stats.enabled = timeout_policy.enabled = False
+    try:
+        yield
+    finally:
+        locator_stats.enabled, timeout_policy.enabled = previous
+
+
+def _current_page_method():
+    span = instrumentation.current()
+    page = span.ancestor(SpanCategory.PAGE) if span else None
+    return page.name if page else None
+
+
+class CassetteRecorder:
+    """
+    드라이버의 command_executor.execute를 감싸 모든 명령/응답을 기록합니다.
+    같은 명령·파라미터·응답이 연속되면(예: WebDriverWait 폴링) 한 항목으로 합치고 repeat 횟수만 늘립니다.
+    """
+
+    def __init__(self, driver, name):
+        self.driver = driver
+        self.path = cassette_path(name)
+        self.interactions = []
+        self._original_execute = driver.command_executor.execute
+        driver.command_executor.execute = self._execute
+
+    def _execute(self, command, params):
+        response = self._original_execute(command, params)
+        # -> 드라이버가 응답 dict를 직접 수정(요소 → WebElement 변환)하므로 복사본을 기록합니다.
+        recorded = copy.deepcopy(response)
+        if command in _SCREENSHOT_COMMANDS and isinstance(response, dict) and response.get('value'):
+            recorded = dict(response, value=_PLACEHOLDER_PNG)
+        interaction = {"command": command, "params": _normalize_params(params), "response": recorded}
+        last = self.interactions[-1] if self.interactions else None
+        if last and all(last[key] == interaction[key] for key in ("command", "params", "response")):
+            last["repeat"] = last.get("repeat", 1) + 1
+        else:
+            page_method = _current_page_method()
+            if page_method:
+                interaction["page_method"] = page_method
+            self.interactions.append(interaction)
+        return response
+
+    def save(self):
+        """
+        기록을 멈추고 카세트 파일(gzip JSON)로 저장합니다.
+        """
+        self.driver.command_executor.execute = self._original_execute
+        cassette = {
+            "recorded_at": datetime.now().isoformat(timespec='seconds'),
+            "session_id": self.driver.session_id,
+            "capabilities": self.driver.caps,
+            "scenario": {"seed": scenario_context.seed, "choices": dict(scenario_context.choices)},
+            "interactions": self.interactions,
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            json.dump(cassette, f, ensure_ascii=False, separators=(',', ':'), default=str)
+        logger.info(f"📼 카세트 저장: {self.path} (상호작용 {len(self.interactions)}건)")
+        return self.path
+
+
+def start_recording(driver, name):
+    return CassetteRecorder(driver, name)
+
+
+def load_cassette(name):
+    with gzip.open(cassette_path(name), 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ReplayConnection(AppiumConnection):
+    """
+    Appium 서버 대신 카세트에 기록된 응답을 순서대로 돌려주는 command_executor입니다. (HTTP 통신 없음)
+    - 새 세션 명령에는 기록된 세션 ID/capabilities로 응답합니다.
+    - repeat으로 합쳐진 폴링 항목은 최소 1회, 같은 명령이 이어지는 동안 계속 재사용됩니다.
+    - 실제 명령이 기록과 다르면 CassetteMismatch를 발생시킵니다.
+    """
+
+    def __init__(self, cassette):
+        # -> 서버 주소는 client_config로 지정합니다. (remote_server_addr 인자는 Selenium에서 deprecated, 실제 연결 없음)
+        super().__init__(client_config=ClientConfig(remote_server_addr="http://127.0.0.1:4723"))
+        self.cassette = cassette
+        self.interactions = cassette["interactions"]
+        self.position = 0
+        self.served_current = False
+        self.history = []
+
+    def _matches(self, interaction, command, params):
+        return interaction["command"] == command and interaction["params"] == params
+
+    def _describe(self, interaction):
+        where = f" @ {interaction['page_method']}" if interaction.get("page_method") else ""
+        return f"{interaction['command']} {json.dumps(interaction['params'], ensure_ascii=False)}{where}"
+
+    def _mismatch(self, command, params):
+        expected = (self._describe(self.interactions[self.position])
+                    if self.position < len(self.interactions) else "(기록 끝)")
+        page_method = _current_page_method()
+        recent = "\n".join(f"    {line}" for line in self.history[-3:]) or "    (없음)"
+        message = (f"카세트 불일치 (상호작용 #{self.position + 1}/{len(self.interactions)})\n"
+                   f"  기록: {expected}\n"
+                   f"  실제: {command} {json.dumps(params, ensure_ascii=False)}"
+                   + (f" @ {page_method}" if page_method else "")
+                   + f"\n  직전 명령:\n{recent}")
+        logger.error(message)
+        raise CassetteMismatch(message)
+
+    def execute(self, command, params):
+        if command == Command.NEW_SESSION:
+            return {"value": {"sessionId": self.cassette["session_id"],
+                              "capabilities": self.cassette.get("capabilities") or {}}}
+        params = _normalize_params(params)
+
+        current = self.interactions[self.position] if self.position < len(self.interactions) else None
+        following = self.interactions[self.position + 1] if self.position + 1 < len(self.interactions) else None
+        if current is not None and self.served_current and following is not None \
+                and self._matches(following, command, params):
+            # -> 폴링 중이던 항목 다음에 같은 명령의 다른 응답(예: 요소 발견)이 기록되어 있으면 진행합니다.
+            self.position += 1
+            current = following
+            self.served_current = False
+        elif current is not None and self.served_current and not self._matches(current, command, params):
+            self.position += 1
+            current = self.interactions[self.position] if self.position < len(self.interactions) else None
+            self.served_current = False
+
+        if current is None or not self._matches(current, command, params):
+            self._mismatch(command, params)
+
+        self.served_current = True
+        self.history.append(self._describe(current))
+        return copy.deepcopy(current["response"])
+
+    def remaining(self):
+        """
+        아직 재생되지 않은 상호작용 수를 반환합니다.
+        """
+        return len(self.interactions) - self.position - (1 if self.served_current else 0)
+
+    def assert_consumed(self):
+        """
+        기록된 상호작용을 모두 재생했는지 확인합니다. 남아 있으면 첫 번째 미재생 명령을 보고합니다.
+        """
+        left = self.remaining()
+        if left > 0:
+            index = self.position + (1 if self.served_current else 0)
+            raise CassetteMismatch(
+                f"카세트의 상호작용 {left}건이 재생되지 않았습니다. "
+                f"(첫 미재생 #{index + 1}: {self._describe(self.interactions[index])})")
+
+
+def replay_appium_driver(name, platform_name="Android"):
+    """
+    카세트를 재생하는 드라이버를 만듭니다. 실제 Appium 드라이버와 같은 클래스이므로 페이지 객체를 그대로 사용할 수 있습니다.
+    카세트에 기록된 시나리오 시드와 선택값을 현재 시나리오 컨텍스트에 복원합니다.
+    :return: (재생 드라이버, 플랫폼 이름)
+    """
+    cassette = load_cassette(name)
+    scenario = cassette.get("scenario")
+    if scenario:
+        # -> 매트릭스 없이 기록한 실행은 시드를 새로 만들므로, 기록된 시드/선택값이 없으면 선택이 달라집니다.
+        scenario_context.activate(scenario_context.case, replay=scenario)
+    options = AppiumOptions().load_capabilities({"platformName": platform_name})
+    driver = webdriver.Remote(ReplayConnection(cassette), options=options)
+    logger.info(f"📼 카세트 재생: {cassette_path(name)} (상호작용 {len(cassette['interactions'])}건)")
+    return instrumentation.instrument_driver(driver), platform_name
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+from datetime import datetime
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+class CheckpointStore:
+    """
+    [싱글턴 패턴 적용] 시나리오 단계(step)별 체크포인트를 reports/checkpoints 폴더에 저장/로드하는 클래스입니다.
+    각 단계가 끝날 때 진행 중인 주문, 고객, 선택값 등 '그 단계로 돌아가는 데 필요한 상태'를 기록하여
+    다음 실행에서 중간 단계부터 시작(--start-at)할 수 있게 합니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    project_root = ConfigManager().project_root
+                    self.checkpoint_dir = os.path.join(project_root, 'reports', 'checkpoints')
+                    self._initialized = True
+
+    def _file_path(self, scenario_name):
+        return os.path.join(self.checkpoint_dir, f"{scenario_name}.json")
+
+    def load(self, scenario_name):
+        """
+        시나리오의 마지막 체크포인트를 반환합니다. 없으면 None을 반환합니다.
+        """
+        file_path = self._file_path(scenario_name)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"체크포인트 파일 형식이 잘못되어 무시합니다: {file_path}")
+            return None
+
+    def save(self, scenario_name, step_name, screen, state):
+        """
+        단계 완료 시점의 상태를 저장합니다. 단계별 기록은 누적되고 같은 단계는 덮어씁니다.
+        :param step_name: 완료된 단계 이름
+        :param screen: 단계 완료 직후의 화면 이름
+        :param state: JSON으로 직렬화 가능한 시나리오 상태 딕셔너리
+        """
+        with self._lock:
+            checkpoint = self.load(scenario_name) or {"scenario": scenario_name, "steps": {}}
+            checkpoint["steps"][step_name] = {
+                "screen": screen,
+                "completed_at": datetime.now().isoformat(timespec='seconds'),
+                "state": state,
+            }
+            checkpoint["last_step"] = step_name
+            checkpoint["state"] = state
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            with open(self._file_path(scenario_name), 'w', encoding='utf-8') as f:
+                json.dump(checkpoint, f, ensure_ascii=False, indent=2, default=str)
+        logger.info(f"💾 체크포인트 저장: {scenario_name} / {step_name} (화면: {screen})")
+
+    def state_before(self, scenario_name, step_names, start_at):
+        """
+        start_at 단계 직전까지 완료된 단계 중 가장 마지막 단계의 상태를 반환합니다.
+        :param step_names: 시나리오의 단계 이름 목록 (실행 순서)
+        """
+        checkpoint = self.load(scenario_name)
+        if not checkpoint:
+            return {}
+        previous_steps = step_names[:step_names.index(start_at)]
+        for step_name in reversed(previous_steps):
+            if step_name in checkpoint["steps"]:
+                return dict(checkpoint["steps"][step_name]["state"])
+        return {}
+
+
+checkpoint_store = CheckpointStore()
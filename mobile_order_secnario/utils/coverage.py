@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+from datetime import datetime
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+class SelectionPolicy:
+    """
+    시나리오 컨텍스트가 케이스에 지정되지 않은 차원의 옵션을 고르는 방식입니다.
+    """
+    UNIFORM = "uniform"     # 시드 기반 균등 랜덤 (이전 실행 기록 미사용)
+    COVERAGE = "coverage"   # 아직 덜 실행된 조합을 우선 선택, 동률은 시드 기반 랜덤
+    ALL = (UNIFORM, COVERAGE)
+
+
+class CoverageStore:
+    """
+    [싱글턴 패턴 적용] 실행이 끝난 시나리오의 옵션 조합을 reports/coverage/coverage.json에 누적하는 클래스입니다.
+    - 조합(combination): config.json 'Coverage.dimensions' 차원들의 선택값 묶음 (예: 판매구분×관리유형×결제수단×이체일)
+    - 선택 기록(run record): 실행마다 시드와 실제 선택값을 reports/coverage/runs에 저장하여 --replay로 그대로 재실행
+    매트릭스 케이스는 기본적으로 uniform 정책(config.json 'Coverage.matrix_policy')으로 선택하여, case_id만으로 같은 선택이 재현됩니다.
+    coverage 정책의 선택은 커버리지 파일 상태에 따라 달라지므로, 실패를 재현하려면 선택 기록으로 --replay 해야 합니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    coverage_config = config_manager.config.get("Coverage", {})
+                    self.policy = coverage_config.get("policy", SelectionPolicy.COVERAGE)
+                    self.matrix_policy = coverage_config.get("matrix_policy", SelectionPolicy.UNIFORM)
+                    self.dimensions = coverage_config.get(
+                        "dimensions", ["sale_type", "management_type", "payment_method", "transfer_day"])
+                    self.coverage_dir = os.path.join(config_manager.project_root, 'reports', 'coverage')
+                    self.file_path = os.path.join(self.coverage_dir, 'coverage.json')
+                    self.data = self._load()
+                    self._initialized = True
+
+    def _load(self):
+        if not os.path.exists(self.file_path):
+            return {"values": {}, "combinations": {}}
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"커버리지 파일 형식이 잘못되어 새로 시작합니다: {self.file_path}")
+            return {"values": {}, "combinations": {}}
+
+    def set_policy(self, policy):
+        """
+        선택 정책을 변경합니다. 명시한 정책은 매트릭스 케이스에도 적용합니다. (None이면 config.json 설정 유지)
+        """
+        if policy:
+            if policy not in SelectionPolicy.ALL:
+                raise ValueError(f"지원하지 않는 선택 정책입니다: {policy} (가능한 값: {SelectionPolicy.ALL})")
+            self.policy = policy
+            self.matrix_policy = policy
+
+    def policy_for(self, case_id):
+        """
+        실행에 적용할 선택 정책을 반환합니다. (매트릭스 케이스면 matrix_policy)
+        """
+        return self.matrix_policy if case_id is not None else self.policy
+
+    @staticmethod
+    def _combination_key(choices):
+        return "|".join(f"{dimension}={value}" for dimension, value in choices)
+
+    def _tracked(self, choices):
+        return [(dimension, str(choices[dimension])) for dimension in self.dimensions if dimension in choices]
+
+    def combination_count(self, partial_choices):
+        """
+        partial_choices(차원→값)를 모두 포함하는 기록된 조합의 실행 횟수 합을 반환합니다.
+        """
+        wanted = set(self._tracked(partial_choices))
+        total = 0
+        for key, count in self.data["combinations"].items():
+            pairs = set(tuple(pair.split("=", 1)) for pair in key.split("|"))
+            if wanted <= pairs:
+                total += count
+        return total
+
+    def value_count(self, dimension, value):
+        return self.data["values"].get(dimension, {}).get(str(value), 0)
+
+    def rank(self, dimension, candidate_values, current_choices):
+        """
+        후보 값들을 (지금까지의 선택과 합친 조합의 실행 횟수, 값 자체의 실행 횟수) 기준으로 점수화합니다.
+        점수가 가장 낮은 값들(가장 덜 실행된 값)을 반환합니다.
+        """
+        scores = {}
+        for value in candidate_values:
+            partial = dict(current_choices)
+            partial[dimension] = value
+            scores[value] = (self.combination_count(partial) if dimension in self.dimensions else 0,
+                             self.value_count(dimension, value))
+        best = min(scores.values())
+        return [value for value in candidate_values if scores[value] == best]
+
+    def record(self, choices, seed, case_id=None, test_name=None, passed=True):
+        """
+        실행 1회의 선택값을 기록합니다.
+        - 성공한 실행만 커버리지(값/조합 횟수)에 반영합니다.
+        - 선택 기록(시드 + 선택값)은 성공/실패와 관계없이 저장하여 재실행에 사용합니다.
+        :return: 저장된 선택 기록 파일 경로
+        """
+        if not choices:
+            return None
+        with self._lock:
+            if passed:
+                for dimension, value in choices.items():
+                    values = self.data["values"].setdefault(dimension, {})
+                    values[str(value)] = values.get(str(value), 0) + 1
+                tracked = self._tracked(choices)
+                if tracked:
+                    key = self._combination_key(tracked)
+                    self.data["combinations"][key] = self.data["combinations"].get(key, 0) + 1
+                os.makedirs(self.coverage_dir, exist_ok=True)
+                with open(self.file_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.data, f, ensure_ascii=False, indent=2)
+
+            run_dir = os.path.join(self.coverage_dir, 'runs')
+            os.makedirs(run_dir, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            run_path = os.path.join(run_dir, f"{timestamp}_{seed}.json")
+            with open(run_path, 'w', encoding='utf-8') as f:
+                json.dump({"seed": seed, "case_id": case_id, "test": test_name, "passed": passed,
+                           "policy": self.policy_for(case_id), "choices": choices},
+                          f, ensure_ascii=False, indent=2)
+        logger.info(f"📊 선택 기록 저장: {run_path} (커버리지 반영: {passed})")
+        return run_path
+
+    @staticmethod
+    def load_run(run_path):
+        """
+        --replay로 지정한 선택 기록 파일을 읽습니다.
+        """
+        with open(run_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def report(self):
+        """
+        차원별로 실행된 값과 실행된 조합 수를 로그로 남깁니다.
+        """
+        values = self.data["values"]
+        if not values:
+            return
+        logger.info(f"📊 옵션 커버리지: 실행된 조합 {len(self.data['combinations'])}개 (차원: {self.dimensions})")
+        for dimension in self.dimensions:
+            if dimension in values:
+                logger.info(f"  - {dimension}: {values[dimension]}")
+
+
+coverage_store = CoverageStore()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+대용량 고객/제품 테스트 데이터를 스트리밍으로 읽는 데이터 공급기입니다.
+ConfigManager.get_test_data()의 test_data.json은 사용자/고객/제품/결제 정보가 한 건뿐이므로,
+soak/매트릭스 실행처럼 수천 건의 레코드가 필요할 때 JSONL 또는 CSV 파일에서 한 줄씩 읽어 사용합니다.
+
+- 지연 읽기: 파일 전체를 메모리에 올리지 않고 한 줄씩 읽으므로 데이터 크기와 무관하게 메모리 사용량이 일정합니다.
+- 워커 분할: 병렬 실행 시 기기(워커)마다 레코드를 나눠 가지며, 분할 기준 필드(기본: 고객 휴대폰 번호)의
+  해시로 나누므로 같은 고객은 항상 같은 워커에만 배정됩니다. (병렬 기기가 같은 고객으로 동시에 주문하지 않음)
+- 이어 읽기: 다 쓴 레코드의 파일 위치(바이트 오프셋)를 reports/data_stream/<파일>_<워커>.json에 기록하여,
+  실행이 중단된 뒤 다시 시작하면 마지막으로 다 쓴 레코드 다음부터 읽습니다. (처리 중이던 레코드는 다시 읽음)
+
+CSV는 첫 줄을 헤더로 사용하며, 한 레코드가 한 줄이어야 합니다. (따옴표 안 줄바꿈 미지원)
+"""
+import csv
+import json
+import os
+import threading
+import zlib
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+class DataStream:
+    """
+    JSONL/CSV 파일의 레코드를 워커 몫만 순서대로 읽는 스트림입니다. (config.json 'DataStream')
+    for record in stream: 형태로 사용하며, 다음 레코드를 요청하는 시점에 직전 레코드를 다 쓴 것으로 기록합니다.
+    """
+
+    def __init__(self, path, worker_index=0, worker_count=1, resume=None, partition_key=None):
+        """
+        :param path: JSONL(.jsonl) 또는 CSV(.csv) 파일 경로 (상대 경로는 프로젝트 루트 기준)
+        :param worker_index: 0부터 시작하는 워커 번호
+        :param worker_count: 전체 워커 수
+        :param resume: 이전 실행의 위치부터 이어 읽을지 여부 (None이면 config.json 설정)
+        :param partition_key: 워커 분할 기준 필드 (None이면 config.json 설정, 필드가 없는 레코드는 줄 번호로 분할)
+        """
+        config_manager = ConfigManager()
+        stream_config = config_manager.config.get("DataStream", {})
+        self.path = path if os.path.isabs(path) else os.path.join(config_manager.project_root, path)
+        self.format = "csv" if self.path.lower().endswith(".csv") else "jsonl"
+        self.worker_index = worker_index
+        self.worker_count = worker_count
+        self.resume = stream_config.get("resume", True) if resume is None else resume
+        self.partition_key = partition_key or stream_config.get("partition_key", "customer_phone")
+        name = os.path.splitext(os.path.basename(self.path))[0]
+        self.progress_path = os.path.join(config_manager.project_root, 'reports', 'data_stream',
+                                          f"{name}_{worker_index + 1}of{worker_count}.json")
+        self.consumed = 0
+        self._lock = threading.Lock()
+
+    def _owns(self, record, line_number):
+        key = record.get(self.partition_key)
+        value = str(key) if key not in (None, "") else str(line_number)
+        return zlib.crc32(value.encode('utf-8')) % self.worker_count == self.worker_index
+
+    # --- 이어 읽기 위치 ---
+    def _load_progress(self):
+        if not self.resume or not os.path.exists(self.progress_path):
+            return 0, 0, 0
+        with open(self.progress_path, 'r', encoding='utf-8') as f:
+            progress = json.load(f)
+        if progress.get("size", 0) > os.path.getsize(self.path):
+            logger.warning(f"⚠️ 데이터 파일이 기록된 위치보다 작아 처음부터 읽습니다: {self.path}")
+            return 0, 0, 0
+        return progress["offset"], progress["line"], progress["consumed"]
+
+    def _save_progress(self, offset, line_number):
+        os.makedirs(os.path.dirname(self.progress_path), exist_ok=True)
+        temp_path = f"{self.progress_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"path": self.path, "offset": offset, "line": line_number, "consumed": self.consumed,
+                       "size": os.path.getsize(self.path)}, f, ensure_ascii=False)
+        # -> 기록 중 중단되어도 이전 위치 파일이 깨지지 않도록 원자적으로 교체합니다.
+        os.replace(temp_path, self.progress_path)
+
+    def reset(self):
+        """
+        기록된 위치를 지워 다음 실행에서 처음부터 읽게 합니다.
+        """
+        if os.path.exists(self.progress_path):
+            os.remove(self.progress_path)
+
+    # --- 읽기 ---
+    def _parse(self, line, header):
+        if self.format == "csv":
+            values = next(csv.reader([line]))
+            return {field: value for field, value in zip(header, values) if value != ""}
+        return json.loads(line)
+
+    def __iter__(self):
+        offset, line_number, self.consumed = self._load_progress()
+        if offset:
+            logger.info(f"⏩ 데이터 스트림 이어 읽기: {self.path} ({line_number}번째 줄 다음부터, 사용 {self.consumed}건)")
+        with open(self.path, 'rb') as f:
+            header = None
+            if self.format == "csv":
+                header = next(csv.reader([f.readline().decode('utf-8-sig')]), [])
+                line_number = max(line_number, 1)
+                offset = max(offset, f.tell())
+            f.seek(offset)
+            while True:
+                raw = f.readline()
+                if not raw:
+                    break
+                line_number += 1
+                line = raw.decode('utf-8-sig').strip()
+                if not line or line.startswith("#"):
+                    continue
+                record = self._parse(line, header)
+                if not self._owns(record, line_number):
+                    continue
+                yield dict(record, record_id=record.get("record_id") or f"line-{line_number}")
+                # -> 다음 레코드를 요청했으면 직전 레코드는 다 쓴 것으로 보고 위치를 기록합니다.
+                with self._lock:
+                    self.consumed += 1
+                    self._save_progress(f.tell(), line_number)
+        logger.info(f"🏁 데이터 스트림 끝: {self.path} (워커 {self.worker_index + 1}/{self.worker_count}, "
+                    f"사용 {self.consumed}건)")
@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+"""
+기기 상태(배터리, 발열, 저장 공간, Appium 명령 지연) 점검과 격리(quarantine)입니다.
+기기 팜에서 과열/저장 공간 부족 기기 하나가 전체를 느리게 만들고 앱 버그처럼 보이는 타임아웃을 일으키는 것을 막기 위해,
+실행 전(병렬 실행기의 기기 배정, 드라이버 초기화)과 실행 중(시나리오 단계 사이)에 기기를 점검하고,
+기준(config.json 'DeviceHealth')을 벗어난 기기는 일정 시간 실행 대상에서 제외합니다.
+점검 기록은 reports/device_health/device_health.db에 남아 느린 기기를 찾는 데 사용합니다.
+
+사용법 (프로젝트 루트에서 실행)
+    python -m utils.device_health check [기기 설정 키 ...]     # 지금 점검 (기본: config.json 'Devices')
+    python -m utils.device_health status                      # 격리 중인 기기
+    python -m utils.device_health release <기기 설정 키>        # 격리 해제
+    python -m utils.device_health slowest [--days 7]          # 기기별 명령 지연/불량 횟수 순위
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import closing
+from datetime import datetime, timedelta
+from utils.config_manager import ConfigManager
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.logger import logger
+
+
+class DeviceUnhealthy(Exception):
+    """
+    실행 중 기기 상태가 기준을 벗어났을 때 발생합니다. (앱 버그가 아닌 기기 문제임을 실패 원인으로 남김)
+    """
+
+
+class DeviceHealthMonitor:
+    """
+    [싱글턴 패턴 적용] 기기 상태를 점검하고 격리 목록을 관리하는 클래스입니다.
+    - 배터리/발열/저장 공간: adb(dumpsys battery, dumpsys thermalservice, df)로 확인 (Android, adb 없으면 확인 생략)
+    - 명령 지연: 실행 중 WebDriver 명령(command 구간) 소요 시간의 최근 중앙값
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    self.config_manager = ConfigManager()
+                    health_config = self.config_manager.config.get("DeviceHealth", {})
+                    self.enabled = health_config.get("enabled", True)
+                    self.min_battery_percent = health_config.get("min_battery_percent", 20)
+                    self.max_temperature_celsius = health_config.get("max_temperature_celsius", 42)
+                    self.max_thermal_status = health_config.get("max_thermal_status", 2)
+                    self.min_free_storage_mb = health_config.get("min_free_storage_mb", 1024)
+                    self.max_command_latency_ms = health_config.get("max_command_latency_ms", 1500)
+                    self.latency_window = health_config.get("latency_window", 30)
+                    self.check_interval = health_config.get("check_interval", 120)
+                    self.quarantine_minutes = health_config.get("quarantine_minutes", 360)
+                    self.abort_on_unhealthy = health_config.get("abort_on_unhealthy", True)
+                    health_dir = os.path.join(self.config_manager.project_root, 'reports', 'device_health')
+                    self.db_path = os.path.join(health_dir, 'device_health.db')
+                    self.quarantine_path = os.path.join(health_dir, 'quarantine.json')
+                    self.device_key = None
+                    self.latencies = deque(maxlen=self.latency_window)
+                    self._last_check = 0.0
+                    self._initialized = True
+
+    # --- 기록 ---
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS checks ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " device TEXT NOT NULL,"
+            " phase TEXT NOT NULL,"
+            " battery_percent REAL,"
+            " temperature_celsius REAL,"
+            " thermal_status INTEGER,"
+            " free_storage_mb REAL,"
+            " command_latency_ms REAL,"
+            " healthy INTEGER NOT NULL,"
+            " reasons TEXT,"
+            " checked_at TEXT NOT NULL)")
+        return connection
+
+    def _record(self, device_key, phase, reading, reasons):
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT INTO checks (device, phase, battery_percent, temperature_celsius, thermal_status,"
+                " free_storage_mb, command_latency_ms, healthy, reasons, checked_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (device_key, phase, reading.get("battery_percent"), reading.get("temperature_celsius"),
+                 reading.get("thermal_status"), reading.get("free_storage_mb"), reading.get("command_latency_ms"),
+                 0 if reasons else 1, "; ".join(reasons) or None, datetime.now().isoformat(timespec='seconds')))
+
+    # --- 격리 목록 ---
+    def _load_quarantine(self):
+        if not os.path.exists(self.quarantine_path):
+            return {}
+        with open(self.quarantine_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_quarantine(self, quarantine):
+        os.makedirs(os.path.dirname(self.quarantine_path), exist_ok=True)
+        with open(self.quarantine_path, 'w', encoding='utf-8') as f:
+            json.dump(quarantine, f, ensure_ascii=False, indent=2)
+
+    def quarantined(self, now=None):
+        """
+        격리 중인 기기 목록을 반환합니다. 격리 기간이 끝난 기기는 목록에서 제거합니다.
+        :return: {기기 설정 키: {"until": ISO 시각, "reasons": [...]}}
+        """
+        now = now or datetime.now()
+        quarantine = self._load_quarantine()
+        active = {key: entry for key, entry in quarantine.items() if datetime.fromisoformat(entry["until"]) > now}
+        if len(active) != len(quarantine):
+            self._save_quarantine(active)
+        return active
+
+    def is_quarantined(self, device_key):
+        return self.enabled and device_key in self.quarantined()
+
+    def quarantine(self, device_key, reasons):
+        quarantine = self._load_quarantine()
+        until = datetime.now() + timedelta(minutes=self.quarantine_minutes)
+        quarantine[device_key] = {"until": until.isoformat(timespec='seconds'), "reasons": reasons}
+        self._save_quarantine(quarantine)
+        logger.warning(f"🚧 기기 격리: {device_key} ({until:%m-%d %H:%M}까지) - {'; '.join(reasons)}")
+
+    def release(self, device_key):
+        quarantine = self._load_quarantine()
+        if quarantine.pop(device_key, None) is None:
+            return False
+        self._save_quarantine(quarantine)
+        logger.info(f"기기 격리 해제: {device_key}")
+        return True
+
+    # --- 점검 ---
+    @staticmethod
+    def _adb(udid, *args):
+        """
+        adb shell 명령 결과를 반환합니다. adb가 없거나 실패하면 None을 반환합니다.
+        """
+        command = ["adb"] + (["-s", udid] if udid else []) + ["shell", *args]
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=15, check=True)
+            return result.stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    def read(self, device_key):
+        """
+        기기의 배터리/온도/발열 상태/남은 저장 공간을 읽습니다. 확인할 수 없는 값은 포함하지 않습니다.
+        """
+        device_config = self.config_manager.config.get(device_key, {})
+        if str(device_config.get("platformName", "Android")).lower() != "android":
+            return {}
+        udid = device_config.get("udid")
+        reading = {}
+        battery = self._adb(udid, "dumpsys", "battery") or ""
+        level = re.search(r"^\s*level:\s*(\d+)", battery, re.MULTILINE)
+        temperature = re.search(r"^\s*temperature:\s*(\d+)", battery, re.MULTILINE)
+        if level:
+            reading["battery_percent"] = float(level.group(1))
+        if temperature:
+            # -> dumpsys battery의 온도 단위는 0.1°C입니다.
+            reading["temperature_celsius"] = int(temperature.group(1)) / 10
+        thermal = re.search(r"Thermal Status:\s*(\d+)", self._adb(udid, "dumpsys", "thermalservice") or "")
+        if thermal:
+            reading["thermal_status"] = int(thermal.group(1))
+        storage = (self._adb(udid, "df", "-k", "/data") or "").strip().splitlines()
+        if len(storage) >= 2:
+            columns = storage[-1].split()
+            if len(columns) >= 4 and columns[3].isdigit():
+                reading["free_storage_mb"] = round(int(columns[3]) / 1024, 1)
+        return reading
+
+    def command_latency_ms(self):
+        """
+        최근 WebDriver 명령 소요 시간의 중앙값(ms)을 반환합니다. 기록이 없으면 None을 반환합니다.
+        """
+        if not self.latencies:
+            return None
+        return round(statistics.median(self.latencies) * 1000, 1)
+
+    def evaluate(self, reading):
+        """
+        기준을 벗어난 항목의 사유 목록을 반환합니다. (빈 목록이면 정상)
+        """
+        reasons = []
+        checks = (
+            ("battery_percent", lambda v: v < self.min_battery_percent, f"배터리 {{:g}}% < {self.min_battery_percent}%"),
+            ("temperature_celsius", lambda v: v > self.max_temperature_celsius,
+             f"온도 {{:g}}°C > {self.max_temperature_celsius}°C"),
+            ("thermal_status", lambda v: v > self.max_thermal_status, f"발열 상태 {{}} > {self.max_thermal_status}"),
+            ("free_storage_mb", lambda v: v < self.min_free_storage_mb,
+             f"저장 공간 {{:g}}MB < {self.min_free_storage_mb}MB"),
+            ("command_latency_ms", lambda v: v > self.max_command_latency_ms,
+             f"명령 지연 {{:g}}ms > {self.max_command_latency_ms}ms"),
+        )
+        for field, is_bad, message in checks:
+            value = reading.get(field)
+            if value is not None and is_bad(value):
+                reasons.append(message.format(value))
+        return reasons
+
+    def check(self, device_key, phase="preflight", latency_ms=None):
+        """
+        기기를 점검하고 기록합니다. 기준을 벗어나면 격리합니다.
+        :param phase: 'preflight'(실행 전) / 'run'(실행 중)
+        :return: 기준을 벗어난 사유 목록 (빈 목록이면 정상)
+        """
+        reading = self.read(device_key)
+        if latency_ms is not None:
+            reading["command_latency_ms"] = latency_ms
+        reasons = self.evaluate(reading)
+        self._record(device_key, phase, reading, reasons)
+        if reasons:
+            self.quarantine(device_key, reasons)
+        else:
+            logger.info(f"🩺 기기 상태 정상: {device_key} {reading}")
+        return reasons
+
+    def available(self, devices):
+        """
+        격리 중이거나 실행 전 점검에서 기준을 벗어난 기기를 제외한 기기 목록을 반환합니다. (병렬 실행기의 배정 대상)
+        """
+        if not self.enabled:
+            return list(devices)
+        quarantined = self.quarantined()
+        healthy = []
+        for device_key in devices:
+            if device_key in quarantined:
+                logger.warning(f"🚧 격리 중인 기기 제외: {device_key} ({quarantined[device_key]['until']}까지)")
+            elif not self.check(device_key):
+                healthy.append(device_key)
+        return healthy
+
+    # --- 실행 중 점검 ---
+    def on_span(self, span):
+        if span.category == SpanCategory.COMMAND:
+            self.latencies.append(span.duration)
+
+    def start(self, device_key):
+        """
+        드라이버 초기화 직후 호출합니다. 이 기기의 명령 지연 측정을 시작합니다.
+        """
+        if not self.enabled:
+            return
+        self.device_key = device_key
+        self.latencies.clear()
+        self._last_check = time.monotonic()
+        instrumentation.add_listener(self.on_span)
+
+    def stop(self):
+        """
+        드라이버 종료 시 호출합니다. 측정한 명령 지연을 기록에 남기고 측정을 멈춥니다.
+        """
+        if self.device_key is None:
+            return
+        instrumentation.remove_listener(self.on_span)
+        latency_ms = self.command_latency_ms()
+        if latency_ms is not None:
+            reasons = self.evaluate({"command_latency_ms": latency_ms})
+            self._record(self.device_key, "session", {"command_latency_ms": latency_ms}, reasons)
+            if reasons:
+                self.quarantine(self.device_key, reasons)
+        self.device_key = None
+
+    def checkpoint(self):
+        """
+        시나리오 단계 사이에 호출합니다. check_interval마다 기기를 다시 점검하고,
+        기준을 벗어나면 기기를 격리한 뒤 DeviceUnhealthy로 시나리오를 중단합니다. (abort_on_unhealthy=false면 경고만)
+        """
+        if self.device_key is None or time.monotonic() - self._last_check < self.check_interval:
+            return
+        self._last_check = time.monotonic()
+        reasons = self.check(self.device_key, phase="run", latency_ms=self.command_latency_ms())
+        if reasons and self.abort_on_unhealthy:
+            raise DeviceUnhealthy(f"기기 상태 불량으로 시나리오를 중단합니다: {self.device_key} - {'; '.join(reasons)}")
+
+    # --- 조회 ---
+    def slowest(self, days=7, now=None):
+        """
+        최근 days일 동안 기기별 평균 명령 지연과 불량 판정 횟수를 반환합니다. (명령 지연이 큰 순)
+        """
+        since = ((now or datetime.now()) - timedelta(days=days)).isoformat(timespec='seconds')
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT device, AVG(command_latency_ms), SUM(1 - healthy), COUNT(*) FROM checks"
+                " WHERE checked_at >= ? GROUP BY device ORDER BY AVG(command_latency_ms) DESC",
+                (since,)).fetchall()
+        return [{"device": device, "avg_latency_ms": round(latency, 1) if latency is not None else None,
+                 "unhealthy": unhealthy, "checks": checks} for device, latency, unhealthy, checks in rows]
+
+
+device_health = DeviceHealthMonitor()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기기 상태 점검/격리 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    check_parser = subparsers.add_parser("check", help="기기 상태를 지금 점검")
+    check_parser.add_argument("devices", nargs="*", help="기기 설정 키 (기본: config.json 'Devices')")
+    subparsers.add_parser("status", help="격리 중인 기기 목록")
+    release_parser = subparsers.add_parser("release", help="기기 격리 해제")
+    release_parser.add_argument("device")
+    slowest_parser = subparsers.add_parser("slowest", help="기기별 명령 지연/불량 판정 순위")
+    slowest_parser.add_argument("--days", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    if args.command == "check":
+        devices = args.devices or device_health.config_manager.config.get("Devices", ["Capabilities_Android"])
+        healthy = [device_key for device_key in devices if not device_health.check(device_key)]
+        print(f"정상 {len(healthy)}/{len(devices)}: {', '.join(healthy) or '-'}")
+        return 0 if len(healthy) == len(devices) else 1
+    if args.command == "status":
+        quarantined = device_health.quarantined()
+        for device_key, entry in quarantined.items():
+            print(f"{device_key}\t{entry['until']}까지\t{'; '.join(entry['reasons'])}")
+        if not quarantined:
+            print("격리 중인 기기가 없습니다.")
+        return 0
+    if args.command == "release":
+        return 0 if device_health.release(args.device) else 1
+    for row in device_health.slowest(args.days):
+        latency = f"{row['avg_latency_ms']:.0f}ms" if row["avg_latency_ms"] is not None else "-"
+        print(f"{row['device']}\t평균 명령 지연 {latency}\t불량 {row['unhealthy']}/{row['checks']}회")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import threading
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+class EvidencePolicy:
+    """
+    실패 증거(스크린샷) 수집 정책 상수입니다.
+    - IMMEDIATE : 필수 요소 조회가 실패하는 즉시 스크린샷을 저장합니다. (기존 동작)
+    - DEFERRED  : 실패 지점만 기록해 두고, 테스트가 실제로 실패했을 때 한 번만 저장합니다.
+    - OFF       : 스크린샷을 저장하지 않습니다.
+    Probe(선택 요소) 조회는 정책과 상관없이 증거를 수집하지 않습니다.
+    """
+    IMMEDIATE = "immediate"
+    DEFERRED = "deferred"
+    OFF = "off"
+
+    ALL = (IMMEDIATE, DEFERRED, OFF)
+
+
+class EvidenceCollector:
+    """
+    [싱글턴 패턴 적용] 실패 증거 수집 정책을 관리하는 클래스입니다.
+    DEFERRED 정책일 때는 실패 요청을 메모리에 쌓아 두었다가, conftest의 리포트 훅에서
+    테스트 실패가 확정된 경우에만 flush()로 스크린샷을 한 번 저장합니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    evidence_config = ConfigManager().config.get("Evidence", {})
+                    self.policy = EvidencePolicy.IMMEDIATE
+                    self.set_policy(evidence_config.get("policy", EvidencePolicy.IMMEDIATE))
+                    self._pending = []
+                    self._initialized = True
+
+    def set_policy(self, policy):
+        """
+        증거 수집 정책을 변경합니다. (pytest --evidence 옵션에서 호출)
+        """
+        if not policy:
+            return
+        policy = policy.lower()
+        if policy not in EvidencePolicy.ALL:
+            raise ValueError(f"지원하지 않는 증거 수집 정책입니다: {policy} (허용 값: {EvidencePolicy.ALL})")
+        self.policy = policy
+
+    def capture(self, page, name):
+        """
+        정책에 따라 즉시 스크린샷을 저장하거나, 나중에 저장하도록 요청을 기록합니다.
+        :param page: take_screenshot()을 가진 페이지 객체 (BasePage)
+        :param name: 스크린샷 파일 이름 접두어
+        """
+        if self.policy == EvidencePolicy.IMMEDIATE:
+            page.take_screenshot(name)
+        elif self.policy == EvidencePolicy.DEFERRED:
+            with self._lock:
+                self._pending.append((page, name))
+            logger.info(f"증거 수집 보류(deferred): {name}")
+
+    def flush(self):
+        """
+        테스트가 실패했을 때 보류된 요청 중 가장 마지막 요청으로 스크린샷을 한 번만 저장합니다.
+        (마지막 요청이 실패 직전의 화면에 가장 가깝습니다.)
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        page, name = pending[-1]
+        logger.info(f"테스트 실패로 보류된 증거를 수집합니다. (보류 {len(pending)}건 중 마지막: {name})")
+        page.take_screenshot(name)
+
+    def discard(self):
+        """
+        테스트가 성공했거나 종료되었을 때 보류된 요청을 버립니다.
+        """
+        with self._lock:
+            self._pending = []
+
+
+evidence_collector = EvidenceCollector()
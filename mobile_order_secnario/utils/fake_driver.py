@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+기기/Appium 서버 없이 정적인 화면 계층(XML) 픽스처 위에서 동작하는 가짜 드라이버입니다. (HTTP 통신 없음)
+find_element(s), 텍스트/속성 조회, 클릭, 입력, 스와이프, 뒤로 가기, 화면 크기, 스크린샷, page_source를 지원하며
+locators/*.json의 XPath는 utils/local_xpath.py로 로컬에서 평가합니다.
+페이지 객체 단위 테스트나 BasePage 오버헤드 측정(마이크로 벤치마크)을 수 초 안에 실행하는 용도입니다.
+
+픽스처 구성 (tests/fixtures/ui/<이름>/)
+    <화면>.xml          Appium page_source 형식의 화면 계층 (예: uiautomator 덤프)
+    transitions.json    {
+                          "start": "login",
+                          "window": {"width": 1080, "height": 2400},
+                          "transitions": {
+                            "login": [{"click": "//android.widget.Button[@text='로그인']", "to": "main"}],
+                            "order_status": [{"back": true, "to": "mobile_order_home"}],
+                            "step3_discount": [{"swipe": "up", "to": "step3_discount_bottom"}]
+                          }
+                        }
+    - click: 클릭한 요소가 이 XPath의 결과에 포함되면 to 화면으로 전환
+    - swipe: 손가락 이동 방향(up/down/left/right)이 같으면 to 화면으로 전환
+    - back: 뒤로 가기(driver.back())를 누르면 to 화면으로 전환 (선언이 없으면 직전에 방문한 화면으로 돌아감)
+    화면이 바뀌면 이전 화면에서 찾은 요소는 stale 상태가 됩니다. (실기기와 동일하게 StaleElementReferenceException)
+
+사용법
+    pytest -k test_full_order_scenario --fake-driver <픽스처 이름>
+    driver, platform = fake_appium_driver("<픽스처 이름>")     # 페이지 객체 단위 테스트에서 직접 사용
+"""
+import base64
+import json
+import os
+import struct
+import xml.etree.ElementTree as ET
+import zlib
+from functools import lru_cache
+from appium import webdriver
+from appium.options.common import AppiumOptions
+from appium.webdriver.appium_connection import AppiumConnection
+from appium.webdriver.common.appiumby import AppiumBy
+from appium.webdriver.mobilecommand import MobileCommand
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.command import Command
+from utils import local_xpath
+from utils.config_manager import ConfigManager
+from utils.instrumentation import instrumentation
+from utils.logger import logger
+
+# -> W3C 응답에서 요소 참조를 나타내는 키
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+DEFAULT_WINDOW = {"width": 1080, "height": 2400}
+# -> 화면 계층에서 요소 텍스트로 사용하는 속성 (Android: text, iOS: label/value)
+_TEXT_ATTRIBUTES = ("text", "label", "value")
+
+
+def fixture_dir(name):
+    """
+    픽스처 이름을 디렉토리 경로로 변환합니다. (경로가 주어지면 그대로 사용)
+    """
+    if os.sep in name or os.path.isdir(name):
+        return name
+    return os.path.join(ConfigManager().project_root, 'tests', 'fixtures', 'ui', name)
+
+
+@lru_cache(maxsize=8)
+def _blank_png(width, height):
+    """
+    화면 크기의 빈(흰색) 흑백 PNG를 base64 문자열로 만듭니다.
+    """
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    rows = (b"\x00" + b"\xff" * width) * height
+    png = b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b"")
+    return base64.b64encode(png).decode('ascii')
+
+
+def _bounds(element):
+    """
+    Android bounds 속성 '[x1,y1][x2,y2]' 또는 iOS x/y/width/height 속성을 rect dict로 변환합니다.
+    """
+    bounds = element.get("bounds")
+    if bounds:
+        x1, y1, x2, y2 = (int(value) for value in bounds.replace("][", ",").strip("[]").split(","))
+        return {"x": x1, "y": y1, "width": x2 - x1, "height": y2 - y1}
+    return {key: int(element.get(key, 0)) for key in ("x", "y", "width", "height")}
+
+
+class _CommandError(Exception):
+    """
+    W3C 오류 응답으로 변환할 명령 처리 오류입니다. (error: 'no such element', 'stale element reference' 등)
+    """
+
+    def __init__(self, error, message):
+        super().__init__(message)
+        self.error = error
+
+
+class FakeConnection(AppiumConnection):
+    """
+    Appium 서버 대신 현재 화면의 XML 계층으로 명령에 응답하는 command_executor입니다.
+    실제 Appium 드라이버(webdriver.Remote)와 WebElement를 그대로 사용하므로 페이지 객체/WebDriverWait 코드가 수정 없이 동작합니다.
+    """
+
+    def __init__(self, fixture_path, start_screen=None, platform_name="Android"):
+        # -> 서버 주소는 client_config로 지정합니다. (remote_server_addr 인자는 Selenium에서 deprecated, 실제 연결 없음)
+        super().__init__(client_config=ClientConfig(remote_server_addr="http://127.0.0.1:4723"))
+        self.fixture_path = fixture_path
+        self.platform_name = platform_name
+        spec_path = os.path.join(fixture_path, "transitions.json")
+        spec = {}
+        if os.path.exists(spec_path):
+            with open(spec_path, 'r', encoding='utf-8') as f:
+                spec = json.load(f)
+        self.window = dict(DEFAULT_WINDOW, **spec.get("window", {}))
+        self.transitions = spec.get("transitions", {})
+        self._sources = {}
+        self.generation = 0
+        self.screen = None
+        # -> 검증용 기록: 방문한 화면 순서, 클릭/입력/스와이프/뒤로 가기 동작
+        self.visited = []
+        # -> 뒤로 가기용 화면 이력 (back 전환 선언이 없는 화면에서 사용)
+        self.history = []
+        self.actions = []
+        self.go_to(start_screen or spec.get("start") or self._first_screen())
+
+    def _first_screen(self):
+        screens = sorted(name[:-4] for name in os.listdir(self.fixture_path) if name.endswith(".xml"))
+        if not screens:
+            raise FileNotFoundError(f"화면 계층(XML) 픽스처가 없습니다: {self.fixture_path}")
+        return screens[0]
+
+    def go_to(self, screen):
+        """
+        화면을 전환합니다. 화면 계층을 새로 읽으므로 이전 화면의 입력값과 요소 참조는 사라집니다.
+        """
+        if screen not in self._sources:
+            with open(os.path.join(self.fixture_path, f"{screen}.xml"), 'rb') as f:
+                self._sources[screen] = f.read()
+        self.root = ET.fromstring(self._sources[screen])
+        self.document = local_xpath.prepare(self.root)
+        self.elements = list(self.root.iter())
+        self.element_ids = {element: index for index, element in enumerate(self.elements)}
+        self.generation += 1
+        self.screen = screen
+        self.visited.append(screen)
+        self.history.append(screen)
+        logger.debug(f"🧪 가짜 드라이버 화면 전환: {screen}")
+
+    # --- 요소 조회 ---
+    def _reference(self, element):
+        return {ELEMENT_KEY: f"{self.generation}.{self.element_ids[element]}"}
+
+    def _element(self, element_id):
+        generation, _, index = str(element_id).partition(".")
+        if generation != str(self.generation):
+            raise _CommandError("stale element reference",
+                                f"요소 {element_id}는 이전 화면의 요소입니다. (현재 화면: {self.screen})")
+        return self.elements[int(index)]
+
+    def _find(self, using, value, context=None):
+        if using == AppiumBy.XPATH:
+            try:
+                return local_xpath.select(self.root, value, context, self.document)
+            except local_xpath.XPathError as e:
+                raise _CommandError("invalid selector", str(e))
+        scope = list(context.iter())[1:] if context is not None else self.elements
+        if using == AppiumBy.ID:
+            return [element for element in scope
+                    if element.get("resource-id") == value or (element.get("resource-id") or "").endswith(f":id/{value}")]
+        if using == AppiumBy.ACCESSIBILITY_ID:
+            return [element for element in scope if value in (element.get("content-desc"), element.get("name"))]
+        if using == AppiumBy.CLASS_NAME:
+            return [element for element in scope if element.tag == value]
+        raise _CommandError("invalid selector", f"가짜 드라이버가 지원하지 않는 로케이터 전략입니다: {using}")
+
+    def _find_one(self, using, value, context=None):
+        found = self._find(using, value, context)
+        if not found:
+            raise _CommandError("no such element",
+                                f"화면 '{self.screen}'에서 요소를 찾을 수 없습니다: {using}={value}")
+        return self._reference(found[0])
+
+    # --- 동작 ---
+    def _matches_transition(self, element, transition):
+        try:
+            return element in local_xpath.select(self.root, transition["click"], document=self.document)
+        except local_xpath.XPathError as e:
+            raise _CommandError("invalid selector", f"transitions.json의 XPath 오류: {e}")
+
+    def _click(self, element):
+        self.actions.append(("click", self.screen, element.get("text") or element.get("resource-id") or element.tag))
+        if element.get("enabled") == "false":
+            return
+        for transition in self.transitions.get(self.screen, []):
+            if "click" in transition and self._matches_transition(element, transition):
+                self.go_to(transition["to"])
+                return
+
+    def _send_keys(self, element, text):
+        self.actions.append(("send_keys", self.screen, text))
+        element.set("text", (element.get("text") or "") + text)
+
+    def _back(self):
+        self.actions.append(("back", self.screen, None))
+        for transition in self.transitions.get(self.screen, []):
+            if transition.get("back"):
+                self.go_to(transition["to"])
+                return
+        if len(self.history) > 1:
+            self.history.pop()
+            self.go_to(self.history.pop())
+
+    def _perform_actions(self, actions):
+        """
+        W3C 포인터 동작(스와이프)에서 시작/끝 좌표를 구해 방향을 판정하고, 해당 방향의 전환이 있으면 적용합니다.
+        """
+        moves = [(action["x"], action["y"]) for source in actions for action in source.get("actions", [])
+                 if action.get("type") == "pointerMove" and "x" in action]
+        if len(moves) < 2:
+            return
+        (start_x, start_y), (end_x, end_y) = moves[0], moves[-1]
+        dx, dy = end_x - start_x, end_y - start_y
+        if abs(dy) >= abs(dx):
+            direction = "up" if dy < 0 else "down"
+        else:
+            direction = "left" if dx < 0 else "right"
+        self.actions.append(("swipe", self.screen, direction))
+        for transition in self.transitions.get(self.screen, []):
+            if transition.get("swipe") == direction:
+                self.go_to(transition["to"])
+                return
+
+    # --- 명령 처리 ---
+    def _handle(self, command, params):
+        if command == Command.NEW_SESSION:
+            return {"sessionId": "fake-session", "capabilities": {"platformName": self.platform_name}}
+        if command in (Command.QUIT, Command.W3C_CLEAR_ACTIONS):
+            return None
+        if command in (Command.FIND_ELEMENT, Command.FIND_ELEMENTS):
+            if command == Command.FIND_ELEMENT:
+                return self._find_one(params["using"], params["value"])
+            return [self._reference(element) for element in self._find(params["using"], params["value"])]
+        if command in (Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS):
+            context = self._element(params["id"])
+            if command == Command.FIND_CHILD_ELEMENT:
+                return self._find_one(params["using"], params["value"], context)
+            return [self._reference(element) for element in self._find(params["using"], params["value"], context)]
+        if command == Command.GET_PAGE_SOURCE:
+            return "<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>" + ET.tostring(self.root, encoding="unicode")
+        if command == Command.GET_WINDOW_RECT:
+            return dict(self.window, x=0, y=0)
+        if command == Command.SCREENSHOT:
+            return _blank_png(self.window["width"], self.window["height"])
+        if command == Command.W3C_ACTIONS:
+            return self._perform_actions(params.get("actions", []))
+        if command == Command.GO_BACK:
+            return self._back()
+        if command == MobileCommand.GET_CURRENT_CONTEXT:
+            return "NATIVE_APP"
+        if command == Command.W3C_EXECUTE_SCRIPT:
+            # -> mobile: hideKeyboard 등 기기 동작은 무시하고, 현재 Activity는 화면 계층 루트의 activity 속성으로 응답합니다.
+            if params.get("script") == "mobile: getCurrentActivity":
+                return self.root.get("activity", "")
+            return None
+
+        element = self._element(params.get("id"))
+        if command == Command.CLICK_ELEMENT:
+            return self._click(element)
+        if command == Command.SEND_KEYS_TO_ELEMENT:
+            return self._send_keys(element, params.get("text") or "".join(params.get("value", [])))
+        if command in (Command.CLEAR_ELEMENT, MobileCommand.CLEAR):
+            element.set("text", "")
+            return None
+        if command == Command.GET_ELEMENT_TEXT:
+            return next((element.get(attr) for attr in _TEXT_ATTRIBUTES if element.get(attr)), "")
+        if command in (Command.GET_ELEMENT_ATTRIBUTE, Command.GET_ELEMENT_PROPERTY):
+            return element.get(params["name"])
+        if command == Command.GET_ELEMENT_TAG_NAME:
+            return element.tag
+        if command == Command.GET_ELEMENT_RECT:
+            return _bounds(element)
+        if command == MobileCommand.IS_ELEMENT_DISPLAYED:
+            return element.get("displayed", "true") != "false"
+        if command == Command.IS_ELEMENT_ENABLED:
+            return element.get("enabled", "true") != "false"
+        if command == Command.IS_ELEMENT_SELECTED:
+            return element.get("selected") == "true"
+        if command == Command.ELEMENT_SCREENSHOT:
+            rect = _bounds(element)
+            return _blank_png(max(rect["width"], 1), max(rect["height"], 1))
+        raise _CommandError("unknown command", f"가짜 드라이버가 지원하지 않는 명령입니다: {command}")
+
+    def execute(self, command, params):
+        try:
+            return {"value": self._handle(command, params or {})}
+        except _CommandError as e:
+            # -> 실제 Appium 서버와 같은 W3C 오류 응답 형식으로 반환하여 Selenium이 해당 예외로 변환하게 합니다.
+            return {"status": 404 if e.error == "no such element" else 500,
+                    "value": json.dumps({"value": {"error": e.error, "message": str(e), "stacktrace": ""}},
+                                        ensure_ascii=False)}
+
+
+def fake_appium_driver(name, start_screen=None, platform_name="Android"):
+    """
+    픽스처 화면 계층 위에서 동작하는 가짜 드라이버를 만듭니다.
+    :return: (가짜 드라이버, 플랫폼 이름) - 화면 상태는 driver.command_executor(FakeConnection)에서 확인합니다.
+    """
+    connection = FakeConnection(fixture_dir(name), start_screen, platform_name)
+    options = AppiumOptions().load_capabilities({"platformName": platform_name})
+    driver = webdriver.Remote(connection, options=options)
+    logger.info(f"🧪 가짜 드라이버 시작: {connection.fixture_path} (시작 화면: {connection.screen})")
+    return instrumentation.instrument_driver(driver), platform_name
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from utils.logger import logger
+
+
+class SpanCategory:
+    """
+    측정 구간(span)의 종류입니다.
+    """
+    TEST = "test"               # pytest 테스트 1건
+    STEP = "step"               # 시나리오 단계 (ScenarioRunner)
+    PAGE = "page"               # 페이지 객체의 public 메서드 (예: ProductSelectionPage.containing_goods)
+    PRIMITIVE = "primitive"     # BasePage 공통 메서드 (예: BasePage.wait_and_click)
+    COMMAND = "command"         # WebDriver 명령 1건 (driver.execute)
+    SLEEP = "sleep"             # 고정 sleep (short_sleep/medium_sleep/long_sleep)
+    WAIT = "wait"               # 조건 대기 (WebDriverWait, 화면/UI 안정화 대기)
+    SCREENSHOT = "screenshot"   # 스크린샷 저장
+
+
+class Span:
+    """
+    측정 구간 하나입니다. 부모 구간(parent)을 따라가면 어떤 단계/페이지 메서드 안에서 발생했는지 알 수 있습니다.
+    """
+
+    def __init__(self, name, category, parent=None, attrs=None):
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.attrs = dict(attrs or {})
+        self.thread_id = threading.get_ident()
+        self.start = time.perf_counter()
+        self.end = None
+
+    @property
+    def duration(self):
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def ancestor(self, category):
+        """
+        자기 자신을 포함하여 가장 가까운 category 구간을 반환합니다. 없으면 None을 반환합니다.
+        """
+        span = self
+        while span is not None:
+            if span.category == category:
+                return span
+            span = span.parent
+        return None
+
+
+class Instrumentation:
+    """
+    [싱글턴 패턴 적용] 테스트 실행 중 발생하는 구간(span)을 측정하여 등록된 리스너에게 전달하는 클래스입니다.
+    - 테스트: conftest.py가 테스트 1건을 test 구간으로 엽니다.
+    - 시나리오 단계: ScenarioRunner가 step 구간을 엽니다.
+    - 페이지 메서드: BasePage를 상속한 페이지 클래스의 public 메서드가 자동으로 page 구간이 됩니다.
+      BasePage 자신의 public 메서드는 primitive 구간입니다.
+    - 대기/sleep/스크린샷: WaitBudget과 BasePage.take_screenshot이 wait/sleep/screenshot 구간을 엽니다.
+    - WebDriver 명령: instrument_driver()로 감싼 드라이버의 모든 명령이 command 구간이 됩니다.
+    리스너는 listener(span) 형태로 구간이 끝날 때마다 호출됩니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    self.listeners = []
+                    self._local = threading.local()
+                    # -> 종류별로 가장 최근에 열린 구간 (다른 스레드에서 현재 단계를 확인할 때 사용)
+                    self._active = {}
+                    self._initialized = True
+
+    def add_listener(self, listener):
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def current(self):
+        """
+        현재 스레드에서 열려 있는 가장 안쪽 구간을 반환합니다.
+        """
+        return getattr(self._local, 'current', None)
+
+    def active(self, category):
+        """
+        스레드와 관계없이 현재 열려 있는 가장 최근의 category 구간을 반환합니다.
+        (예: 백그라운드 샘플러가 지금 실행 중인 시나리오 단계를 확인)
+        """
+        return self._active.get(category)
+
+    @contextmanager
+    def span(self, name, category, **attrs):
+        """
+        with instrumentation.span("이름", SpanCategory.STEP): 형태로 구간을 측정합니다.
+        구간 안에서 예외가 발생하면 attrs['error']에 예외 이름을 남깁니다.
+        """
+        parent = self.current()
+        span = Span(name, category, parent, attrs)
+        self._local.current = span
+        previous_active = self._active.get(category)
+        self._active[category] = span
+        try:
+            yield span
+        except BaseException as e:
+            span.attrs['error'] = type(e).__name__
+            raise
+        finally:
+            span.end = time.perf_counter()
+            self._local.current = parent
+            self._active[category] = previous_active
+            for listener in list(self.listeners):
+                try:
+                    listener(span)
+                except Exception as e:
+                    logger.warning(f"⚠️ 측정 리스너 처리 실패: {e}")
+
+    def instrument_driver(self, driver):
+        """
+        드라이버의 execute를 감싸 모든 WebDriver 명령을 command 구간으로 측정합니다. (중복 적용 안 함)
+        """
+        if getattr(driver, '_instrumented', False):
+            return driver
+        original_execute = driver.execute
+
+        @functools.wraps(original_execute)
+        def execute(driver_command, params=None):
+            with self.span(driver_command, SpanCategory.COMMAND):
+                return original_execute(driver_command, params)
+
+        driver.execute = execute
+        driver._instrumented = True
+        return driver
+
+    def trace_method(self, func, name, category):
+        """
+        함수 호출을 category 구간으로 측정하도록 감싼 함수를 반환합니다.
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.span(name, category):
+                return func(*args, **kwargs)
+
+        wrapper._traced = True
+        return wrapper
+
+    def trace_class_methods(self, cls, category):
+        """
+        클래스에 직접 정의된 public 메서드를 모두 '클래스명.메서드명' 구간으로 측정하도록 교체합니다.
+        """
+        for attr_name, attr in list(vars(cls).items()):
+            if attr_name.startswith('_') or not callable(attr) or getattr(attr, '_traced', False):
+                continue
+            if isinstance(attr, (staticmethod, classmethod, type)):
+                continue
+            setattr(cls, attr_name, self.trace_method(attr, f"{cls.__name__}.{attr_name}", category))
+
+
+instrumentation = Instrumentation()
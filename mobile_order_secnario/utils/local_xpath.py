@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+"""
+xml.etree.ElementTree 화면 계층에서 locators/*.json의 XPath를 평가하는 작은 XPath 1.0 평가기입니다. (lxml 불필요)
+가짜 드라이버(utils/fake_driver.py)가 기기 없이 로케이터를 찾을 때 사용합니다.
+
+지원 범위 (locators/*.json에서 사용하는 문법)
+- 경로: /, //, ., .., *, (경로)[n], 축(child, descendant, descendant-or-self, parent, ancestor, self,
+  following-sibling, preceding-sibling)
+- 조건: [@속성='값'], [n], [경로], and, or, =, !=, 괄호
+- 함수: contains(), starts-with(), normalize-space(), text(), not(), string()
+
+그 외 함수(last(), count(), position() 등)와 축은 compile_xpath() 단계에서 XPathError(ValueError)를 발생시킵니다.
+조용히 빈 결과를 반환하지 않으므로, 로케이터에 새 문법을 쓰면 가짜 드라이버 테스트가 'invalid selector'로 바로 실패합니다.
+"""
+import re
+import xml.etree.ElementTree as ET
+
+
+class XPathError(ValueError):
+    """
+    지원하지 않거나 잘못된 XPath 식일 때 발생합니다.
+    """
+
+
+_TOKEN_PATTERN = re.compile(r"""\s*(?:
+    (?P<op>//|::|!=|\.\.|[/()\[\]@,=|*.])
+    |(?P<string>'[^']*'|"[^"]*")
+    |(?P<number>\d+(?:\.\d+)?)
+    |(?P<name>[A-Za-z_][\w.\-]*)
+)""", re.VERBOSE)
+
+_AXES = {"child", "descendant", "descendant-or-self", "parent", "ancestor", "self",
+         "following-sibling", "preceding-sibling", "attribute"}
+_FUNCTIONS = {"contains", "starts-with", "normalize-space", "not", "string"}
+# -> '//'는 '/descendant-or-self::node()/'의 축약입니다.
+_DESCENDANT_OR_SELF = ("descendant-or-self", None, [])
+
+
+def _tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _TOKEN_PATTERN.match(expression, position)
+        if not match or match.end() == position:
+            raise XPathError(f"해석할 수 없는 XPath 문자: {expression[position:]!r} (식: {expression})")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "string":
+            value = value[1:-1]
+        elif kind == "number":
+            value = float(value)
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """
+    토큰 목록을 AST(튜플)로 변환합니다.
+    """
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.index = 0
+
+    def peek(self, offset=0):
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def accept(self, value, kind="op"):
+        if self.peek() == (kind, value):
+            self.index += 1
+            return True
+        return False
+
+    def expect(self, value):
+        if not self.accept(value):
+            raise XPathError(f"'{value}'가 필요합니다. (위치 {self.index}, 식: {self.expression})")
+
+    def parse(self):
+        node = self.parse_or()
+        if self.index != len(self.tokens):
+            raise XPathError(f"해석하지 못한 XPath 토큰: {self.tokens[self.index:]} (식: {self.expression})")
+        return node
+
+    def parse_or(self):
+        node = self.parse_and()
+        while self.accept("or", "name"):
+            node = ("or", node, self.parse_and())
+        return node
+
+    def parse_and(self):
+        node = self.parse_comparison()
+        while self.accept("and", "name"):
+            node = ("and", node, self.parse_comparison())
+        return node
+
+    def parse_comparison(self):
+        node = self.parse_union()
+        for op in ("=", "!="):
+            if self.accept(op):
+                return ("compare", op, node, self.parse_union())
+        return node
+
+    def parse_union(self):
+        node = self.parse_primary()
+        while self.accept("|"):
+            node = ("union", node, self.parse_primary())
+        return node
+
+    def parse_primary(self):
+        kind, value = self.peek()
+        if (kind, value) == ("op", "("):
+            self.index += 1
+            inner = self.parse_or()
+            self.expect(")")
+            predicates = self.parse_predicates()
+            node = ("filter", inner, predicates) if predicates else inner
+            if self.accept("//"):
+                return ("path", node, self.parse_steps([_DESCENDANT_OR_SELF]))
+            if self.accept("/"):
+                return ("path", node, self.parse_steps([]))
+            return node
+        if kind == "string":
+            self.index += 1
+            return ("literal", value)
+        if kind == "number":
+            self.index += 1
+            return ("number", value)
+        if kind == "name" and self.peek(1) == ("op", "(") and value in _FUNCTIONS:
+            return self.parse_call()
+        if kind == "name" and self.peek(1) == ("op", "(") and value not in ("text", "node"):
+            raise XPathError(f"지원하지 않는 XPath 함수: {value}() (식: {self.expression})")
+        return self.parse_path()
+
+    def parse_call(self):
+        _, name = self.peek()
+        self.index += 2
+        args = []
+        if not self.accept(")"):
+            args.append(self.parse_or())
+            while self.accept(","):
+                args.append(self.parse_or())
+            self.expect(")")
+        return ("call", name, args)
+
+    def parse_predicates(self):
+        predicates = []
+        while self.accept("["):
+            predicates.append(self.parse_or())
+            self.expect("]")
+        return predicates
+
+    def at_step(self):
+        kind, value = self.peek()
+        return kind == "name" or (kind, value) in (("op", "*"), ("op", "."), ("op", ".."), ("op", "@"))
+
+    def parse_path(self):
+        if self.accept("//"):
+            return ("path", ("root",), self.parse_steps([_DESCENDANT_OR_SELF]))
+        if self.accept("/"):
+            return ("path", ("root",), self.parse_steps([]) if self.at_step() else [])
+        return ("path", ("context",), self.parse_steps([]))
+
+    def parse_steps(self, steps):
+        steps.append(self.parse_step())
+        while True:
+            if self.accept("//"):
+                steps.append(_DESCENDANT_OR_SELF)
+            elif not self.accept("/"):
+                return steps
+            steps.append(self.parse_step())
+
+    def parse_step(self):
+        if self.accept("."):
+            return ("self", None, [])
+        if self.accept(".."):
+            return ("parent", None, [])
+        axis = "child"
+        if self.accept("@"):
+            axis = "attribute"
+        elif self.peek()[0] == "name" and self.peek(1) == ("op", "::"):
+            axis = self.peek()[1]
+            if axis not in _AXES:
+                raise XPathError(f"지원하지 않는 XPath 축: {axis} (식: {self.expression})")
+            self.index += 2
+        kind, value = self.peek()
+        if (kind, value) == ("op", "*"):
+            self.index += 1
+            node_test = None
+        elif kind == "name":
+            if self.peek(1) == ("op", "(") and value not in ("text", "node"):
+                raise XPathError(f"지원하지 않는 XPath 함수: {value}() (식: {self.expression})")
+            self.index += 1
+            node_test = value
+            if value in ("text", "node") and self.accept("("):
+                self.expect(")")
+                node_test = f"{value}()"
+        else:
+            raise XPathError(f"노드 이름이 필요합니다. (위치 {self.index}, 식: {self.expression})")
+        if node_test == "node()":
+            node_test = None
+        return (axis, node_test, self.parse_predicates())
+
+
+class _Document:
+    """
+    평가 대상 문서입니다. ElementTree에는 부모 참조가 없으므로 부모/문서 순서 표를 미리 만듭니다.
+    """
+
+    def __init__(self, root):
+        self.root = ET.Element("#document")
+        self.root.append(root)
+        self.parents = {child: parent for parent in self.root.iter() for child in parent}
+        self.order = {element: index for index, element in enumerate(self.root.iter())}
+
+    def parent(self, element):
+        return self.parents.get(element)
+
+    def children(self, element):
+        return list(element)
+
+    def siblings(self, element):
+        parent = self.parent(element)
+        return list(parent) if parent is not None else [element]
+
+    def axis(self, element, axis):
+        if axis == "child":
+            return self.children(element)
+        if axis == "self":
+            return [element]
+        if axis == "descendant":
+            return list(element.iter())[1:]
+        if axis == "descendant-or-self":
+            return list(element.iter())
+        if axis == "parent":
+            parent = self.parent(element)
+            return [parent] if parent is not None else []
+        if axis == "ancestor":
+            ancestors = []
+            parent = self.parent(element)
+            while parent is not None:
+                ancestors.append(parent)
+                parent = self.parent(parent)
+            return ancestors
+        siblings = self.siblings(element)
+        index = next(i for i, sibling in enumerate(siblings) if sibling is element)
+        if axis == "following-sibling":
+            return siblings[index + 1:]
+        if axis == "preceding-sibling":
+            # -> 역방향 축: 위치([n])는 가까운 형제부터 셉니다. (ancestor도 가까운 부모부터 반환)
+            return list(reversed(siblings[:index]))
+        raise XPathError(f"지원하지 않는 XPath 축: {axis}")
+
+    def sort(self, nodes):
+        """
+        요소를 문서 순서로 정렬하고 중복을 제거합니다. (속성 값/텍스트 문자열은 그대로 유지)
+        """
+        if not all(node in self.order for node in nodes if not isinstance(node, str)):
+            return nodes
+        elements = {node: None for node in nodes if not isinstance(node, str)}
+        strings = [node for node in nodes if isinstance(node, str)]
+        return sorted(elements, key=self.order.get) + strings
+
+
+def _string_value(value):
+    if isinstance(value, list):
+        return _string_value(value[0]) if value else ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    if isinstance(value, str):
+        return value
+    return "".join(value.itertext())
+
+
+def _boolean(value):
+    if isinstance(value, (list, str)):
+        return len(value) > 0
+    return bool(value)
+
+
+def _compare(op, left, right):
+    lefts = left if isinstance(left, list) else [left]
+    rights = right if isinstance(right, list) else [right]
+    for left_item in lefts:
+        for right_item in rights:
+            if isinstance(left_item, float) or isinstance(right_item, float):
+                try:
+                    equal = float(_string_value(left_item)) == float(_string_value(right_item))
+                except ValueError:
+                    equal = False
+            else:
+                equal = _string_value(left_item) == _string_value(right_item)
+            if equal == (op == "="):
+                return True
+    return False
+
+
+class _Evaluator:
+    def __init__(self, document):
+        self.document = document
+
+    def evaluate(self, node, context, position=1, size=1):
+        kind = node[0]
+        if kind == "literal":
+            return node[1]
+        if kind == "number":
+            return node[1]
+        if kind == "or":
+            return (_boolean(self.evaluate(node[1], context, position, size))
+                    or _boolean(self.evaluate(node[2], context, position, size)))
+        if kind == "and":
+            return (_boolean(self.evaluate(node[1], context, position, size))
+                    and _boolean(self.evaluate(node[2], context, position, size)))
+        if kind == "compare":
+            return _compare(node[1], self.evaluate(node[2], context, position, size),
+                            self.evaluate(node[3], context, position, size))
+        if kind == "union":
+            left = self.evaluate(node[1], context, position, size)
+            right = self.evaluate(node[2], context, position, size)
+            return self.document.sort(list(left) + list(right))
+        if kind == "call":
+            return self.call(node[1], node[2], context, position, size)
+        if kind == "root":
+            return [self.document.root]
+        if kind == "context":
+            return [context]
+        if kind == "filter":
+            nodes = self.evaluate(node[1], context, position, size)
+            if not isinstance(nodes, list):
+                raise XPathError("조건([...])은 노드 집합에만 사용할 수 있습니다.")
+            return self.filter(nodes, node[2])
+        if kind == "path":
+            nodes = self.evaluate(node[1], context, position, size)
+            for step in node[2]:
+                nodes = self.step(nodes, step)
+            return nodes
+        raise XPathError(f"알 수 없는 XPath 노드: {kind}")
+
+    def call(self, name, args, context, position, size):
+        values = [self.evaluate(arg, context, position, size) for arg in args]
+        if name == "contains":
+            return _string_value(values[1]) in _string_value(values[0])
+        if name == "starts-with":
+            return _string_value(values[0]).startswith(_string_value(values[1]))
+        if name == "normalize-space":
+            return " ".join(_string_value(values[0] if values else [context]).split())
+        if name == "string":
+            return _string_value(values[0] if values else [context])
+        if name == "not":
+            return not _boolean(values[0])
+        raise XPathError(f"지원하지 않는 XPath 함수: {name}()")
+
+    def filter(self, nodes, predicates):
+        for predicate in predicates:
+            size = len(nodes)
+            kept = []
+            for position, candidate in enumerate(nodes, start=1):
+                result = self.evaluate(predicate, candidate, position, size)
+                if isinstance(result, float) and not isinstance(result, bool):
+                    if result == position:
+                        kept.append(candidate)
+                elif _boolean(result):
+                    kept.append(candidate)
+            nodes = kept
+        return nodes
+
+    def step(self, nodes, step):
+        axis, node_test, predicates = step
+        result = []
+        for node in nodes:
+            if isinstance(node, str):
+                continue
+            if axis == "attribute":
+                value = node.attrib.get(node_test) if node_test else None
+                candidates = [value] if value is not None else (list(node.attrib.values()) if node_test is None else [])
+            elif node_test == "text()":
+                candidates = [node.text] if axis == "child" and node.text else []
+            else:
+                candidates = [candidate for candidate in self.document.axis(node, axis)
+                              if node_test is None or candidate.tag == node_test]
+            result.extend(self.filter(candidates, predicates))
+        return self.document.sort(result)
+
+
+class XPath:
+    """
+    한 번 해석한 XPath 식입니다. 같은 식을 반복 평가할 때 해석 비용을 줄이기 위해 compile()로 캐시합니다.
+    """
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.ast = _Parser(expression).parse()
+
+    def select(self, root, context=None, document=None):
+        """
+        식을 평가하여 일치하는 요소 목록(문서 순서)을 반환합니다. 요소가 아닌 결과(속성 값, 숫자 등)는 제외합니다.
+        :param root: 문서 최상위 노드 (ElementTree Element)
+        :param context: 상대 경로(./, .//)의 기준 요소 (기본값: root)
+        :param document: 같은 문서를 여러 번 평가할 때 재사용할 prepare(root) 결과
+        """
+        document = document or prepare(root)
+        result = _Evaluator(document).evaluate(self.ast, context if context is not None else root)
+        if not isinstance(result, list):
+            raise XPathError(f"요소를 반환하지 않는 XPath 식입니다: {self.expression}")
+        return [node for node in result if not isinstance(node, str)]
+
+
+_compiled = {}
+
+
+def compile_xpath(expression):
+    """
+    XPath 식을 해석하여 캐시합니다. 지원하지 않는 문법이면 XPathError를 발생시킵니다.
+    """
+    xpath = _compiled.get(expression)
+    if xpath is None:
+        xpath = _compiled[expression] = XPath(expression)
+    return xpath
+
+
+def prepare(root):
+    """
+    root를 평가용 문서로 준비합니다. root의 부모로 문서 노드를 두어 '//hierarchy'처럼 최상위 요소도 찾을 수 있게 합니다.
+    """
+    return _Document(root)
+
+
+def select(root, expression, context=None, document=None):
+    return compile_xpath(expression).select(root, context, document)
@@ -6,6 +6,19 @@ from utils.logger import logger
 from utils.config_manager import ConfigManager
 
 
+class LocatorSpec(dict):
+    """
+    플랫폼별 로케이터 딕셔너리에 '로케이터 키'와 '그룹 키'를 함께 담는 dict 서브클래스입니다.
+    BasePage는 이 키를 보고 Probe(선택 요소) 여부 등 로케이터 단위 정책을 판단합니다.
+    (.copy()로 만든 동적 로케이터는 일반 dict가 되어 키 정보가 사라집니다.)
+    """
+
+    def __init__(self, data, key=None, group=None):
+        super().__init__(data)
+        self.key = key
+        self.group = group
+
+
 class LocatorManager:
     """
     [싱글턴 패턴 적용] 모든 로케이터 JSON 파일을 한 번만 로드하여 메모리에 저장하고 관리합니다.
@@ -33,6 +46,7 @@ class LocatorManager:
                         "product_select_locators": "product_select",
                         "discount_select_locators": "discount_select",
                         "step4_payment_info_locators": "payment_info_select",
+                        "screen_locators": "screens",
                     }
                     self._all_locators = self._load_all_locators()
                     self.platform = None
@@ -104,7 +118,10 @@ class LocatorManager:
         platform_locators = {}
         for key, value in locators_in_group.items():
             if isinstance(value, dict) and self.platform in value:
-                platform_locators[key] = value[self.platform]
+                platform_value = value[self.platform]
+                if isinstance(platform_value, dict):
+                    platform_value = LocatorSpec(platform_value, key=key, group=page_key)
+                platform_locators[key] = platform_value
             else:
                 logger.warning(f"'{key}' 로케이터에 '{self.platform}' 플랫폼 정보가 없거나 형식이 잘못되었습니다.")
                 platform_locators[key] = None
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+from datetime import datetime
+from appium.webdriver.common.appiumby import AppiumBy
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+# -> AppiumBy 값 → locators/*.json의 전략 키
+STRATEGY_KEYS = {
+    AppiumBy.ID: "id",
+    AppiumBy.XPATH: "xpath",
+    AppiumBy.ACCESSIBILITY_ID: "accessibility_id",
+}
+
+
+class LocatorStats:
+    """
+    [싱글턴 패턴 적용] 로케이터 키/플랫폼별로 어떤 전략(id, xpath, accessibility_id)이 실제로 요소를 찾았는지와
+    찾는 데 걸린 시간을 reports/locator_stats/locator_stats.json에 누적하는 클래스입니다.
+    - order(): 성공 기록이 있는 전략을 평균 소요 시간이 짧은 순으로 먼저, 한 번도 성공하지 못한 전략을 마지막에 시도
+      뒤로 밀린 전략은 다시 시도되지 않아 기록이 멈추므로, retry_demoted_every회 성공 조회마다 한 번은
+      아직 삭제 후보로 확정되지 않은 미성공 전략을 먼저 시도하여 기록을 갱신합니다.
+    - report(): 실패만 반복된 전략(삭제 후보)을 리포트
+    로케이터 키 정보가 있는 LocatorSpec만 기록합니다. (.copy()로 만든 동적 로케이터는 기존 순서 유지)
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    stats_config = config_manager.config.get("LocatorStats", {})
+                    self.enabled = stats_config.get("adaptive_order", True)
+                    self.dead_after_failures = stats_config.get("dead_after_failures", 5)
+                    self.retry_demoted_every = stats_config.get("retry_demoted_every", 10)
+                    self.stats_dir = os.path.join(config_manager.project_root, 'reports', 'locator_stats')
+                    self.file_path = os.path.join(self.stats_dir, 'locator_stats.json')
+                    self.stats = self._load()
+                    self._dirty = False
+                    self._initialized = True
+
+    def _load(self):
+        if not os.path.exists(self.file_path):
+            return {}
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"로케이터 통계 파일 형식이 잘못되어 새로 시작합니다: {self.file_path}")
+            return {}
+
+    @staticmethod
+    def stats_key(locator, platform):
+        """
+        'android:product_select.sale_type_buttons' 형태의 통계 키를 반환합니다. 키 정보가 없으면 None을 반환합니다.
+        """
+        key = getattr(locator, 'key', None)
+        if not key:
+            return None
+        return f"{platform}:{getattr(locator, 'group', None) or '-'}.{key}"
+
+    def record(self, locator, platform, by, found, elapsed):
+        """
+        전략 1회 시도 결과를 기록합니다.
+        :param by: AppiumBy 전략
+        :param found: 요소를 찾았는지 여부
+        :param elapsed: 시도에 걸린 시간(초)
+        """
+        key = self.stats_key(locator, platform)
+        if key is None:
+            return
+        strategy = STRATEGY_KEYS.get(by, by)
+        with self._lock:
+            entry = self.stats.setdefault(key, {}).setdefault(
+                strategy, {"success": 0, "failure": 0, "success_time": 0.0, "last_success": None})
+            if found:
+                entry["success"] += 1
+                entry["success_time"] = round(entry["success_time"] + elapsed, 3)
+                entry["last_success"] = datetime.now().isoformat(timespec='seconds')
+            else:
+                entry["failure"] += 1
+            self._dirty = True
+
+    def _is_unproven(self, entry):
+        """
+        성공한 적이 없고 아직 삭제 후보(dead_after_failures회 실패)로 확정되지 않은 전략이면 True를 반환합니다.
+        """
+        return entry is None or (entry["success"] == 0 and entry["failure"] < self.dead_after_failures)
+
+    def _sort_key(self, entry, original_index, probing=False):
+        if probing and self._is_unproven(entry):
+            # 재확인 차례: 미성공 전략을 원래 순서대로 먼저 시도
+            return (-1, 0, original_index)
+        if entry is None:
+            # 기록 없음: 성공 기록이 있는 전략 다음, 원래 순서 유지
+            return (1, 0, original_index)
+        if entry["success"]:
+            return (0, entry["success_time"] / entry["success"], original_index)
+        return (2, -entry["failure"], original_index)
+
+    def order(self, locator, platform, locator_tuples):
+        """
+        기록을 바탕으로 전략 시도 순서를 정렬한 (by, value) 목록을 반환합니다.
+        """
+        key = self.stats_key(locator, platform)
+        if not self.enabled or key is None or key not in self.stats or len(locator_tuples) < 2:
+            return locator_tuples
+        entries = self.stats[key]
+        lookups = sum(entry["success"] for entry in entries.values())
+        probing = bool(self.retry_demoted_every and lookups and lookups % self.retry_demoted_every == 0)
+        indexed = list(enumerate(locator_tuples))
+        indexed.sort(key=lambda item: self._sort_key(entries.get(STRATEGY_KEYS.get(item[1][0], item[1][0])),
+                                                     item[0], probing))
+        return [locator_tuple for _, locator_tuple in indexed]
+
+    def save(self):
+        if not self._dirty:
+            return
+        with self._lock:
+            os.makedirs(self.stats_dir, exist_ok=True)
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                json.dump(self.stats, f, ensure_ascii=False, indent=2, sort_keys=True)
+            self._dirty = False
+
+    def dead_strategies(self):
+        """
+        한 번도 성공하지 못하고 dead_after_failures회 이상 실패한 전략 목록을 반환합니다. (locators/*.json 삭제 후보)
+        같은 로케이터의 다른 전략이 성공한 적이 있는 경우만 포함합니다.
+        (모든 전략이 실패만 한 로케이터는 전략 문제가 아니라 화면에 없던 선택 요소(Probe)일 수 있으므로 제외)
+        """
+        dead = []
+        for key, entries in sorted(self.stats.items()):
+            alive = [name for name, other in entries.items() if other["success"]]
+            if not alive:
+                continue
+            for strategy, entry in entries.items():
+                if entry["success"] == 0 and entry["failure"] >= self.dead_after_failures:
+                    dead.append({"locator": key, "strategy": strategy, "failures": entry["failure"],
+                                 "working_strategies": alive})
+        return dead
+
+    def report(self):
+        """
+        통계를 저장하고, 삭제 후보 전략을 로그와 reports/locator_stats/dead_strategies_*.json으로 남깁니다.
+        """
+        self.save()
+        dead = self.dead_strategies()
+        if not dead:
+            return None
+        logger.info(f"🪦 한 번도 성공하지 못한 로케이터 전략 {len(dead)}개 (locators/*.json 삭제 후보):")
+        for item in dead:
+            logger.info(f"  - {item['locator']} [{item['strategy']}] 실패 {item['failures']}회"
+                        f" (성공 전략: {', '.join(item['working_strategies'])})")
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        file_path = os.path.join(self.stats_dir, f"dead_strategies_{timestamp}.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(dead, f, ensure_ascii=False, indent=2)
+        return file_path
+
+
+locator_stats = LocatorStats()
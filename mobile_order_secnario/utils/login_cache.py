@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+로그인 상태 재사용(warm login) 캐시입니다.
+매 세션마다 로그인(접속 팝업 확인, ID/비밀번호 입력, sleep, 위치 권한/메인 팝업 확인)을 반복하지 않도록,
+앱 데이터를 유지하는 capability 프로파일(noReset)로 세션을 만들고, 기기별 마지막 로그인 기록과
+세션 유효성 확인(현재 화면이 로그인 후 화면인지)을 통과하면 로그인을 건너뜁니다. 확인에 실패할 때만 다시 로그인합니다.
+
+capability 프로파일 (config.json 'LoginCache.profiles', --login-profile로 선택)
+    warm   앱 데이터 유지(noReset) - 로그인 상태 재사용
+    clean  앱 데이터 초기화(noReset=false) - 매번 로그인
+    full   앱 재설치(fullReset) - 매번 로그인
+로그인 기록은 reports/login_cache/login_cache.json에 기기 설정 키별로 남습니다. (비밀번호는 저장하지 않음)
+"""
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+from utils.navigation import NavigationError, navigation_tracker
+
+# -> 로그인 직후 도착하는 화면 (screen_locators.json의 키)
+LOGGED_IN_SCREEN = "main"
+LOGIN_SCREEN = "login"
+
+
+class LoginCache:
+    """
+    [싱글턴 패턴 적용] capability 프로파일과 기기별 로그인 기록으로 로그인 재사용 여부를 판단하는 클래스입니다. (config.json 'LoginCache')
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    cache_config = config_manager.config.get("LoginCache", {})
+                    self.enabled = cache_config.get("enabled", True)
+                    self.profiles = cache_config.get("profiles", {"warm": {"noReset": True}})
+                    self.profile = cache_config.get("profile", "warm")
+                    self.max_age_hours = cache_config.get("max_age_hours", 12)
+                    self.restart_app_on_check = cache_config.get("restart_app_on_check", True)
+                    self.check_timeout = cache_config.get("check_timeout", 10)
+                    self.cache_path = os.path.join(config_manager.project_root, 'reports', 'login_cache',
+                                                   'login_cache.json')
+                    self.device_key = None
+                    self._initialized = True
+
+    def set_profile(self, profile):
+        if not profile:
+            return
+        if profile not in self.profiles:
+            raise ValueError(f"'{profile}' capability 프로파일이 없습니다. (가능한 프로파일: {sorted(self.profiles)})")
+        self.profile = profile
+
+    def capabilities(self):
+        """
+        현재 프로파일의 capability 덮어쓰기 값을 반환합니다. (비활성화 상태면 config.json 기기 설정 그대로 사용)
+        """
+        return dict(self.profiles.get(self.profile, {})) if self.enabled else {}
+
+    @property
+    def keeps_app_data(self):
+        capabilities = self.capabilities()
+        return bool(capabilities.get("noReset")) and not capabilities.get("fullReset")
+
+    # --- 기록 ---
+    def _load(self):
+        if not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save(self, cache):
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+
+    def start(self, device_key):
+        """
+        새 세션의 기기 설정 키를 등록합니다. 앱 데이터를 지우는 프로파일이면 해당 기기의 로그인 기록을 지웁니다.
+        (드라이버 초기화 직후 호출)
+        """
+        self.device_key = device_key
+        if self.enabled and not self.keeps_app_data:
+            self.invalidate(device_key, f"'{self.profile}' 프로파일은 앱 데이터를 초기화함")
+
+    def record(self, user_id):
+        if not self.enabled or self.device_key is None:
+            return
+        with self._lock:
+            cache = self._load()
+            cache[self.device_key] = {"user_id": user_id, "profile": self.profile,
+                                      "logged_in_at": datetime.now().isoformat(timespec='seconds')}
+            self._save(cache)
+
+    def invalidate(self, device_key=None, reason=""):
+        device_key = device_key or self.device_key
+        with self._lock:
+            cache = self._load()
+            if cache.pop(device_key, None) is None:
+                return
+            self._save(cache)
+        logger.info(f"🔑 로그인 기록 삭제: {device_key} ({reason})")
+
+    # --- 세션 유효성 확인 ---
+    def _restart_app(self, driver):
+        capabilities = driver.capabilities or {}
+        package = capabilities.get("appPackage") or capabilities.get("bundleId")
+        if not package:
+            return False
+        driver.terminate_app(package)
+        driver.activate_app(package)
+        return True
+
+    def is_valid(self, driver, user_id, now=None):
+        """
+        로그인 상태를 재사용할 수 있으면 True를 반환합니다.
+        1. 앱 데이터를 유지하는 프로파일이고, 같은 계정의 최근(max_age_hours 이내) 로그인 기록이 있어야 함
+        2. 현재 화면이 로그인 후 화면이어야 함. 다른 화면(이전 시나리오가 멈춘 주문 화면 등)이면
+           앱을 다시 시작하여 로그인 후 화면으로 열리는지 확인 (restart_app_on_check)
+        """
+        if not self.enabled or self.device_key is None or not self.keeps_app_data:
+            return False
+        entry = self._load().get(self.device_key)
+        if not entry or entry.get("user_id") != user_id:
+            return False
+        logged_in_at = datetime.fromisoformat(entry["logged_in_at"])
+        if (now or datetime.now()) - logged_in_at > timedelta(hours=self.max_age_hours):
+            self.invalidate(reason=f"{self.max_age_hours}시간 경과")
+            return False
+
+        try:
+            screen = navigation_tracker.current_screen(driver)
+            if screen not in (LOGGED_IN_SCREEN, LOGIN_SCREEN) and self.restart_app_on_check:
+                logger.info(f"🔑 현재 화면({screen})에서 로그인 상태를 확인하기 위해 앱을 다시 시작합니다.")
+                if self._restart_app(driver):
+                    navigation_tracker.wait_for_screen(driver, LOGGED_IN_SCREEN, timeout=self.check_timeout)
+                    screen = LOGGED_IN_SCREEN
+        except (TimeoutException, NavigationError, WebDriverException) as e:
+            logger.info(f"🔑 로그인 상태 확인 실패: {e}")
+            screen = None
+        if screen != LOGGED_IN_SCREEN:
+            self.invalidate(reason=f"세션 유효성 확인 실패 (현재 화면: {screen})")
+            return False
+        logger.info(f"🔑 로그인 상태를 재사용합니다: {self.device_key} ({entry['logged_in_at']} 로그인)")
+        return True
+
+
+login_cache = LoginCache()
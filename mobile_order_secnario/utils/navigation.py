@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from collections import deque
+import xml.etree.ElementTree as ET
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from utils import local_xpath
+from utils.config_manager import ConfigManager
+from utils.locator_manager import locator_manager
+from utils.logger import logger
+
+
+class NavigationError(Exception):
+    """
+    기대한 화면이 아닌 다른 화면으로 이동(오탐색)한 것이 확인되었을 때 발생하는 예외입니다.
+    """
+
+
+class NavigationTracker:
+    """
+    [싱글턴 패턴 적용] 저렴한 신호로 앱의 현재 화면을 판별하는 클래스입니다.
+    화면 정의는 locators/screen_locators.json('screens' 그룹)에 플랫폼별로 선언합니다.
+
+    화면 신호 (선언된 신호가 모두 일치해야 해당 화면으로 판정)
+    - step_indicator : 단계 표시 요소의 XPath (예: 타이틀이 있는 헤더 컨테이너 안의 '3')
+                       화면 전체에서 '3' 텍스트를 찾으면 가격/수량 등과 혼동되므로, 반드시 단계 표시 컨테이너로 범위를 한정합니다.
+    - title          : 페이지 타이틀 텍스트
+    - texts          : 모두 존재해야 하는 텍스트 목록
+    - any_texts      : 하나 이상 존재해야 하는 텍스트 목록
+    - activity       : 현재 Activity 이름에 포함되어야 하는 문자열 (Android)
+    - url_contains   : WebView 컨텍스트의 URL에 포함되어야 하는 문자열
+    여러 화면이 동시에 일치하면 일치한 신호가 가장 많은(가장 구체적인) 화면을 선택합니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+    # -> 화면 계층에서 텍스트로 간주하는 속성 (Android: text/content-desc, iOS: label/name/value)
+    TEXT_ATTRIBUTES = ("text", "content-desc", "label", "name", "value")
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    nav_config = ConfigManager().config.get("Navigation", {})
+                    self.timeout = nav_config.get("timeout", 15)
+                    self.interval = nav_config.get("interval", 0.5)
+                    self.misnavigation_samples = nav_config.get("misnavigation_samples", 3)
+                    self.last_screen = None
+                    self._initialized = True
+
+    def _screens(self):
+        screens = locator_manager.get_locators("screens")
+        return {name: spec for name, spec in screens.items() if isinstance(spec, dict)}
+
+    def _collect_signals(self, driver, need_activity, need_url):
+        """
+        현재 화면의 텍스트 집합, 화면 계층, Activity, WebView URL을 한 번씩만 조회합니다.
+        """
+        texts = set()
+        document = None
+        try:
+            root = ET.fromstring(driver.page_source.encode('utf-8'))
+            document = local_xpath.prepare(root)
+            for node in root.iter():
+                for attr in self.TEXT_ATTRIBUTES:
+                    value = node.attrib.get(attr)
+                    if value:
+                        texts.add(value.strip())
+        except (WebDriverException, ET.ParseError) as e:
+            logger.warning(f"화면 계층 조회 실패: {e}")
+
+        activity = None
+        if need_activity:
+            try:
+                activity = driver.current_activity
+            except WebDriverException:
+                pass
+
+        url = None
+        if need_url:
+            try:
+                if "WEBVIEW" in (driver.current_context or ""):
+                    url = driver.current_url
+            except WebDriverException:
+                pass
+        return texts, document, activity, url
+
+    @staticmethod
+    def _match(spec, texts, document, activity, url):
+        """
+        화면 정의와 수집한 신호를 비교하여 일치한 신호 수를 반환합니다. (하나라도 불일치하면 0)
+        """
+        score = 0
+        if spec.get("step_indicator"):
+            if document is None or not local_xpath.select(document.root, spec["step_indicator"], document=document):
+                return 0
+            score += 1
+        if spec.get("title"):
+            if spec["title"] not in texts:
+                return 0
+            score += 1
+        for text in spec.get("texts") or []:
+            if text not in texts:
+                return 0
+            score += 1
+        if spec.get("any_texts"):
+            if not any(text in texts for text in spec["any_texts"]):
+                return 0
+            score += 1
+        if spec.get("activity"):
+            if not activity or spec["activity"] not in activity:
+                return 0
+            score += 1
+        if spec.get("url_contains"):
+            if not url or spec["url_contains"] not in url:
+                return 0
+            score += 1
+        return score
+
+    def current_screen(self, driver):
+        """
+        현재 화면 이름을 반환합니다. 어떤 화면 정의와도 일치하지 않으면 None을 반환합니다.
+        """
+        screens = self._screens()
+        need_activity = any(spec.get("activity") for spec in screens.values())
+        need_url = any(spec.get("url_contains") for spec in screens.values())
+        texts, document, activity, url = self._collect_signals(driver, need_activity, need_url)
+
+        best_name, best_score = None, 0
+        for name, spec in screens.items():
+            score = self._match(spec, texts, document, activity, url)
+            if score > best_score:
+                best_name, best_score = name, score
+        self.last_screen = best_name
+        return best_name
+
+    def wait_for_screen(self, driver, name, timeout=None):
+        """
+        지정한 화면이 활성화될 때까지 폴링합니다.
+        대기 시작 시점의 화면(출발 화면)도, 목표 화면도 아닌 다른 화면이
+        misnavigation_samples회 연속 감지되면 즉시 NavigationError를 발생시킵니다.
+        :param name: 화면 이름 (screen_locators.json의 키)
+        :param timeout: 최대 대기 시간 (None이면 config.json 'Navigation.timeout')
+        :return: 화면 진입까지 걸린 시간(초)
+        """
+        if name not in self._screens():
+            raise ValueError(f"'{name}' 화면 정의가 screen_locators.json에 없습니다.")
+
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        origin = None
+        unexpected_screen, unexpected_count = None, 0
+
+        while True:
+            screen = self.current_screen(driver)
+            elapsed = time.monotonic() - started
+            if screen == name:
+                logger.info(f"🧭 '{name}' 화면 진입 확인 ({elapsed:.2f}초)")
+                return elapsed
+
+            if origin is None:
+                origin = screen or ""
+            elif screen and screen != origin:
+                unexpected_count = unexpected_count + 1 if screen == unexpected_screen else 1
+                unexpected_screen = screen
+                if unexpected_count >= self.misnavigation_samples:
+                    message = f"화면 오탐색: '{name}' 화면을 기대했으나 '{screen}' 화면으로 이동했습니다."
+                    logger.error(f"❌ {message}")
+                    raise NavigationError(message)
+            else:
+                unexpected_screen, unexpected_count = None, 0
+
+            if elapsed >= timeout:
+                message = f"'{name}' 화면이 {timeout}초 안에 나타나지 않았습니다. (현재 화면: {screen})"
+                logger.error(f"❌ {message}")
+                raise TimeoutException(message)
+            time.sleep(self.interval)
+
+    @staticmethod
+    def shortest_path(transitions, source, target):
+        """
+        화면 전환 표(transitions)에서 source → target 최단 경로를 BFS로 찾습니다.
+        :param transitions: {(출발 화면, 도착 화면): 전환 함수} 딕셔너리
+        :return: [(출발 화면, 도착 화면), ...] 전환 목록 / 경로가 없으면 None
+        """
+        if source == target:
+            return []
+        queue = deque([(source, [])])
+        visited = {source}
+        while queue:
+            screen, path = queue.popleft()
+            for (from_screen, to_screen) in transitions:
+                if from_screen != screen or to_screen in visited:
+                    continue
+                next_path = path + [(from_screen, to_screen)]
+                if to_screen == target:
+                    return next_path
+                visited.add(to_screen)
+                queue.append((to_screen, next_path))
+        return None
+
+    def navigate_to(self, driver, target, transitions, *action_args):
+        """
+        현재 화면에서 target 화면까지 알려진 최단 경로로 이동합니다.
+        전환 함수를 하나 실행할 때마다 wait_for_screen으로 도착을 확인하고, 실제 화면 기준으로 경로를 다시 계산합니다.
+        :param transitions: {(출발 화면, 도착 화면): 전환 함수} 딕셔너리
+        :param action_args: 전환 함수에 그대로 전달할 인자 (예: driver, platform, state)
+        """
+        for _ in range(len(transitions) + 1):
+            current = self.current_screen(driver)
+            if current == target:
+                logger.info(f"🧭 '{target}' 화면에 도착했습니다.")
+                return
+            path = self.shortest_path(transitions, current, target)
+            if path is None:
+                message = f"'{current}' 화면에서 '{target}' 화면으로 가는 알려진 경로가 없습니다."
+                logger.error(f"❌ {message}")
+                raise NavigationError(message)
+            from_screen, to_screen = path[0]
+            logger.info(f"🧭 화면 이동: {from_screen} → {to_screen} (남은 경로 {len(path)}단계)")
+            transitions[(from_screen, to_screen)](*action_args)
+            self.wait_for_screen(driver, to_screen)
+        raise NavigationError(f"'{target}' 화면으로 이동하지 못했습니다. (경로 재계산 한도 초과)")
+
+
+navigation_tracker = NavigationTracker()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+시나리오 매트릭스 병렬 실행기입니다.
+config.json 'Devices'에 나열한 기기마다 pytest 프로세스를 하나씩 띄우고,
+매트릭스 케이스를 실행 기록(utils/run_history.py)의 예상 소요 시간이 긴 순으로
+누적 예상 시간이 가장 짧은 기기에 배정하여 동시에 실행합니다. (특정 기기만 늦게 끝나는 현상 방지)
+격리 중이거나 실행 전 상태 점검(utils/device_health.py)을 통과하지 못한 기기에는 배정하지 않습니다.
+
+--trace-export를 전달하면 기기별 실행 타임라인을 reports/parallel/trace_<시각>.json 하나로 합칩니다. (기기별 트랙)
+경로를 함께 주면(--trace-export <경로> 또는 --trace-export=<경로>) 합친 타임라인을 그 경로에 저장합니다.
+
+사용법 (프로젝트 루트에서 실행)
+    python -m utils.parallel_runner [-k test_full_order_scenario] [-- 추가 pytest 인자]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from datetime import datetime
+from utils.config_manager import ConfigManager
+from utils.device_health import device_health
+from utils.logger import logger
+from utils.run_history import run_history
+from utils.scenario_matrix import expand_matrix, load_matrix, save_case_ids, schedule_longest_first
+from utils.trace_export import merge_traces
+
+
+def assign_cases(devices, log_dir):
+    """
+    매트릭스 케이스를 기기별로 배정하고, 기기별 케이스 ID 파일을 만듭니다.
+    :return: {기기 설정 키: 케이스 ID 파일 경로}
+    """
+    cases = expand_matrix(load_matrix())
+    assignments, loads = schedule_longest_first(
+        cases, devices, lambda case: run_history.predicted_duration(case.case_id))
+    case_files = {}
+    for device_key, device_cases in assignments.items():
+        case_files[device_key] = os.path.join(log_dir, f"{device_key}_cases.json")
+        save_case_ids(case_files[device_key], device_cases)
+        logger.info(f"📋 [{device_key}] {len(device_cases)}개 케이스 배정 (예상 {loads[device_key]:.0f}초)")
+    return case_files
+
+
+def split_trace_export(pytest_args):
+    """
+    pytest 인자에서 --trace-export 옵션을 값과 함께 분리합니다. (기기별 프로세스에는 기기별 경로로 다시 전달)
+    pytest와 같이 다음 인자가 '-'로 시작하지 않으면 옵션 값으로 봅니다. (--trace-export=<경로> 형식도 지원)
+    :return: (나머지 pytest 인자, 사용 여부, 합친 타임라인 저장 경로 또는 None)
+    """
+    remaining, enabled, path = [], False, None
+    args = iter(pytest_args)
+    for arg in args:
+        if arg == "--trace-export":
+            enabled = True
+            value = next(args, None)
+            if value is not None and value.startswith("-"):
+                remaining.append(value)
+            else:
+                path = value
+        elif arg.startswith("--trace-export="):
+            enabled, path = True, arg.split("=", 1)[1]
+        else:
+            remaining.append(arg)
+    # -> 값 생략과 같은 의미인 'auto'/빈 값은 기본 경로(reports/parallel/trace_<시각>.json)를 사용합니다.
+    return remaining, enabled, path if path not in (None, "", "auto") else None
+
+
+def build_commands(case_files, pytest_args, trace_files=None):
+    """
+    기기별 pytest 명령을 만듭니다. 각 기기는 배정된 케이스 ID 파일(--case-file)의 케이스만 실행하고,
+    테스트 데이터 스트림(--order-data)은 기기마다 다른 워커 몫(--data-worker)만 사용합니다.
+    :param trace_files: {기기 설정 키: 실행 타임라인 저장 경로} (--trace-export 사용 시)
+    """
+    trace_files = trace_files or {}
+    worker_count = len(case_files)
+    return {device_key: [sys.executable, "-m", "pytest", "--matrix", "--case-file", case_file,
+                         "--device", device_key, "--data-worker", f"{worker_index}/{worker_count}", *pytest_args,
+                         *(["--trace-export", trace_files[device_key]] if device_key in trace_files else [])]
+            for worker_index, (device_key, case_file) in enumerate(case_files.items(), start=1)}
+
+
+def run_parallel(devices=None, pytest_args=()):
+    """
+    기기별 pytest 프로세스를 동시에 실행하고 모두 끝날 때까지 기다립니다.
+    :return: {기기 설정 키: 종료 코드}
+    """
+    config_manager = ConfigManager()
+    devices = device_health.available(devices or config_manager.config.get("Devices", ["Capabilities_Android"]))
+    if not devices:
+        logger.error("❌ 실행 가능한 기기가 없습니다. (모든 기기가 격리 중이거나 상태 점검 실패, 'python -m utils.device_health status')")
+        return {}
+    log_dir = os.path.join(config_manager.project_root, 'reports', 'parallel')
+    os.makedirs(log_dir, exist_ok=True)
+
+    pytest_args, trace_export, trace_path = split_trace_export(pytest_args)
+    trace_files = {}
+    if trace_export:
+        # -> 기기마다 타임라인 파일을 따로 저장하고, 모두 끝나면 하나로 합칩니다.
+        trace_files = {device_key: os.path.join(log_dir, f"{device_key}_trace.json") for device_key in devices}
+
+    processes = {}
+    for device_key, command in build_commands(assign_cases(devices, log_dir), pytest_args, trace_files).items():
+        log_file = open(os.path.join(log_dir, f"{device_key}.log"), 'w', encoding='utf-8')
+        logger.info(f"▶️ [{device_key}] {' '.join(command[2:])}")
+        processes[device_key] = (subprocess.Popen(command, cwd=config_manager.project_root,
+                                                  stdout=log_file, stderr=subprocess.STDOUT), log_file)
+
+    results = {}
+    for device_key, (process, log_file) in processes.items():
+        results[device_key] = process.wait()
+        log_file.close()
+        status = "✅ 성공" if results[device_key] == 0 else f"❌ 실패 (종료 코드 {results[device_key]})"
+        logger.info(f"[{device_key}] {status} → reports/parallel/{device_key}.log")
+    if trace_files:
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        merge_traces(list(trace_files.values()), trace_path or os.path.join(log_dir, f"trace_{timestamp}.json"))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시나리오 매트릭스 병렬 실행기")
+    parser.add_argument("--devices", nargs="+", default=None, help="사용할 디바이스 설정 키 (기본: config.json 'Devices')")
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER, help="pytest에 그대로 전달할 인자")
+    args = parser.parse_args(argv)
+
+    pytest_args = [arg for arg in args.pytest_args if arg != "--"]
+    results = run_parallel(args.devices, pytest_args)
+    return 0 if all(code == 0 for code in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
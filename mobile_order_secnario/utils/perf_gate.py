@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+성능 회귀 게이트 pytest 플러그인입니다. (conftest.py의 pytest_plugins로 등록)
+시나리오 단계별 실행 시간과 WebDriver 명령 수를 data/perf_baseline.json의 기준값과 비교하여,
+허용 범위를 넘으면 경고(warn)하거나 테스트를 실패(fail) 처리합니다.
+리포트에는 증가분이 가장 큰 페이지 메서드(예: ProductSelectionPage.select_separate_product_randomly)를 함께 표시합니다.
+
+사용법
+    pytest --perf-gate fail                 # 허용 범위 초과 시 실패 처리
+    pytest --perf-baseline-update           # 이번 실행(성공한 테스트)의 측정값으로 기준값 갱신
+"""
+import json
+import os
+import threading
+import pytest
+from utils.config_manager import ConfigManager
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.logger import logger
+
+
+class PerfGateMode:
+    OFF = "off"
+    WARN = "warn"
+    FAIL = "fail"
+    ALL = (OFF, WARN, FAIL)
+
+
+def _outermost(span, category):
+    """
+    같은 단계 안에서 가장 바깥쪽 category 구간을 반환합니다. (페이지 메서드가 다른 페이지 메서드를 부르는 경우 중복 집계 방지)
+    """
+    found = None
+    while span is not None and span.category != SpanCategory.STEP:
+        if span.category == category:
+            found = span
+        span = span.parent
+    return found
+
+
+class PerfGate:
+    """
+    [싱글턴 패턴 적용] 테스트 1건 동안 단계별/페이지 메서드별 실행 시간과 명령 수를 집계하고 기준값과 비교하는 클래스입니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    gate_config = config_manager.config.get("PerfGate", {})
+                    self.mode = gate_config.get("mode", PerfGateMode.WARN)
+                    self.duration_tolerance_percent = gate_config.get("duration_tolerance_percent", 25)
+                    self.duration_tolerance_seconds = gate_config.get("duration_tolerance_seconds", 2)
+                    self.command_tolerance_percent = gate_config.get("command_tolerance_percent", 10)
+                    self.command_tolerance_count = gate_config.get("command_tolerance_count", 5)
+                    self.baseline_path = os.path.join(config_manager.project_root, 'data', 'perf_baseline.json')
+                    self.baseline = self._load_baseline()
+                    self.update_baseline = False
+                    self.metrics = {}
+                    self._initialized = True
+
+    def _load_baseline(self):
+        if not os.path.exists(self.baseline_path):
+            return {}
+        with open(self.baseline_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def configure(self, mode=None, update_baseline=False):
+        if mode:
+            self.mode = mode
+        self.update_baseline = update_baseline
+
+    def begin(self):
+        """
+        테스트 시작 시 집계를 초기화하고 측정 리스너를 등록합니다.
+        """
+        self.metrics = {}
+        instrumentation.add_listener(self.on_span)
+
+    def end(self):
+        instrumentation.remove_listener(self.on_span)
+        return self.metrics
+
+    @staticmethod
+    def _empty():
+        return {"duration": 0.0, "commands": 0}
+
+    def on_span(self, span):
+        step = span.ancestor(SpanCategory.STEP)
+        if step is None:
+            return
+        step_metrics = self.metrics.setdefault(step.name, dict(self._empty(), methods={}))
+        if span is step:
+            step_metrics["duration"] += span.duration
+        elif span.category == SpanCategory.COMMAND:
+            step_metrics["commands"] += 1
+            page = _outermost(span, SpanCategory.PAGE)
+            if page is not None:
+                step_metrics["methods"].setdefault(page.name, self._empty())["commands"] += 1
+        elif span.category == SpanCategory.PAGE and _outermost(span, SpanCategory.PAGE) is span:
+            step_metrics["methods"].setdefault(span.name, self._empty())["duration"] += span.duration
+
+    def _limit(self, baseline_value, percent, absolute):
+        return baseline_value * (1 + percent / 100) + absolute
+
+    @staticmethod
+    def _responsible_method(current_methods, baseline_methods, field):
+        """
+        기준값 대비 field(duration/commands) 증가분이 가장 큰 페이지 메서드와 증가분을 반환합니다.
+        """
+        deltas = {name: values[field] - baseline_methods.get(name, {}).get(field, 0)
+                  for name, values in current_methods.items()}
+        if not deltas:
+            return None, 0
+        name = max(deltas, key=deltas.get)
+        return (name, deltas[name]) if deltas[name] > 0 else (None, 0)
+
+    def compare(self, test_id, metrics):
+        """
+        측정값을 기준값과 비교하여 허용 범위를 넘은 항목의 메시지 목록을 반환합니다.
+        """
+        baseline_steps = self.baseline.get(test_id, {})
+        violations = []
+        for step_name, current in metrics.items():
+            baseline = baseline_steps.get(step_name)
+            if not baseline:
+                continue
+            duration_limit = self._limit(baseline["duration"], self.duration_tolerance_percent,
+                                         self.duration_tolerance_seconds)
+            if current["duration"] > duration_limit:
+                method, delta = self._responsible_method(current["methods"], baseline.get("methods", {}), "duration")
+                violations.append(
+                    f"{step_name}: 실행 시간 {current['duration']:.2f}s > 허용 {duration_limit:.2f}s "
+                    f"(기준 {baseline['duration']:.2f}s)"
+                    + (f" → 원인 후보: {method} (+{delta:.2f}s)" if method else ""))
+            command_limit = self._limit(baseline["commands"], self.command_tolerance_percent,
+                                        self.command_tolerance_count)
+            if current["commands"] > command_limit:
+                method, delta = self._responsible_method(current["methods"], baseline.get("methods", {}), "commands")
+                violations.append(
+                    f"{step_name}: WebDriver 명령 {current['commands']}회 > 허용 {command_limit:.0f}회 "
+                    f"(기준 {baseline['commands']}회)"
+                    + (f" → 원인 후보: {method} (+{delta}회)" if method else ""))
+        return violations
+
+    def save_baseline(self, test_id, metrics):
+        rounded = {
+            step_name: {
+                "duration": round(values["duration"], 2),
+                "commands": values["commands"],
+                "methods": {name: {"duration": round(method["duration"], 2), "commands": method["commands"]}
+                            for name, method in values["methods"].items()},
+            }
+            for step_name, values in metrics.items()
+        }
+        self.baseline[test_id] = rounded
+        with open(self.baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(self.baseline, f, ensure_ascii=False, indent=2)
+        logger.info(f"📏 성능 기준값 갱신: {test_id} ({len(rounded)}개 단계)")
+
+
+perf_gate = PerfGate()
+
+
+# --- pytest 훅 ---
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-gate",
+        action="store",
+        default=None,
+        choices=list(PerfGateMode.ALL),
+        help="단계별 실행 시간/명령 수가 기준값 허용 범위를 넘을 때: off / warn(경고) / fail(실패 처리)",
+    )
+    parser.addoption(
+        "--perf-baseline-update",
+        action="store_true",
+        default=False,
+        help="성공한 테스트의 측정값으로 data/perf_baseline.json 기준값을 갱신",
+    )
+
+
+def pytest_configure(config):
+    perf_gate.configure(config.getoption("--perf-gate"), config.getoption("--perf-baseline-update"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    perf_gate.begin()
+    try:
+        yield
+    finally:
+        perf_gate.end()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "call" or not report.passed or not perf_gate.metrics:
+        return
+    if perf_gate.update_baseline:
+        perf_gate.save_baseline(item.nodeid, perf_gate.metrics)
+        return
+    if perf_gate.mode == PerfGateMode.OFF:
+        return
+
+    violations = perf_gate.compare(item.nodeid, perf_gate.metrics)
+    if not violations:
+        return
+    message = "성능 회귀 감지:\n" + "\n".join(f"  - {violation}" for violation in violations)
+    logger.warning(f"📉 {message}")
+    if perf_gate.mode == PerfGateMode.FAIL:
+        report.outcome = "failed"
+        report.longrepr = message
+    else:
+        item.warn(pytest.PytestWarning(message))
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+일시적 오류(transient failure) 재시도 정책 pytest 플러그인입니다. (conftest.py의 pytest_plugins로 등록)
+StaleElementReference, 느린 WebView의 타임아웃, 끊어진 세션 같은 일시적 오류 하나 때문에
+수 분짜리 전체 시나리오를 처음부터 다시 실행하지 않도록, 멱등(idempotent)한 작업만 선언적으로 재시도합니다.
+
+- 페이지 메서드: @retryable("page") 데코레이터 (읽기 전용 검증 메서드 등 여러 번 실행해도 안전한 메서드에만 적용)
+  재시도 중인 실행에서는 스크린샷을 찍지 말고, 최종 실패 증거는 데코레이터에 맡깁니다.
+- 시나리오 단계: ScenarioRunner.add_step(..., retry="step") 으로 선언하면 실패한 단계만
+  단계 시작 전 상태로 되돌리고 시작 화면으로 이동한 뒤 다시 실행합니다. (utils/scenario_runner.py)
+
+재시도 사이의 대기는 지수 백오프 + 지터(jitter)이며 대기 예산(utils/wait_budget.py)에서 차감됩니다.
+연속 일시 오류가 기준 횟수에 도달하면 서킷 브레이커가 열려 더 이상 재시도하지 않고,
+현재 기기를 격리(utils/device_health.py)하여 고장 난 기기를 계속 두드리지 않게 합니다.
+재시도 횟수와 재시도로 잃은 시간은 세션 종료 시 로그와 reports/retries/retries_<시각>.json으로 남깁니다.
+"""
+import functools
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from selenium.common import exceptions as selenium_exceptions
+from utils.config_manager import ConfigManager
+from utils.device_health import device_health
+from utils.logger import logger
+from utils.wait_budget import wait_budget
+
+# -> 세션이 끊어진 오류: 같은 드라이버로는 복구할 수 없으므로 단계 재실행 시 드라이버를 다시 연결합니다.
+SESSION_ERRORS = (selenium_exceptions.InvalidSessionIdException,)
+_DEFAULT_RETRY_ON = ("StaleElementReferenceException",)
+
+
+def _exception_types(names):
+    """
+    config.json의 예외 이름 목록을 selenium 예외 클래스로 변환합니다.
+    """
+    types = []
+    for name in names:
+        exception_type = getattr(selenium_exceptions, name, None)
+        if exception_type is None:
+            raise ValueError(f"알 수 없는 재시도 대상 예외: {name} (selenium.common.exceptions의 이름을 사용하세요)")
+        types.append(exception_type)
+    return tuple(types)
+
+
+class RetryPolicy:
+    """
+    재시도 정책 하나를 나타냅니다.
+    :param attempts: 최초 실행을 포함한 최대 실행 횟수
+    :param base_delay: 첫 재시도 전 대기(초). 이후 재시도마다 2배씩 늘어남
+    :param max_delay: 재시도 전 대기의 상한(초)
+    :param jitter: 대기 시간에 곱할 무작위 비율 범위 (0.3이면 ±30%)
+    :param retry_on: 재시도할 예외 클래스 튜플
+    """
+
+    def __init__(self, name, attempts=2, base_delay=1.0, max_delay=10.0, jitter=0.3, retry_on=()):
+        self.name = name
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    @classmethod
+    def from_config(cls, name, policy_config):
+        return cls(name,
+                   attempts=policy_config.get("attempts", 2),
+                   base_delay=policy_config.get("base_delay", 1.0),
+                   max_delay=policy_config.get("max_delay", 10.0),
+                   jitter=policy_config.get("jitter", 0.3),
+                   retry_on=_exception_types(policy_config.get("retry_on", _DEFAULT_RETRY_ON)))
+
+    def should_retry(self, error, attempt):
+        return attempt < self.attempts and isinstance(error, self.retry_on)
+
+    def delay(self, attempt, rng):
+        """
+        attempt번째 실행이 실패한 뒤 다음 실행 전까지 대기할 시간(초)을 반환합니다.
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return max(0.0, delay * (1 + rng.uniform(-self.jitter, self.jitter)))
+
+
+class CircuitOpen(Exception):
+    """
+    서킷 브레이커가 열린 상태에서 재시도를 요청했을 때, 원래 오류 대신 실패 원인으로 남기는 예외입니다.
+    """
+
+
+class RetryEngine:
+    """
+    [싱글턴 패턴 적용] 재시도 정책, 서킷 브레이커, 재시도 기록을 관리하는 클래스입니다. (config.json 'RetryPolicy')
+    - 서킷 브레이커: 재시도 대상 오류가 (성공 없이) 연속 failure_threshold회 발생하면 열리고,
+      cooldown_seconds 동안 모든 재시도를 거부합니다. 열릴 때 현재 기기를 격리합니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    retry_config = config_manager.config.get("RetryPolicy", {})
+                    breaker_config = retry_config.get("circuit_breaker", {})
+                    self.enabled = retry_config.get("enabled", True)
+                    self.policies = {name: RetryPolicy.from_config(name, policy_config)
+                                     for name, policy_config in retry_config.get("policies", {}).items()}
+                    self.failure_threshold = breaker_config.get("failure_threshold", 5)
+                    self.cooldown_seconds = breaker_config.get("cooldown_seconds", 300)
+                    self.quarantine_device = breaker_config.get("quarantine_device", True)
+                    self.retry_dir = os.path.join(config_manager.project_root, 'reports', 'retries')
+                    # -> 시나리오 난수(scenario_context)의 재현성에 영향을 주지 않도록 별도 난수 생성기를 사용합니다.
+                    self._rng = random.Random()
+                    self.consecutive_failures = 0
+                    self.opened_at = None
+                    self.events = []
+                    self._initialized = True
+
+    def policy(self, name):
+        if name not in self.policies:
+            raise ValueError(f"'{name}' 재시도 정책이 없습니다. (config.json 'RetryPolicy.policies': {sorted(self.policies)})")
+        return self.policies[name]
+
+    # --- 서킷 브레이커 ---
+    @property
+    def is_open(self):
+        if self.opened_at is None:
+            return False
+        if time.monotonic() - self.opened_at >= self.cooldown_seconds:
+            # -> 쿨다운이 지나면 반쯤 열린(half-open) 상태로 다음 1회 재시도를 허용합니다.
+            self.opened_at = None
+            self.consecutive_failures = self.failure_threshold - 1
+            return False
+        return True
+
+    def record_success(self):
+        self.consecutive_failures = 0
+
+    def record_failure(self, error):
+        self.consecutive_failures += 1
+        if self.consecutive_failures < self.failure_threshold or self.opened_at is not None:
+            return
+        self.opened_at = time.monotonic()
+        reason = f"연속 일시 오류 {self.consecutive_failures}회 (서킷 브레이커, 마지막 오류: {type(error).__name__})"
+        logger.error(f"🔌 서킷 브레이커 열림: {reason} - {self.cooldown_seconds}초 동안 재시도하지 않습니다.")
+        if self.quarantine_device and device_health.device_key:
+            device_health.quarantine(device_health.device_key, [reason])
+
+    # --- 재시도 ---
+    def _record(self, scope, label, attempt, error, lost_seconds, delay=None, outcome="retried"):
+        self.events.append({
+            "time": datetime.now().isoformat(timespec='seconds'),
+            "scope": scope,
+            "label": label,
+            "attempt": attempt,
+            "error": type(error).__name__,
+            "message": (str(getattr(error, "msg", None) or error).splitlines() or [""])[0][:200],
+            "lost_seconds": round(lost_seconds, 3),
+            "delay": round(delay, 3) if delay is not None else None,
+            "outcome": outcome,
+        })
+
+    def backoff(self, policy, attempt, label):
+        delay = policy.delay(attempt, self._rng)
+        wait_budget.sleep(delay, f"재시도 대기: {label}")
+        return delay
+
+    def call(self, policy_name, scope, label, func, before_retry=None):
+        """
+        func()를 정책에 따라 실행합니다. 재시도 대상 오류면 백오프 후 다시 실행하고, 아니면 그대로 전달합니다.
+        :param before_retry: 재시도 직전에 호출할 복구 함수 before_retry(error) (상태 복원, 화면 이동 등)
+        """
+        policy = self.policy(policy_name)
+        attempt = 1
+        while True:
+            started = time.monotonic()
+            try:
+                result = func()
+            except Exception as e:
+                lost = time.monotonic() - started
+                if not self.enabled or not isinstance(e, policy.retry_on):
+                    raise
+                self.record_failure(e)
+                if self.is_open:
+                    self._record(scope, label, attempt, e, lost, outcome="circuit_open")
+                    raise CircuitOpen(f"서킷 브레이커가 열려 재시도하지 않습니다: {label} - {type(e).__name__}") from e
+                if not policy.should_retry(e, attempt):
+                    self._record(scope, label, attempt, e, lost, outcome="gave_up")
+                    logger.error(f"🔁 재시도 한도 초과 ({policy.attempts}회): {label} - {type(e).__name__}")
+                    raise
+                delay = self.backoff(policy, attempt, label)
+                logger.warning(f"🔁 일시 오류로 재시도합니다 ({attempt + 1}/{policy.attempts}, {delay:.1f}초 후): "
+                               f"{label} - {type(e).__name__}")
+                if before_retry:
+                    recovery_started = time.monotonic()
+                    before_retry(e)
+                    delay += time.monotonic() - recovery_started
+                self._record(scope, label, attempt, e, lost, delay)
+                attempt += 1
+                continue
+            if attempt > 1:
+                logger.info(f"🔁 재시도로 복구되었습니다: {label} ({attempt}번째 실행)")
+            self.record_success()
+            return result
+
+    # --- 리포트 ---
+    def summary(self):
+        """
+        재시도 기록을 (범위, 라벨)별로 집계합니다. 잃은 시간 = 실패한 실행 시간 + 재시도 대기/복구 시간
+        """
+        totals = {}
+        for event in self.events:
+            entry = totals.setdefault((event["scope"], event["label"]),
+                                      {"scope": event["scope"], "label": event["label"], "retries": 0,
+                                       "failed": 0, "lost_seconds": 0.0, "errors": {}})
+            entry["retries"] += 1 if event["outcome"] == "retried" else 0
+            entry["failed"] += 0 if event["outcome"] == "retried" else 1
+            entry["lost_seconds"] += event["lost_seconds"] + (event["delay"] or 0.0)
+            entry["errors"][event["error"]] = entry["errors"].get(event["error"], 0) + 1
+        rows = sorted(totals.values(), key=lambda row: row["lost_seconds"], reverse=True)
+        for row in rows:
+            row["lost_seconds"] = round(row["lost_seconds"], 3)
+        return rows
+
+    def report(self):
+        """
+        재시도 요약을 로그와 reports/retries/retries_<시각>.json으로 남깁니다. (재시도가 없으면 남기지 않음)
+        """
+        if not self.events:
+            return None
+        rows = self.summary()
+        lost = sum(row["lost_seconds"] for row in rows)
+        lines = [f"🔁 재시도 요약: {sum(row['retries'] for row in rows)}회 재시도, 재시도로 잃은 시간 {lost:.1f}s"]
+        lines += [f"  - [{row['scope']}] {row['label']}: 재시도 {row['retries']}회, 최종 실패 {row['failed']}회, "
+                  f"{row['lost_seconds']:.1f}s ({', '.join(f'{name} {count}' for name, count in row['errors'].items())})"
+                  for row in rows]
+        logger.info("\n".join(lines))
+
+        os.makedirs(self.retry_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        file_path = os.path.join(self.retry_dir, f"retries_{timestamp}.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({"lost_seconds": round(lost, 3), "summary": rows, "events": self.events},
+                      f, ensure_ascii=False, indent=2)
+        return file_path
+
+
+retry_engine = RetryEngine()
+
+
+def retryable(policy_name="page"):
+    """
+    멱등한 페이지 메서드에 재시도 정책을 선언하는 데코레이터입니다.
+    실패 증거는 재시도마다 남기지 않고, 최종 실패 후 한 번만 '<메서드 이름>_failure'로 수집합니다.
+    (BasePage.capture_failure_evidence → 증거 수집 정책 config.json 'Evidence')
+    @retryable("page")
+    def verify_page_components(self, ...):
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            label = f"{type(self).__name__}.{func.__name__}"
+            try:
+                return retry_engine.call(policy_name, "page", label, lambda: func(self, *args, **kwargs))
+            except Exception:
+                capture = getattr(self, "capture_failure_evidence", None)
+                if capture:
+                    capture(f"{func.__name__}_failure")
+                raise
+        return wrapper
+    return decorator
+
+
+# --- pytest 훅 ---
+def pytest_sessionfinish(session, exitstatus):
+    retry_engine.report()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+시나리오/단계 실행 시간 기록(SQLite)입니다.
+모든 단계(step)와 시나리오(테스트) 실행 시간을 reports/history/run_history.db에 누적하고,
+병렬 실행기의 예상 소요 시간 계산과 추세(trend) 조회에 사용합니다.
+
+사용법 (프로젝트 루트에서 실행)
+    python -m utils.run_history trend [--kind step] [--days 7] [--threshold 20]
+    python -m utils.run_history show <이름> [--kind step] [--limit 20]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import closing
+from datetime import datetime, timedelta
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+class RunHistory:
+    """
+    [싱글턴 패턴 적용] 실행 시간 기록 DB를 관리하는 클래스입니다.
+    - kind='step'     : scenario=시나리오 이름, name=단계 이름
+    - kind='scenario' : scenario=pytest 노드 ID, name=매트릭스 케이스 ID(없으면 테스트 이름)
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    project_root = ConfigManager().project_root
+                    self.db_path = os.path.join(project_root, 'reports', 'history', 'run_history.db')
+                    self.device = None
+                    self._initialized = True
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS durations ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " kind TEXT NOT NULL,"
+            " scenario TEXT NOT NULL,"
+            " name TEXT NOT NULL,"
+            " device TEXT,"
+            " duration REAL NOT NULL,"
+            " passed INTEGER NOT NULL,"
+            " recorded_at TEXT NOT NULL)")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_durations_name ON durations (kind, name, recorded_at)")
+        return connection
+
+    def set_device(self, device):
+        """
+        이후 기록에 남길 기기(디바이스 설정 키)를 지정합니다.
+        """
+        self.device = device
+
+    def record(self, kind, scenario, name, duration, passed=True):
+        """
+        실행 시간 1건을 기록합니다. 기록 실패는 테스트 결과에 영향을 주지 않도록 경고만 남깁니다.
+        """
+        try:
+            with self._lock, closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "INSERT INTO durations (kind, scenario, name, device, duration, passed, recorded_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (kind, scenario, name, self.device, round(duration, 3), int(bool(passed)),
+                     datetime.now().isoformat(timespec='seconds')))
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 실행 시간 기록 실패: {e}")
+
+    def record_step(self, scenario, step, duration, passed=True):
+        self.record("step", scenario, step, duration, passed)
+
+    def record_scenario(self, node_id, name, duration, passed=True):
+        self.record("scenario", node_id, name, duration, passed)
+
+    def predicted_duration(self, name, kind="scenario", samples=5):
+        """
+        최근 성공한 실행 samples건의 평균 시간을 반환합니다. 기록이 없으면 None을 반환합니다.
+        """
+        if not os.path.exists(self.db_path):
+            return None
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT duration FROM durations WHERE kind = ? AND name = ? AND passed = 1"
+                " ORDER BY recorded_at DESC, id DESC LIMIT ?", (kind, name, samples)).fetchall()
+        if not rows:
+            return None
+        return sum(row[0] for row in rows) / len(rows)
+
+    def history(self, name, kind="step", limit=20):
+        """
+        이름별 최근 실행 기록을 (기록 시각, 기기, 시간, 성공 여부) 목록으로 반환합니다.
+        """
+        if not os.path.exists(self.db_path):
+            return []
+        with closing(self._connect()) as connection:
+            return connection.execute(
+                "SELECT recorded_at, device, duration, passed FROM durations WHERE kind = ? AND name = ?"
+                " ORDER BY recorded_at DESC, id DESC LIMIT ?", (kind, name, limit)).fetchall()
+
+    def trend(self, kind="step", days=7, now=None):
+        """
+        최근 days일 평균과 그 이전 days일 평균을 이름별로 비교합니다. (성공한 실행만 사용)
+        예: 'step3_discount' 단계가 지난주 대비 20% 느려졌는지 확인
+        :return: [{"name", "previous", "current", "change_percent", "runs"}] (변화율 큰 순)
+        """
+        if not os.path.exists(self.db_path):
+            return []
+        now = now or datetime.now()
+        current_start = (now - timedelta(days=days)).isoformat(timespec='seconds')
+        previous_start = (now - timedelta(days=days * 2)).isoformat(timespec='seconds')
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT name,"
+                " AVG(CASE WHEN recorded_at < ? THEN duration END),"
+                " AVG(CASE WHEN recorded_at >= ? THEN duration END),"
+                " SUM(CASE WHEN recorded_at >= ? THEN 1 ELSE 0 END)"
+                " FROM durations WHERE kind = ? AND passed = 1 AND recorded_at >= ?"
+                " GROUP BY name",
+                (current_start, current_start, current_start, kind, previous_start)).fetchall()
+
+        trends = []
+        for name, previous, current, runs in rows:
+            if previous is None or current is None or previous <= 0:
+                continue
+            trends.append({
+                "name": name,
+                "previous": round(previous, 2),
+                "current": round(current, 2),
+                "change_percent": round((current - previous) / previous * 100, 1),
+                "runs": runs,
+            })
+        return sorted(trends, key=lambda item: abs(item["change_percent"]), reverse=True)
+
+
+run_history = RunHistory()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시나리오/단계 실행 시간 기록 조회")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    trend_parser = subparsers.add_parser("trend", help="이전 기간 대비 평균 실행 시간 변화")
+    trend_parser.add_argument("--kind", choices=["step", "scenario"], default="step")
+    trend_parser.add_argument("--days", type=int, default=7, help="비교 기간(일)")
+    trend_parser.add_argument("--threshold", type=float, default=0, help="이 비율(%%) 이상 변한 항목만 출력")
+    show_parser = subparsers.add_parser("show", help="이름별 최근 실행 기록")
+    show_parser.add_argument("name")
+    show_parser.add_argument("--kind", choices=["step", "scenario"], default="step")
+    show_parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.command == "trend":
+        for item in run_history.trend(args.kind, args.days):
+            if abs(item["change_percent"]) >= args.threshold:
+                direction = "느려짐" if item["change_percent"] > 0 else "빨라짐"
+                print(f"{item['name']}: {item['previous']}s → {item['current']}s "
+                      f"({item['change_percent']:+.1f}%, {direction}, 최근 {item['runs']}회)")
+        return 0
+    for recorded_at, device, duration, passed in run_history.history(args.name, args.kind, args.limit):
+        print(f"{recorded_at}  {device or '-'}  {duration:.2f}s  {'성공' if passed else '실패'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import random
+import threading
+from utils.coverage import SelectionPolicy, coverage_store
+from utils.logger import logger
+
+
+class ScenarioContext:
+    """
+    [싱글턴 패턴 적용] 현재 실행 중인 시나리오 케이스(매트릭스 케이스)의 선택값과 시드를 보관하는 클래스입니다.
+    페이지 객체는 random.choice 대신 BasePage.choose_option()을 통해 이 컨텍스트에서 옵션을 고릅니다.
+    - 케이스가 차원 값을 지정한 경우: 화면 옵션 중 그 값과 일치하는 옵션을 선택
+    - 지정하지 않았거나 '*'인 경우: 케이스 시드로 만든 난수 생성기로 선택 (같은 시드면 같은 선택 → 재현 가능)
+      coverage 정책이면 이전 실행에서 덜 실행된 조합의 값들 중에서 시드 기반으로 선택합니다.
+      (매트릭스 케이스는 기본적으로 uniform 정책이므로 case_id만으로 재현됩니다. utils/coverage.py 참고)
+    실제 선택값은 choices에 기록되어 커버리지 저장소와 --replay 재실행에 사용됩니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+    ANY = "*"
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    self.activate(None)
+                    self._initialized = True
+
+    def activate(self, case=None, seed=None, replay=None):
+        """
+        시나리오 케이스를 활성화합니다.
+        :param case: ScenarioCase (None이면 선택값 지정 없이 시드만 사용)
+        :param seed: 케이스가 없을 때 사용할 시드 (None이면 새로 생성하여 로그로 남김)
+        :param replay: 이전 실행의 선택 기록 (coverage_store.load_run 결과). 기록된 선택값과 시드를 그대로 사용
+        """
+        self.case = case
+        self.params = dict(case.params) if case else {}
+        if replay:
+            self.params.update(replay["choices"])
+            self.seed = replay["seed"]
+        elif case is not None:
+            self.seed = case.seed
+        else:
+            self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.choices = {}
+        logger.info(f"🎲 시나리오 컨텍스트 활성화: 케이스={getattr(case, 'case_id', None)}, 시드={self.seed}")
+
+    def choose(self, dimension, options, key=None):
+        """
+        차원(dimension)에 대한 옵션 하나를 선택하고 선택 결과를 기록합니다.
+        :param dimension: 차원 이름 (예: 'payment_method', 'transfer_day')
+        :param options: 선택 후보 목록 (문자열 또는 WebElement 등)
+        :param key: 후보를 차원 값(문자열)으로 바꾸는 함수 (None이면 str)
+        :return: 선택한 후보
+        """
+        if not options:
+            raise ValueError(f"'{dimension}' 선택 후보가 비어있습니다.")
+        key = key or str
+        wanted = self.params.get(dimension, self.ANY)
+
+        selected = None
+        if wanted != self.ANY:
+            for option in options:
+                if key(option) == wanted:
+                    selected = option
+                    break
+            if selected is None:
+                logger.warning(f"⚠️ 케이스가 지정한 '{dimension}={wanted}' 옵션이 화면에 없어 시드 기반으로 선택합니다.")
+        if selected is None:
+            candidates = list(options)
+            if coverage_store.policy_for(getattr(self.case, "case_id", None)) == SelectionPolicy.COVERAGE:
+                least_covered = coverage_store.rank(dimension, [key(option) for option in candidates], self.choices)
+                candidates = [option for option in candidates if key(option) in least_covered]
+            selected = self.rng.choice(candidates)
+
+        self.choices[dimension] = key(selected)
+        return selected
+
+
+scenario_context = ScenarioContext()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import itertools
+import json
+import os
+import zlib
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+class ScenarioCase:
+    """
+    시나리오 매트릭스의 케이스 하나입니다.
+    case_id와 seed는 params만으로 결정되므로, 같은 케이스는 언제 어디서 실행해도 같은 선택을 합니다.
+    """
+
+    def __init__(self, params):
+        self.params = dict(params)
+        canonical = json.dumps(self.params, ensure_ascii=False, sort_keys=True)
+        self.seed = zlib.crc32(canonical.encode('utf-8'))
+        self.case_id = "-".join(str(value) for value in self.params.values())
+
+    def __repr__(self):
+        return f"ScenarioCase({self.case_id}, seed={self.seed})"
+
+
+def load_matrix(file_name='scenario_matrix.json'):
+    """
+    data/scenario_matrix.json에서 차원(dimensions)과 제외 조합(exclude)을 읽어옵니다.
+    """
+    config_manager = ConfigManager()
+    file_path = os.path.join(config_manager.project_root, 'data', file_name)
+    return config_manager._load_json(file_path, "시나리오 매트릭스")
+
+
+def _is_excluded(params, exclude_rules):
+    for rule in exclude_rules:
+        if all(params.get(dimension) == value for dimension, value in rule.items()):
+            return True
+    return False
+
+
+def expand_matrix(matrix):
+    """
+    차원 값들의 모든 조합(카테시안 곱)을 만들고, 제외 규칙에 걸리는 조합을 뺀 케이스 목록을 반환합니다.
+    차원 순서는 JSON 선언 순서를 따르므로 케이스 순서와 ID는 항상 같습니다.
+    """
+    dimensions = matrix.get("dimensions", {})
+    exclude_rules = matrix.get("exclude", [])
+    names = list(dimensions.keys())
+
+    cases = []
+    for values in itertools.product(*(dimensions[name] for name in names)):
+        params = dict(zip(names, values))
+        if not _is_excluded(params, exclude_rules):
+            cases.append(ScenarioCase(params))
+    logger.info(f"시나리오 매트릭스 확장: {len(cases)}개 케이스 (차원: {names})")
+    return cases
+
+
+def parse_shard(shard_option):
+    """
+    '--shard 1/3' 형식의 문자열을 (0부터 시작하는 인덱스, 전체 수)로 변환합니다.
+    """
+    try:
+        index, count = (int(part) for part in shard_option.split("/"))
+    except (AttributeError, ValueError):
+        raise ValueError(f"샤드 형식이 잘못되었습니다: {shard_option} (예: 1/3)")
+    if not 1 <= index <= count:
+        raise ValueError(f"샤드 번호는 1부터 {count} 사이여야 합니다: {shard_option}")
+    return index - 1, count
+
+
+def shard_cases(cases, shard_index, shard_count):
+    """
+    케이스를 순서대로 돌아가며(round-robin) 샤드에 배분하고, shard_index 샤드의 케이스만 반환합니다.
+    """
+    return [case for position, case in enumerate(cases) if position % shard_count == shard_index]
+
+
+def schedule_longest_first(cases, workers, predict):
+    """
+    예상 소요 시간이 긴 케이스부터, 그 시점에 누적 예상 시간이 가장 짧은 작업자(기기)에게 배정합니다. (LPT 스케줄링)
+    기록이 없는 케이스는 기록된 케이스들의 평균 시간(기록이 전혀 없으면 1)으로 예상합니다.
+    :param predict: predict(case) -> 예상 소요 시간(초) 또는 None
+    :return: ({작업자: [케이스, ...]}, {작업자: 누적 예상 시간})
+    """
+    predictions = {case.case_id: predict(case) for case in cases}
+    known = [value for value in predictions.values() if value is not None]
+    default = sum(known) / len(known) if known else 1
+    predictions = {case_id: (default if value is None else value) for case_id, value in predictions.items()}
+
+    assignments = {worker: [] for worker in workers}
+    loads = {worker: 0.0 for worker in workers}
+    for case in sorted(cases, key=lambda case: predictions[case.case_id], reverse=True):
+        worker = min(workers, key=lambda name: loads[name])
+        assignments[worker].append(case)
+        loads[worker] += predictions[case.case_id]
+    return assignments, loads
+
+
+def save_case_ids(file_path, cases):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump([case.case_id for case in cases], f, ensure_ascii=False, indent=2)
+
+
+def load_case_ids(file_path):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+import time
+from utils.checkpoint import checkpoint_store
+from utils.device_health import device_health
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.logger import logger
+from utils.navigation import navigation_tracker
+from utils.retry_policy import SESSION_ERRORS, retry_engine
+from utils.run_history import run_history
+from utils.soft_assert import soft_assertions
+from utils.wait_budget import wait_budget
+
+
+class ScenarioStep:
+    """
+    시나리오의 한 단계를 나타냅니다.
+    :param name: 단계 이름 (--start-at 옵션에서 사용)
+    :param func: 단계 함수 func(driver, platform, state) -> 상태에 병합할 dict 또는 None
+    :param screen: 단계가 시작되는 화면 이름 (screen_locators.json의 키)
+    :param retry: 일시 오류 시 단계를 다시 실행할 재시도 정책 이름 (config.json 'RetryPolicy.policies', 멱등한 단계만 선언)
+    """
+
+    def __init__(self, name, func, screen=None, retry=None):
+        self.name = name
+        self.func = func
+        self.screen = screen
+        self.retry = retry
+
+
+class ScenarioRunner:
+    """
+    단계(step) 목록을 순서대로 실행하고, 각 단계가 끝날 때마다 체크포인트를 저장하는 실행기입니다.
+    단계별 실행 시간은 실행 기록 DB(utils/run_history.py)에 남깁니다.
+    실행 중 BasePage의 모든 대기/sleep은 단계별·시나리오별 대기 예산(utils/wait_budget.py)에서 차감됩니다.
+    단계 사이마다 기기 상태(utils/device_health.py)를 주기적으로 점검하여, 불량 기기에서는 DeviceUnhealthy로 중단합니다.
+    재시도 정책을 선언한 단계는 일시 오류가 나면 단계 시작 전 상태로 되돌리고 시작 화면으로 이동한 뒤 그 단계만 다시 실행합니다.
+    (utils/retry_policy.py, 세션이 끊어진 경우 reconnect로 드라이버를 다시 연결)
+    단계 중 소프트 검증 실패(utils/soft_assert.py)는 흐름을 멈추지 않고 모아 두었다가, 모든 단계가 끝난 뒤 한 번에 실패 처리합니다.
+    start_at을 지정하면 직전 단계의 체크포인트 상태를 불러오고,
+    navigator로 현재 화면에서 해당 단계의 시작 화면까지 최단 경로로 이동한 뒤 그 단계부터 실행합니다.
+    """
+
+    def __init__(self, scenario_name, driver, platform, state=None, navigator=None, reconnect=None):
+        """
+        :param scenario_name: 체크포인트 파일 이름으로 쓰이는 시나리오 이름
+        :param state: 초기 시나리오 상태 (테스트 데이터 등)
+        :param navigator: navigator(driver, platform, target_screen, state) 형태의 화면 이동 함수
+        :param reconnect: reconnect() -> 새 driver 형태의 드라이버 재연결 함수 (세션이 끊어진 단계를 재시도할 때 사용)
+        """
+        self.scenario_name = scenario_name
+        self.driver = driver
+        self.platform = platform
+        self.state = dict(state or {})
+        self.navigator = navigator
+        self.reconnect = reconnect
+        self.steps = []
+        # -> 실행 중(또는 실패한) 단계 이름
+        self.current_step = None
+
+    def add_step(self, name, func, screen=None, retry=None):
+        self.steps.append(ScenarioStep(name, func, screen, retry))
+        return self
+
+    def step_names(self):
+        return [step.name for step in self.steps]
+
+    def _resume(self, start_at):
+        """
+        start_at 단계부터 시작하기 위해 체크포인트 상태를 복원하고 시작 화면으로 이동합니다.
+        """
+        if start_at not in self.step_names():
+            raise ValueError(f"'{start_at}' 단계가 없습니다. (가능한 단계: {self.step_names()})")
+
+        restored = checkpoint_store.state_before(self.scenario_name, self.step_names(), start_at)
+        if restored:
+            logger.info(f"💾 체크포인트 상태를 복원합니다: {sorted(restored.keys())}")
+            self.state.update(restored)
+        else:
+            logger.info("ℹ️ 복원할 체크포인트가 없어 테스트 데이터 상태로 시작합니다.")
+
+        start_step = self.steps[self.step_names().index(start_at)]
+        if start_step.screen and self.navigator:
+            self.navigator(self.driver, self.platform, start_step.screen, self.state)
+
+    def _prepare_retry(self, step, snapshot, error):
+        """
+        단계를 다시 실행하기 전에 상태를 단계 시작 전으로 되돌리고, 필요하면 드라이버를 다시 연결한 뒤 시작 화면으로 이동합니다.
+        """
+        self.state.clear()
+        self.state.update(snapshot)
+        soft_assertions.discard_step(step.name)
+        if isinstance(error, SESSION_ERRORS):
+            if not self.reconnect:
+                raise error
+            logger.warning("🔌 Appium 세션이 끊어져 드라이버를 다시 연결합니다.")
+            self.driver = self.reconnect()
+        if step.screen and self.navigator:
+            self.navigator(self.driver, self.platform, step.screen, self.state)
+
+    def _execute(self, step):
+        def run_once():
+            with instrumentation.span(step.name, SpanCategory.STEP, scenario=self.scenario_name):
+                return step.func(self.driver, self.platform, self.state)
+
+        if not step.retry:
+            return run_once()
+        snapshot = dict(self.state)
+        return retry_engine.call(step.retry, "step", f"{self.scenario_name} / {step.name}", run_once,
+                                 before_retry=lambda error: self._prepare_retry(step, snapshot, error))
+
+    def run(self, start_at=None, stop_after=None):
+        """
+        시나리오를 실행합니다.
+        :param start_at: 시작할 단계 이름 (None이면 처음부터)
+        :param stop_after: 이 단계까지만 실행 (None이면 끝까지)
+        :return: 최종 시나리오 상태
+        :raises SoftAssertionError: 모든 단계가 끝났지만 소프트 검증 실패가 있는 경우
+        """
+        wait_budget.start_scenario(self.scenario_name)
+        soft_assertions.reset()
+        try:
+            state = self._run_steps(start_at, stop_after)
+        except BaseException:
+            # -> 다른 오류로 중단되어도 그때까지 모인 소프트 검증 실패는 로그로 남깁니다.
+            soft_assertions.log_pending()
+            raise
+        finally:
+            wait_budget.end_scenario()
+        soft_assertions.assert_all()
+        return state
+
+    def _run_steps(self, start_at, stop_after):
+        steps = self.steps
+        if start_at:
+            logger.info(f"⏩ '{start_at}' 단계부터 시나리오를 시작합니다.")
+            self._resume(start_at)
+            steps = steps[self.step_names().index(start_at):]
+
+        for index, step in enumerate(steps):
+            self.current_step = step.name
+            device_health.checkpoint()
+            logger.info(f"▶️ [{self.scenario_name}] '{step.name}' 단계 시작")
+            wait_budget.start_step(step.name)
+            started = time.monotonic()
+            try:
+                result = self._execute(step)
+            except BaseException:
+                run_history.record_step(self.scenario_name, step.name, time.monotonic() - started, passed=False)
+                raise
+            run_history.record_step(self.scenario_name, step.name, time.monotonic() - started)
+            if result:
+                self.state.update(result)
+            # -> 단계 완료 직후 화면: 다음 단계의 시작 화면이 선언되어 있으면 그 화면, 없으면 마지막으로 판별된 화면
+            next_screen = steps[index + 1].screen if index + 1 < len(steps) else None
+            checkpoint_store.save(self.scenario_name, step.name,
+                                  next_screen or navigation_tracker.last_screen, self.state)
+            if stop_after and step.name == stop_after:
+                logger.info(f"⏹️ '{stop_after}' 단계까지 실행하고 종료합니다.")
+                break
+        return self.state
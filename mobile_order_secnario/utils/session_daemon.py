@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+개발 반복용 Appium 세션 데몬입니다.
+오래 유지되는 Appium 세션 하나를 만들고, 세션 ID를 reports/session/session.json에 기록합니다.
+pytest --attach-session 옵션으로 새 세션(앱 실행, 로그인) 없이 이 세션에 붙어 테스트를 실행할 수 있습니다.
+
+사용법 (프로젝트 루트에서 실행)
+    python -m utils.session_daemon start [--platform Android] [--keepalive 60]
+    python -m utils.session_daemon status
+    python -m utils.session_daemon stop
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+from datetime import datetime
+from utils.appium_driver import init_appium_driver
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+def session_file_path():
+    """
+    데몬이 세션 정보를 기록하는 파일 경로를 반환합니다.
+    """
+    project_root = ConfigManager().project_root
+    return os.path.join(project_root, 'reports', 'session', 'session.json')
+
+
+def load_session_info():
+    """
+    데몬이 기록한 세션 정보를 반환합니다. 데몬이 실행 중이 아니면 None을 반환합니다.
+    """
+    file_path = session_file_path()
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _is_process_alive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except (OSError, TypeError):
+        return False
+
+
+def start(platform_name, keepalive_interval):
+    """
+    세션을 만들고, 종료 신호를 받을 때까지 주기적으로 가벼운 명령을 보내 세션을 유지합니다.
+    (newCommandTimeout으로 세션이 끊기지 않도록 keepalive_interval 초마다 명령 전송)
+    """
+    info = load_session_info()
+    if info and _is_process_alive(info.get("pid")):
+        logger.info(f"ℹ️ 세션 데몬이 이미 실행 중입니다. (pid: {info['pid']}, 세션: {info['session_id']})")
+        return
+
+    driver, platform = init_appium_driver(platform_name=platform_name)
+    server_url = ConfigManager().config.get("Appium", {}).get("server_url", "http://127.0.0.1:4723/wd/hub")
+    info = {
+        "pid": os.getpid(),
+        "session_id": driver.session_id,
+        "server_url": server_url,
+        "platform": platform,
+        "device_key": f"Capabilities_{platform}",
+        "capabilities": driver.caps,
+        "started_at": datetime.now().isoformat(timespec='seconds'),
+    }
+    file_path = session_file_path()
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(info, f, ensure_ascii=False, indent=2, default=str)
+    logger.info(f"✅ 세션 데몬 시작 (세션: {driver.session_id}) → {file_path}")
+
+    running = {"value": True}
+
+    def _handle_stop(signum, frame):
+        running["value"] = False
+
+    signal.signal(signal.SIGTERM, _handle_stop)
+    signal.signal(signal.SIGINT, _handle_stop)
+
+    last_ping = time.monotonic()
+    try:
+        while running["value"]:
+            time.sleep(1)
+            if time.monotonic() - last_ping >= keepalive_interval:
+                last_ping = time.monotonic()
+                try:
+                    driver.get_window_size()
+                except Exception as e:
+                    logger.error(f"❌ 세션 유지 명령 실패, 데몬을 종료합니다: {e}")
+                    break
+    finally:
+        logger.info("세션 데몬을 종료합니다. (Appium 세션 종료)")
+        try:
+            driver.quit()
+        finally:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+
+def status():
+    info = load_session_info()
+    if not info or not _is_process_alive(info.get("pid")):
+        print("세션 데몬이 실행 중이 아닙니다.")
+        return 1
+    print(json.dumps({k: v for k, v in info.items() if k != "capabilities"}, ensure_ascii=False, indent=2))
+    return 0
+
+
+def stop():
+    info = load_session_info()
+    if not info or not _is_process_alive(info.get("pid")):
+        print("세션 데몬이 실행 중이 아닙니다.")
+        return 1
+    os.kill(info["pid"], signal.SIGTERM)
+    print(f"세션 데몬(pid: {info['pid']})에 종료 신호를 보냈습니다.")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Appium 세션 데몬")
+    parser.add_argument("command", choices=["start", "status", "stop"])
+    parser.add_argument("--platform", default="Android", help="Android 또는 iOS")
+    parser.add_argument("--keepalive", type=int, default=60, help="세션 유지 명령 전송 주기(초)")
+    args = parser.parse_args(argv)
+
+    if args.command == "start":
+        start(args.platform, max(1, args.keepalive))
+        return 0
+    if args.command == "status":
+        return status()
+    return stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
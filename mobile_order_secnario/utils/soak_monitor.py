@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+장시간(soak) 실행 중 테스트 프로세스(pytest) 자체의 메모리 증가를 측정합니다.
+연속 주문 모드(utils/throughput.py)를 몇 시간씩 돌릴 때 프레임워크가 새는지
+(로거 핸들러 누적, WebElement 참조 누적, 계속 커지는 기록 리스트/딕셔너리 등) 확인하기 위해,
+반복 N회마다 tracemalloc 스냅샷과 RSS를 기록하고 반복 횟수 대비 증가량(반복당 KB)을 계산합니다.
+증가량이 기준(config.json 'Soak')을 넘으면 시작 시점 대비 가장 많이 늘어난 할당 위치(top allocation sites)를 남깁니다.
+
+사용법
+    pytest -k test_order_throughput --order-loop 0 --soak 240    # 240분 동안 연속 주문 + 메모리 측정
+결과는 reports/soak/soak_<시각>.json (샘플, 프레임워크 카운터, 할당 위치 덤프)에 저장됩니다.
+"""
+import ctypes
+import gc
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from selenium.webdriver.remote.webelement import WebElement
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+from utils.wait_budget import wait_budget
+
+_MB = 1024 * 1024
+# -> 할당 위치 집계에서 제외할 측정 도구 자체(샘플 기록 포함)의 프레임
+_IGNORED_FILES = (__file__, tracemalloc.__file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>",
+                  "<unknown>")
+
+
+def rss_bytes():
+    """
+    현재 프로세스의 RSS(상주 메모리)를 바이트로 반환합니다. (Linux: /proc, Windows: psapi, 그 외: 최대 RSS)
+    """
+    if sys.platform.startswith("linux"):
+        with open("/proc/self/status", 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    if sys.platform == "win32":
+        class _ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", ctypes.c_ulong), ("PageFaultCount", ctypes.c_ulong),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb)
+        return counters.WorkingSetSize
+    import resource
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # -> macOS는 바이트, 그 외 유닉스는 KB 단위
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _slope(points):
+    """
+    (반복 횟수, 값) 목록의 최소제곱 기울기(반복당 증가량)를 반환합니다.
+    """
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def _framework_counters():
+    """
+    누수 후보로 의심되는 프레임워크 객체 수를 반환합니다.
+    """
+    return {
+        "logger_handlers": len(logger.handlers),
+        "web_elements": sum(1 for obj in gc.get_objects() if isinstance(obj, WebElement)),
+        "wait_budget_charges": len(wait_budget.charges),
+        "gc_objects": len(gc.get_objects()),
+    }
+
+
+class SoakMonitor:
+    """
+    [싱글턴 패턴 적용] 반복 횟수에 따른 테스트 프로세스 메모리(RSS, tracemalloc)를 기록하고 증가 원인을 찾는 클래스입니다. (config.json 'Soak')
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    soak_config = config_manager.config.get("Soak", {})
+                    self.enabled = soak_config.get("enabled", False)
+                    self.sample_every = soak_config.get("sample_every", 5)
+                    self.traceback_frames = soak_config.get("traceback_frames", 10)
+                    self.growth_threshold_mb = soak_config.get("growth_threshold_mb", 100)
+                    self.per_iteration_threshold_kb = soak_config.get("per_iteration_threshold_kb", 256)
+                    self.min_samples = soak_config.get("min_samples", 4)
+                    self.top = soak_config.get("top", 15)
+                    self.soak_dir = os.path.join(config_manager.project_root, 'reports', 'soak')
+                    self.baseline = None
+                    self.samples = []
+                    self.dumps = []
+                    self._started_tracemalloc = False
+                    self._initialized = True
+
+    def start(self):
+        """
+        tracemalloc을 시작하고 기준 스냅샷/RSS를 기록합니다. (비활성화 상태면 아무것도 하지 않음)
+        """
+        if not self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_frames)
+            self._started_tracemalloc = True
+        self.samples = []
+        self.dumps = []
+        self.baseline = self._snapshot()
+        self._record(0, self.baseline)
+        logger.info(f"🧪 soak 메모리 측정 시작: RSS {self.samples[0]['rss_mb']}MB, {self.sample_every}회 반복마다 기록")
+
+    def stop(self):
+        if not self.enabled or self.baseline is None:
+            return None
+        file_path = self.report()
+        self.baseline = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        return file_path
+
+    @staticmethod
+    def _snapshot():
+        gc.collect()
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES])
+
+    def _record(self, iteration, snapshot):
+        traced, _ = tracemalloc.get_traced_memory()
+        sample = {"iteration": iteration, "time": round(time.time(), 1), "rss_mb": round(rss_bytes() / _MB, 2),
+                  "traced_mb": round(traced / _MB, 2), "counters": _framework_counters()}
+        self.samples.append(sample)
+        return sample
+
+    def growth(self):
+        """
+        시작 대비 RSS/tracemalloc 증가량(MB)과 반복당 증가량(KB, 최소제곱 기울기)을 반환합니다.
+        """
+        first, last = self.samples[0], self.samples[-1]
+        return {
+            "rss_mb": round(last["rss_mb"] - first["rss_mb"], 2),
+            "traced_mb": round(last["traced_mb"] - first["traced_mb"], 2),
+            "rss_kb_per_iteration": round(_slope([(s["iteration"], s["rss_mb"] * 1024) for s in self.samples]), 1),
+            "traced_kb_per_iteration": round(_slope([(s["iteration"], s["traced_mb"] * 1024)
+                                                     for s in self.samples]), 1),
+        }
+
+    def _exceeded(self, growth):
+        if len(self.samples) < self.min_samples:
+            return False
+        return (growth["rss_mb"] >= self.growth_threshold_mb
+                or growth["traced_kb_per_iteration"] >= self.per_iteration_threshold_kb)
+
+    def top_allocations(self, snapshot):
+        """
+        기준 스냅샷 대비 가장 많이 늘어난 할당 위치(traceback)를 반환합니다.
+        """
+        rows = []
+        for stat in snapshot.compare_to(self.baseline, "traceback")[:self.top]:
+            if stat.size_diff <= 0:
+                break
+            rows.append({"size_diff_kb": round(stat.size_diff / 1024, 1), "count_diff": stat.count_diff,
+                         "traceback": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback]})
+        return rows
+
+    def on_iteration(self, iteration):
+        """
+        반복이 끝날 때마다 호출합니다. sample_every회마다 메모리를 기록하고, 증가량이 기준을 넘으면 할당 위치를 덤프합니다.
+        """
+        if self.baseline is None or iteration % self.sample_every:
+            return
+        snapshot = self._snapshot()
+        sample = self._record(iteration, snapshot)
+        growth = self.growth()
+        logger.info(f"🧪 soak #{iteration}: RSS {sample['rss_mb']}MB (+{growth['rss_mb']}MB), "
+                    f"tracemalloc {sample['traced_mb']}MB, 반복당 {growth['traced_kb_per_iteration']}KB, "
+                    f"{sample['counters']}")
+        if not self._exceeded(growth):
+            return
+        allocations = self.top_allocations(snapshot)
+        self.dumps.append({"iteration": iteration, "growth": growth, "top_allocations": allocations})
+        lines = [f"⚠️ soak 메모리 증가 기준 초과 (반복 {iteration}회): RSS +{growth['rss_mb']}MB, "
+                 f"반복당 {growth['traced_kb_per_iteration']}KB - 시작 대비 증가한 할당 위치 상위 {len(allocations)}개:"]
+        lines += [f"  +{row['size_diff_kb']}KB ({row['count_diff']:+d}개) {row['traceback'][-1]}" for row in allocations]
+        logger.warning("\n".join(lines))
+        # -> 같은 증가분을 반복해서 덤프하지 않도록 현재 스냅샷을 새 기준으로 삼습니다.
+        self.baseline = snapshot
+
+    def report(self):
+        """
+        샘플, 증가량, 할당 위치 덤프를 reports/soak/soak_<시각>.json으로 저장합니다.
+        """
+        if len(self.samples) < 2:
+            return None
+        growth = self.growth()
+        logger.info(f"🧪 soak 메모리 요약: {self.samples[-1]['iteration']}회 반복, RSS +{growth['rss_mb']}MB, "
+                    f"반복당 RSS {growth['rss_kb_per_iteration']}KB / tracemalloc {growth['traced_kb_per_iteration']}KB, "
+                    f"기준 초과 {len(self.dumps)}회")
+        os.makedirs(self.soak_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        file_path = os.path.join(self.soak_dir, f"soak_{timestamp}.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({"growth": growth, "samples": self.samples, "dumps": self.dumps}, f, ensure_ascii=False, indent=2)
+        return file_path
+
+
+soak_monitor = SoakMonitor()
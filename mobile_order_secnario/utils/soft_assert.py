@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+from utils.config_manager import ConfigManager
+from utils.evidence import EvidencePolicy, evidence_collector
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.logger import logger
+
+_OUTSIDE_STEP = "(단계 밖)"
+
+
+class SoftAssertionError(AssertionError):
+    """
+    시나리오가 끝날 때 누적된 소프트 검증 실패를 한 번에 보고하는 예외입니다.
+    """
+
+
+class SoftAssertions:
+    """
+    [싱글턴 패턴 적용] 흐름을 멈추지 않는 검증(소프트 검증) 실패를 모았다가 시나리오 끝에서 한 번에 실패 처리하는 클래스입니다.
+    (config.json 'SoftAssert')
+    - 불일치는 가볍게 기록만 하고 흐름을 계속 진행합니다.
+    - 증거(화면 계층 XML + 스크린샷)는 단계마다 첫 실패 때 한 번만 수집합니다. (증거 수집 정책 --evidence를 따름)
+    - ScenarioRunner가 시나리오 시작 시 초기화하고, 모든 단계가 끝나면 assert_all()로 모든 실패를 모아 보고합니다.
+    비활성화하면 기존처럼 로그만 남깁니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    soft_config = config_manager.config.get("SoftAssert", {})
+                    self.enabled = soft_config.get("enabled", True)
+                    self.capture_hierarchy = soft_config.get("hierarchy", True)
+                    self.capture_screenshot = soft_config.get("screenshot", True)
+                    self.evidence_dir = os.path.join(config_manager.project_root, 'reports', 'soft_assert')
+                    self.failures = []
+                    self._captured_steps = set()
+                    self._initialized = True
+
+    def reset(self):
+        self.failures = []
+        self._captured_steps = set()
+
+    def discard_step(self, step_name):
+        """
+        다시 실행할 단계의 이전 시도에서 기록된 실패와 증거 수집 여부를 지웁니다. (단계 재시도 시)
+        """
+        self.failures = [failure for failure in self.failures if failure["step"] != step_name]
+        self._captured_steps.discard(step_name)
+
+    @staticmethod
+    def _location():
+        step = instrumentation.active(SpanCategory.STEP)
+        current = instrumentation.current()
+        page = current.ancestor(SpanCategory.PAGE) if current else None
+        return (step.name if step else _OUTSIDE_STEP), (page.name if page else "-")
+
+    def _capture(self, page, step_name):
+        """
+        단계의 첫 실패일 때만 화면 계층 XML과 스크린샷을 남깁니다.
+        """
+        if step_name in self._captured_steps or evidence_collector.policy == EvidencePolicy.OFF:
+            return None
+        self._captured_steps.add(step_name)
+        name = f"soft_assert_{step_name}"
+        hierarchy_path = None
+        if self.capture_hierarchy:
+            try:
+                os.makedirs(self.evidence_dir, exist_ok=True)
+                hierarchy_path = os.path.join(self.evidence_dir, f"{name}_{time.time()}.xml")
+                with instrumentation.span(name, SpanCategory.SCREENSHOT, kind="hierarchy"):
+                    page_source = page.driver.page_source
+                with open(hierarchy_path, 'w', encoding='utf-8') as f:
+                    f.write(page_source)
+            except WebDriverException as e:
+                logger.error(f"화면 계층 저장 실패: {e}")
+                hierarchy_path = None
+        if self.capture_screenshot:
+            evidence_collector.capture(page, name)
+        return hierarchy_path
+
+    def check(self, page, condition, message):
+        """
+        조건이 거짓이면 실패를 기록하고 흐름을 계속 진행합니다.
+        :param page: 증거를 수집할 페이지 객체 (BasePage)
+        :return: 조건 결과 (호출부에서 성공 로그 분기에 사용)
+        """
+        if condition:
+            return True
+        logger.error(f"❌ [소프트 검증 실패] {message}")
+        if not self.enabled:
+            return False
+        step_name, page_method = self._location()
+        hierarchy_path = self._capture(page, step_name)
+        self.failures.append({"step": step_name, "page_method": page_method, "message": message,
+                              "hierarchy": hierarchy_path})
+        return False
+
+    def report(self):
+        lines = [f"소프트 검증 실패 {len(self.failures)}건:"]
+        lines += [f"  {index}. [{failure['step']}] {failure['page_method']}: {failure['message']}"
+                  + (f" (화면 계층: {failure['hierarchy']})" if failure["hierarchy"] else "")
+                  for index, failure in enumerate(self.failures, start=1)]
+        return "\n".join(lines)
+
+    def log_pending(self):
+        """
+        시나리오가 다른 오류로 중단되었을 때, 그때까지 모인 소프트 검증 실패를 로그로 남깁니다.
+        """
+        if self.failures:
+            logger.error(self.report())
+
+    def assert_all(self):
+        """
+        기록된 실패가 있으면 모든 실패를 모은 SoftAssertionError를 발생시킵니다.
+        """
+        if not self.failures:
+            return
+        report = self.report()
+        logger.error(report)
+        raise SoftAssertionError(report)
+
+
+soft_assertions = SoftAssertions()
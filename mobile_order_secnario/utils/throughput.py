@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+한 세션 안에서 주문을 연속으로 생성하는 처리량(throughput) 모드입니다.
+앱을 통한 주문 백엔드 부하 검증을 위해, 주문 1건(Step4까지, 이후 Step5/Step6 추가 예정)을 마칠 때마다
+드라이버를 종료하지 않고 모바일 주문 홈으로 돌아가 '일반 주문하기'로 다음 주문을 만듭니다.
+반복마다 주문 데이터 스트림에서 새 레코드를 하나씩 가져오며,
+시간당 주문 수, 반복별 소요 시간(p50/p90/최대), 실패율을 로그와 reports/throughput/throughput_<시각>.json으로 남깁니다.
+--soak 옵션을 주면 반복 횟수에 따른 테스트 프로세스 메모리 증가도 함께 측정합니다. (utils/soak_monitor.py)
+
+주문 데이터 스트림 (JSONL/CSV, 한 줄에 주문 1건, utils/data_stream.py)
+    {"customer_name": "...", "customer_phone": "...", "customer_type": "개인", "product_name": "CHP-7211N"}
+    각 레코드는 test_data.json의 기본 상태 위에 덮어씁니다. 파일을 지정하지 않으면 기본 상태를 반복 사용합니다.
+
+사용법
+    pytest -k test_order_throughput --order-loop 20 [--order-data data/order_records.jsonl]
+"""
+import itertools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from utils.config_manager import ConfigManager
+from utils.device_health import DeviceUnhealthy
+from utils.logger import logger
+from utils.retry_policy import CircuitOpen
+from utils.soak_monitor import soak_monitor
+from utils.wait_budget import WaitBudgetExceeded
+
+
+def order_records(base_state, stream=None):
+    """
+    주문 데이터 스트림에서 레코드를 한 건씩 읽어 기본 상태에 덮어쓴 상태를 반환하는 제너레이터입니다.
+    :param stream: 레코드(dict) 이터레이터 (utils/data_stream.py의 DataStream, None이면 기본 상태를 반복)
+    """
+    if stream is None:
+        for index in itertools.count(1):
+            yield dict(base_state, record_id=f"default-{index}")
+    for record in stream:
+        yield dict(base_state, **record)
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class ThroughputMeter:
+    """
+    [싱글턴 패턴 적용] 연속 주문 반복의 결과를 모아 처리량 리포트를 만드는 클래스입니다. (config.json 'Throughput')
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    throughput_config = config_manager.config.get("Throughput", {})
+                    self.iterations = throughput_config.get("iterations", 10)
+                    self.duration_minutes = throughput_config.get("duration_minutes", 0)
+                    self.max_failure_rate = throughput_config.get("max_failure_rate", 0.5)
+                    self.min_iterations_for_stop = throughput_config.get("min_iterations_for_stop", 5)
+                    self.throughput_dir = os.path.join(config_manager.project_root, 'reports', 'throughput')
+                    self.started = None
+                    self.ended = None
+                    self.results = []
+                    self._initialized = True
+
+    def start(self):
+        self.started = time.monotonic()
+        self.ended = None
+        self.results = []
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.ended or time.monotonic()) - self.started
+
+    def record(self, record_id, seconds, error=None, failed_step=None):
+        self.results.append({"iteration": len(self.results) + 1, "record_id": record_id,
+                             "seconds": round(seconds, 3), "passed": error is None,
+                             "failed_step": failed_step, "error": (str(error).splitlines() or [""])[0][:200] if error else None})
+
+    @property
+    def failure_rate(self):
+        if not self.results:
+            return 0.0
+        return sum(1 for result in self.results if not result["passed"]) / len(self.results)
+
+    def should_stop(self):
+        """
+        실패율이 허용치를 넘으면 True를 반환합니다. (min_iterations_for_stop회 이상 반복한 뒤부터 판단)
+        """
+        return len(self.results) >= self.min_iterations_for_stop and self.failure_rate > self.max_failure_rate
+
+    def summary(self):
+        passed = [result["seconds"] for result in self.results if result["passed"]]
+        hours = self.elapsed / 3600
+        return {
+            "iterations": len(self.results),
+            "passed": len(passed),
+            "failed": len(self.results) - len(passed),
+            "failure_rate": round(self.failure_rate, 3),
+            "elapsed_seconds": round(self.elapsed, 1),
+            "orders_per_hour": round(len(passed) / hours, 1) if hours else 0.0,
+            "latency_p50": _percentile(passed, 50),
+            "latency_p90": _percentile(passed, 90),
+            "latency_max": max(passed) if passed else None,
+        }
+
+    def report(self):
+        """
+        처리량 요약을 로그와 reports/throughput/throughput_<시각>.json으로 남깁니다.
+        """
+        if not self.results:
+            return None
+        summary = self.summary()
+        lines = [f"📦 연속 주문 처리량: {summary['passed']}/{summary['iterations']}건 성공, "
+                 f"시간당 {summary['orders_per_hour']}건, 실패율 {summary['failure_rate'] * 100:.1f}%",
+                 f"  반복 소요 시간(성공): p50 {summary['latency_p50']}s / p90 {summary['latency_p90']}s / "
+                 f"최대 {summary['latency_max']}s (전체 {summary['elapsed_seconds']}s)"]
+        lines += [f"  - #{result['iteration']} {result['record_id']}: {result['failed_step']} 단계 실패 - {result['error']}"
+                  for result in self.results if not result["passed"]]
+        logger.info("\n".join(lines))
+
+        os.makedirs(self.throughput_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        file_path = os.path.join(self.throughput_dir, f"throughput_{timestamp}.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({"summary": summary, "iterations": self.results}, f, ensure_ascii=False, indent=2)
+        return file_path
+
+    def run(self, records, build_runner, iterations=None):
+        """
+        주문을 반복 생성합니다. 레코드가 떨어지거나, 반복 횟수/시간에 도달하거나, 실패율이 허용치를 넘으면 멈춥니다.
+        주문 1건의 첫 단계는 현재 화면(이전 주문의 마지막 화면 또는 실패한 화면)에서 모바일 주문 홈으로 돌아가 새 주문을 시작해야 합니다.
+        - 대기 예산 초과(WaitBudgetExceeded)는 해당 반복의 실패로 기록하고 다음 주문으로 넘어갑니다.
+        - 기기 상태 불량(DeviceUnhealthy)/서킷 브레이커 열림(CircuitOpen)은 기록 후 연속 주문을 중단하고 예외를 그대로 전달합니다.
+        :param records: 주문 상태(dict) 이터레이터
+        :param build_runner: build_runner(state) -> 주문 1건을 실행하는 ScenarioRunner
+        :param iterations: 최대 반복 횟수 (None이면 config.json 'Throughput.iterations', 0이면 제한 없음)
+        :return: 처리량 요약
+        """
+        iterations = self.iterations if iterations is None else iterations
+        deadline = self.duration_minutes * 60 if self.duration_minutes else None
+        self.start()
+        soak_monitor.start()
+        try:
+            for state in itertools.islice(records, iterations or None):
+                if deadline is not None and self.elapsed >= deadline:
+                    logger.info(f"⏹️ 연속 주문 제한 시간({self.duration_minutes}분)에 도달했습니다.")
+                    break
+                logger.info(f"📦 연속 주문 #{len(self.results) + 1} 시작 (레코드: {state['record_id']})")
+                runner = build_runner(state)
+                started = time.monotonic()
+                try:
+                    runner.run()
+                except (DeviceUnhealthy, CircuitOpen) as e:
+                    # -> 같은 기기/세션으로는 다음 주문도 성공할 수 없으므로 반복을 멈춥니다.
+                    self.record(state["record_id"], time.monotonic() - started, e, runner.current_step)
+                    logger.error(f"⏹️ 연속 주문 #{len(self.results)} 중단 ({runner.current_step} 단계): {e}")
+                    raise
+                except (Exception, WaitBudgetExceeded) as e:
+                    # -> WaitBudgetExceeded는 BaseException이므로 명시하지 않으면 반복 전체가 끝납니다.
+                    self.record(state["record_id"], time.monotonic() - started, e, runner.current_step)
+                    logger.error(f"❌ 연속 주문 #{len(self.results)} 실패 ({runner.current_step} 단계): {e}")
+                    if self.should_stop():
+                        logger.error(f"⏹️ 실패율 {self.failure_rate * 100:.0f}%가 허용치"
+                                     f"({self.max_failure_rate * 100:.0f}%)를 넘어 연속 주문을 중단합니다.")
+                        break
+                else:
+                    self.record(state["record_id"], time.monotonic() - started)
+                # -> 반복별 주문 상태/러너 참조를 남기지 않아야 메모리 측정에 반복 간 누적이 섞이지 않습니다.
+                del runner, state
+                soak_monitor.on_iteration(len(self.results))
+        finally:
+            self.ended = time.monotonic()
+            self.report()
+            soak_monitor.stop()
+        return self.summary()
+
+
+throughput_meter = ThroughputMeter()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import json
+import math
+import os
+import threading
+from utils.config_manager import ConfigManager
+from utils.locator_stats import LocatorStats
+from utils.logger import logger
+
+
+class TimeoutPolicy:
+    """
+    [싱글턴 패턴 적용] 로케이터 키/플랫폼별 요소 등장 지연 시간(요소를 찾은 전략 호출의 시작 → 발견)을 기록하고,
+    요소별 대기 시간을 'p99 지연 시간 × 배수 + 여유 시간'으로 정하는 클래스입니다. (config.json 'TimeoutPolicy')
+    - 앞선 전략이 실패하며 기다린 시간은 지연 시간에 포함하지 않습니다. (포함하면 대기 시간이 ceiling까지 계속 늘어남)
+    - 기록이 min_samples건 미만이면 코드의 기본 timeout을 사용합니다.
+    - 호출부가 timeout을 명시한 조회(짧은 Probe 확인 등)에는 적용하지 않습니다. (BasePage._element_timeout)
+    - 계산된 값은 floor ~ ceiling 범위로 제한합니다.
+    반드시 있어야 하는 요소가 나타나지 않을 때는 빨리 실패하고, 느린 화면은 필요한 만큼만 기다립니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    policy_config = config_manager.config.get("TimeoutPolicy", {})
+                    self.enabled = policy_config.get("adaptive", True)
+                    self.margin_factor = policy_config.get("margin_factor", 1.5)
+                    self.margin_seconds = policy_config.get("margin_seconds", 1.0)
+                    self.floor = policy_config.get("floor", 2)
+                    self.ceiling = policy_config.get("ceiling", 30)
+                    self.min_samples = policy_config.get("min_samples", 5)
+                    self.max_samples = policy_config.get("max_samples", 200)
+                    self.file_path = os.path.join(config_manager.project_root, 'reports', 'locator_stats',
+                                                  'appearance_latency.json')
+                    self.samples = self._load()
+                    self._dirty = False
+                    self._initialized = True
+
+    def _load(self):
+        if not os.path.exists(self.file_path):
+            return {}
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"요소 등장 지연 기록 형식이 잘못되어 새로 시작합니다: {self.file_path}")
+            return {}
+
+    def record(self, locator, platform, latency):
+        """
+        요소가 발견되기까지 걸린 시간을 기록합니다. (최근 max_samples건만 유지)
+        """
+        key = LocatorStats.stats_key(locator, platform)
+        if key is None:
+            return
+        with self._lock:
+            samples = self.samples.setdefault(key, [])
+            samples.append(round(latency, 3))
+            del samples[:-self.max_samples]
+            self._dirty = True
+
+    @staticmethod
+    def percentile(values, percent):
+        ordered = sorted(values)
+        index = max(0, math.ceil(len(ordered) * percent / 100) - 1)
+        return ordered[index]
+
+    def timeout_for(self, locator, platform, default):
+        """
+        요소별 대기 시간을 반환합니다.
+        :param default: 코드에 지정된 timeout (기록이 부족하면 이 값을 사용)
+        """
+        key = LocatorStats.stats_key(locator, platform)
+        samples = self.samples.get(key) if key else None
+        if not self.enabled or not samples or len(samples) < self.min_samples:
+            return default
+        learned = self.percentile(samples, 99) * self.margin_factor + self.margin_seconds
+        return round(min(self.ceiling, max(self.floor, learned)), 2)
+
+    def save(self):
+        if not self._dirty:
+            return
+        with self._lock:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                json.dump(self.samples, f, ensure_ascii=False, indent=2, sort_keys=True)
+            self._dirty = False
+
+
+timeout_policy = TimeoutPolicy()
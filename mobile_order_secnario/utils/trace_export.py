@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+실행 타임라인(Chrome trace event JSON) 내보내기 pytest 플러그인입니다. (conftest.py의 pytest_plugins로 등록)
+테스트 / 시나리오 단계 / 페이지 메서드 / BasePage 공통 메서드 / WebDriver 명령 구간을 중첩된 막대로,
+sleep / 대기 / 스크린샷 구간은 구분되는 이름과 색으로 기록하여 겹침과 빈 시간(dead time)을 한눈에 볼 수 있게 합니다.
+결과 파일은 Perfetto(https://ui.perfetto.dev) 또는 chrome://tracing에서 엽니다.
+
+- 기기(--device)마다 별도 프로세스 트랙(pid)으로 표시됩니다.
+- 병렬 실행기(utils/parallel_runner.py)는 기기별 파일을 하나의 타임라인으로 합칩니다. (merge_traces)
+
+사용법
+    pytest --trace-export                          # reports/traces/trace_<시각>_<기기>.json
+    pytest --trace-export reports/traces/my.json   # 경로 지정
+    python -m utils.parallel_runner -- --trace-export
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from utils.config_manager import ConfigManager
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.logger import logger
+
+# -> perf_counter 기준 시각을 epoch 기준으로 바꾸는 차이값 (기기별 프로세스 파일을 합칠 때 시간축을 맞춤)
+_EPOCH_OFFSET = time.time() - time.perf_counter()
+# -> 구분 표시할 구간: (이름 접두어, trace 뷰어 예약 색 이름)
+_MARKED_CATEGORIES = {
+    SpanCategory.SLEEP: ("[sleep] ", "terrible"),
+    SpanCategory.WAIT: ("[wait] ", "yellow"),
+    SpanCategory.SCREENSHOT: ("[screenshot] ", "olive"),
+}
+
+
+def _args(attrs):
+    return {key: value if isinstance(value, (int, float, bool)) or value is None else str(value)
+            for key, value in attrs.items()}
+
+
+class TraceExporter:
+    """
+    [싱글턴 패턴 적용] 측정 구간을 trace event로 모아 파일로 저장하는 클래스입니다. (config.json 'TraceExport')
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    trace_config = config_manager.config.get("TraceExport", {})
+                    self.enabled = trace_config.get("enabled", False)
+                    self.trace_dir = os.path.join(config_manager.project_root, 'reports', 'traces')
+                    self.output_path = None
+                    self.device = None
+                    self.events = []
+                    self.thread_names = {}
+                    self._initialized = True
+
+    def configure(self, output=None, device=None):
+        """
+        :param output: 저장 경로 ('auto'면 reports/traces 아래 자동 이름, None이면 config.json 설정을 따름)
+        :param device: 프로세스 트랙 이름으로 표시할 기기 설정 키
+        """
+        if output:
+            self.enabled = True
+            self.output_path = None if output == "auto" else output
+        self.device = device
+        if self.enabled:
+            instrumentation.add_listener(self.on_span)
+
+    def on_span(self, span):
+        prefix, color = _MARKED_CATEGORIES.get(span.category, ("", None))
+        event = {
+            "name": f"{prefix}{span.name}",
+            "cat": span.category,
+            "ph": "X",
+            "ts": round((span.start + _EPOCH_OFFSET) * 1_000_000, 1),
+            "dur": round(span.duration * 1_000_000, 1),
+            "pid": os.getpid(),
+            "tid": span.thread_id,
+        }
+        if span.attrs:
+            event["args"] = _args(span.attrs)
+        if color:
+            event["cname"] = color
+        with self._lock:
+            self.events.append(event)
+            self.thread_names.setdefault(span.thread_id, threading.current_thread().name)
+
+    def _metadata(self):
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": self.device or "local"}}]
+        events += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                   for tid, name in self.thread_names.items()]
+        return events
+
+    def save(self):
+        """
+        모은 구간을 trace event JSON으로 저장하고 경로를 반환합니다. (구간이 없으면 저장하지 않음)
+        """
+        if not self.enabled or not self.events:
+            return None
+        file_path = self.output_path
+        if not file_path:
+            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            file_path = os.path.join(self.trace_dir, f"trace_{timestamp}_{self.device or 'local'}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": self._metadata() + self.events, "displayTimeUnit": "ms"},
+                      f, ensure_ascii=False)
+        logger.info(f"🧭 실행 타임라인 저장: {file_path} ({len(self.events)}개 구간, https://ui.perfetto.dev 에서 열기)")
+        return file_path
+
+
+def merge_traces(paths, output_path):
+    """
+    기기별 trace 파일을 하나의 타임라인으로 합칩니다. (기기마다 별도 프로세스 트랙)
+    :return: 합친 파일 경로 (합칠 파일이 없으면 None)
+    """
+    events = []
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            events.extend(json.load(f).get("traceEvents", []))
+    if not events:
+        return None
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+    logger.info(f"🧭 기기별 실행 타임라인 병합: {output_path} ({len(paths)}개 기기)")
+    return output_path
+
+
+trace_exporter = TraceExporter()
+
+
+# --- pytest 훅 ---
+def pytest_addoption(parser):
+    parser.addoption(
+        "--trace-export",
+        action="store",
+        nargs="?",
+        const="auto",
+        default=None,
+        help="실행 타임라인을 Chrome trace event JSON으로 저장 (값 생략 시 reports/traces/trace_<시각>_<기기>.json)",
+    )
+
+
+def pytest_configure(config):
+    trace_exporter.configure(config.getoption("--trace-export"), config.getoption("--device"))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    trace_exporter.save()
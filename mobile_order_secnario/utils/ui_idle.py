@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import threading
+import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+class UiSettled:
+    """
+    화면 지문(fingerprint)이 연속 N회(stable_samples) 동일하게 조회되면 True를 반환하는 대기 조건(expected condition)입니다.
+    WebDriverWait(...).until(UiSettled(...)) 형태로 어떤 대기에서도 종료 조건으로 사용할 수 있습니다.
+    baseline(동작 직전 화면 지문)을 주면, 화면이 baseline과 달라진 것을 한 번 확인한 뒤부터 안정 여부를 판단합니다.
+    (전환이 시작되기 전의 이전 화면을 '안정'으로 오판하지 않기 위함)
+    change_timeout초 안에 변화가 없으면 화면이 바뀌지 않는 동작으로 보고 현재 화면으로 안정 여부를 판단합니다.
+    """
+
+    def __init__(self, fingerprint_func, stable_samples=2, baseline=None, change_timeout=3):
+        self.fingerprint_func = fingerprint_func
+        self.stable_samples = max(1, stable_samples)
+        self.baseline = baseline
+        self.change_timeout = change_timeout
+        self.changed = baseline is None
+        self._started = None
+        self._last_fingerprint = None
+        self._stable_count = 0
+
+    def __call__(self, driver):
+        if self._started is None:
+            self._started = time.monotonic()
+        fingerprint = self.fingerprint_func(driver)
+        if not self.changed:
+            if fingerprint is not None and fingerprint != self.baseline:
+                self.changed = True
+            elif time.monotonic() - self._started < self.change_timeout:
+                return False
+        if fingerprint is not None and fingerprint == self._last_fingerprint:
+            self._stable_count += 1
+        else:
+            self._last_fingerprint = fingerprint
+            self._stable_count = 1 if fingerprint is not None else 0
+        return self._stable_count >= self.stable_samples
+
+
+class UiIdleMonitor:
+    """
+    [싱글턴 패턴 적용] 화면 전환 후 UI가 안정(idle)되었는지 판단하고,
+    전환(transition)별 안정화 소요 시간을 기록/리포트하는 클래스입니다.
+
+    화면 지문 구성 요소 (config.json 'UiIdle.fingerprint'):
+    - activity  : 현재 Android Activity 이름
+    - url       : WebView 컨텍스트일 때 현재 URL
+    - hierarchy : 화면 계층(page_source)의 해시
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    idle_config = config_manager.config.get("UiIdle", {})
+                    self.fingerprint_parts = idle_config.get("fingerprint", ["activity", "hierarchy"])
+                    self.interval = idle_config.get("interval", 0.3)
+                    self.stable_samples = idle_config.get("stable_samples", 2)
+                    self.change_timeout = idle_config.get("change_timeout", 3)
+                    self.timeout = idle_config.get("timeout", 10)
+                    self.report_dir = os.path.join(config_manager.project_root, 'reports', 'ui_idle')
+                    self.settle_times = {}
+                    self._initialized = True
+
+    def fingerprint(self, driver):
+        """
+        현재 화면의 지문을 계산합니다. 조회에 실패한 항목은 지문에서 제외합니다.
+        """
+        parts = []
+        for part in self.fingerprint_parts:
+            try:
+                if part == "activity":
+                    parts.append(driver.current_activity)
+                elif part == "url":
+                    if "WEBVIEW" in (driver.current_context or ""):
+                        parts.append(driver.current_url)
+                elif part == "hierarchy":
+                    parts.append(hashlib.md5(driver.page_source.encode('utf-8')).hexdigest())
+            except WebDriverException:
+                continue
+        return "|".join(str(p) for p in parts) if parts else None
+
+    def wait_until_idle(self, driver, transition, timeout=None, baseline=None):
+        """
+        화면 지문이 stable_samples회 연속 동일해질 때까지 폴링하고, 안정화 시간을 기록합니다.
+        timeout 안에 안정되지 않으면 경고만 남기고 진행합니다. (기존 고정 sleep과 동일한 비차단 동작)
+        :param transition: 전환 이름 (리포트 키, 예: 'ProductSelectionPage.containing_goods')
+        :param baseline: 동작(클릭) 직전의 화면 지문. 주면 화면이 바뀐 것을 확인한 뒤부터 안정 여부를 판단합니다.
+        :return: 안정화까지 걸린 시간(초) / 시간 초과 시 None
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        condition = UiSettled(self.fingerprint, self.stable_samples, baseline, self.change_timeout)
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.interval).until(condition)
+        except TimeoutException:
+            logger.warning(f"⚠️ '{transition}' 이후 {timeout}초 안에 화면이 안정되지 않았습니다. 계속 진행합니다.")
+            self._record(transition, None)
+            return None
+        if not condition.changed:
+            logger.warning(f"⚠️ '{transition}' 이후 {self.change_timeout}초 동안 화면 변화가 없었습니다.")
+
+        elapsed = time.monotonic() - started
+        logger.info(f"⏱️ '{transition}' 화면 안정화 완료: {elapsed:.2f}초")
+        self._record(transition, elapsed)
+        return elapsed
+
+    def _record(self, transition, elapsed):
+        with self._lock:
+            stats = self.settle_times.setdefault(transition, {"samples": [], "timeouts": 0})
+            if elapsed is None:
+                stats["timeouts"] += 1
+            else:
+                stats["samples"].append(round(elapsed, 3))
+
+    def summary(self):
+        """
+        전환별 안정화 시간 요약(횟수, 평균, 최대, 시간 초과 횟수)을 느린 순으로 반환합니다.
+        """
+        rows = []
+        with self._lock:
+            for transition, stats in self.settle_times.items():
+                samples = stats["samples"]
+                rows.append({
+                    "transition": transition,
+                    "count": len(samples),
+                    "avg": round(sum(samples) / len(samples), 3) if samples else None,
+                    "max": max(samples) if samples else None,
+                    "timeouts": stats["timeouts"],
+                })
+        return sorted(rows, key=lambda r: (r["max"] or 0), reverse=True)
+
+    def report(self):
+        """
+        안정화 시간 요약을 로그로 출력하고 reports/ui_idle 폴더에 JSON으로 저장합니다.
+        """
+        rows = self.summary()
+        if not rows:
+            return None
+        logger.info("📊 화면 전환별 안정화 시간 (느린 순)")
+        for row in rows:
+            logger.info(f"   - {row['transition']}: 평균 {row['avg']}초, 최대 {row['max']}초, "
+                        f"{row['count']}회, 시간초과 {row['timeouts']}회")
+        os.makedirs(self.report_dir, exist_ok=True)
+        file_path = os.path.join(self.report_dir, f"settle_times_{time.strftime('%Y-%m-%d_%H-%M-%S')}.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        return file_path
+
+
+ui_idle_monitor = UiIdleMonitor()
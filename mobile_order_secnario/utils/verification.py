@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import functools
+import threading
+from utils.config_manager import ConfigManager
+from utils.logger import logger
+
+
+class VerificationLevel:
+    """
+    검증 수준 상수입니다. 뒤로 갈수록 더 많은 검증을 실행합니다.
+    - SMOKE    : 화면 이동에 꼭 필요한 검증(단계 표시, 고객명 등)만 실행하여 주문 흐름을 가장 빠르게 통과합니다.
+    - STANDARD : 금액 계산, 결제수단 추가 결과처럼 주문 결과에 영향을 주는 검증까지 실행합니다.
+    - AUDIT    : 문구/금액 표시 형식 확인 등 감사용 검증까지 모두 실행합니다. (기존 동작)
+    """
+    SMOKE = "smoke"
+    STANDARD = "standard"
+    AUDIT = "audit"
+
+    ALL = (SMOKE, STANDARD, AUDIT)
+
+
+class VerificationSettings:
+    """
+    [싱글턴 패턴 적용] 현재 실행의 검증 수준을 관리하는 클래스입니다. (config.json 'Verification', --verify-level)
+    페이지 메서드는 @check_level로, 메서드 안의 검증 구간은 allows()로 자신의 검증 수준을 선언하며,
+    현재 검증 수준보다 높은 수준의 검증은 요소 조회/스와이프 없이 건너뜁니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    verification_config = ConfigManager().config.get("Verification", {})
+                    self.level = VerificationLevel.AUDIT
+                    self.set_level(verification_config.get("level", VerificationLevel.AUDIT))
+                    self.skipped = {}
+                    self._initialized = True
+
+    def set_level(self, level):
+        """
+        검증 수준을 변경합니다. (pytest --verify-level 옵션에서 호출)
+        """
+        if not level:
+            return
+        level = level.lower()
+        if level not in VerificationLevel.ALL:
+            raise ValueError(f"지원하지 않는 검증 수준입니다: {level} (허용 값: {VerificationLevel.ALL})")
+        self.level = level
+
+    def allows(self, level, name=None):
+        """
+        선언된 검증 수준이 현재 검증 수준 이하이면 True를 반환합니다.
+        :param name: 건너뛸 때 로그와 생략 횟수에 남길 검증 이름
+        """
+        if VerificationLevel.ALL.index(level) <= VerificationLevel.ALL.index(self.level):
+            return True
+        if name:
+            self.skipped[name] = self.skipped.get(name, 0) + 1
+            logger.info(f"⏭️ [{self.level}] {level} 수준 검증 생략: {name}")
+        return False
+
+
+verification_settings = VerificationSettings()
+
+
+def check_level(level):
+    """
+    페이지 메서드의 검증 수준을 선언하는 데코레이터입니다.
+    현재 검증 수준에서 실행하지 않는 메서드는 호출하지 않고 None(검증 대상 없음과 같은 값)을 반환합니다.
+    재시도 데코레이터(@retryable)보다 바깥에 붙여, 건너뛸 때는 재시도 정책도 거치지 않게 합니다.
+    """
+    if level not in VerificationLevel.ALL:
+        raise ValueError(f"지원하지 않는 검증 수준입니다: {level} (허용 값: {VerificationLevel.ALL})")
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not verification_settings.allows(level, f"{type(self).__name__}.{func.__name__}"):
+                return None
+            return func(self, *args, **kwargs)
+        wrapper.check_level = level
+        return wrapper
+    return decorator
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from contextlib import contextmanager
+from selenium.common.exceptions import TimeoutException
+from utils.config_manager import ConfigManager
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.logger import logger
+
+
+class WaitBudgetExceeded(BaseException):
+    """
+    시나리오/단계의 대기 예산을 모두 사용했을 때 발생합니다.
+    페이지 코드의 'except Exception' 분기에서 삼켜져 다음 요소를 계속 탐색하지 않도록 BaseException을 상속합니다.
+    (pytest.fail()의 Failed 예외와 같은 방식)
+    """
+
+
+class WaitBudget:
+    """
+    [싱글턴 패턴 적용] 시나리오 단위 대기 예산을 관리하는 클래스입니다.
+    BasePage의 모든 대기(요소 대기, 화면 대기, UI 안정화 대기)와 sleep은 이 예산에서 시간을 차감합니다.
+    - 대기 시간은 남은 단계/시나리오 예산을 넘지 않도록 줄여서 사용합니다.
+    - 예산을 모두 쓴 뒤 대기가 실패하면 더 이상 탐색하지 않고 WaitBudgetExceeded로 즉시 중단하며,
+      시간을 가장 많이 쓴 대기 항목(페이지 메서드/요소)을 함께 보고합니다.
+    시나리오가 시작되지 않은 상태(start_scenario 호출 전)에서는 예산을 적용하지 않습니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    budget_config = ConfigManager().config.get("WaitBudget", {})
+                    self.enabled = budget_config.get("enabled", True)
+                    self.scenario_seconds = budget_config.get("scenario_seconds", 600)
+                    self.step_seconds = budget_config.get("step_seconds", 180)
+                    self.scenario_name = None
+                    self.step_name = None
+                    self._reset_scenario()
+                    self._initialized = True
+
+    def _reset_scenario(self):
+        self.scenario_spent = 0.0
+        self.step_spent = 0.0
+        self.charges = []
+
+    @property
+    def active(self):
+        return self.enabled and self.scenario_name is not None
+
+    def start_scenario(self, scenario_name, seconds=None):
+        self.scenario_name = scenario_name
+        if seconds is not None:
+            self.scenario_seconds = seconds
+        self.step_name = None
+        self._reset_scenario()
+
+    def end_scenario(self):
+        self.scenario_name = None
+        self.step_name = None
+
+    def start_step(self, step_name):
+        self.step_name = step_name
+        self.step_spent = 0.0
+
+    def remaining(self):
+        """
+        남은 예산(초)을 반환합니다. 단계 예산과 시나리오 예산 중 작은 값입니다.
+        """
+        if not self.active:
+            return float('inf')
+        scenario_left = self.scenario_seconds - self.scenario_spent
+        if self.step_name is None:
+            return scenario_left
+        return min(scenario_left, self.step_seconds - self.step_spent)
+
+    def clamp(self, timeout):
+        """
+        대기 시간을 남은 예산 이내로 줄입니다.
+        """
+        return max(0, min(timeout, self.remaining()))
+
+    @staticmethod
+    def _owner(label):
+        page = instrumentation.current()
+        page = page.ancestor(SpanCategory.PAGE) if page else None
+        return f"{page.name} / {label}" if page else label
+
+    def charge(self, label, seconds):
+        if not self.active:
+            return
+        self.scenario_spent += seconds
+        self.step_spent += seconds
+        self.charges.append((self.step_name, self._owner(label), seconds))
+
+    def report(self, top=5):
+        """
+        이번 시나리오에서 대기 시간을 가장 많이 쓴 항목을 '단계 / 페이지 메서드 / 대기 항목' 단위로 집계합니다.
+        """
+        totals = {}
+        for step_name, owner, seconds in self.charges:
+            key = f"[{step_name or '-'}] {owner}"
+            count, total = totals.get(key, (0, 0.0))
+            totals[key] = (count + 1, total + seconds)
+        ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        lines = [f"대기 예산 사용: 시나리오 {self.scenario_spent:.1f}/{self.scenario_seconds}s, "
+                 f"단계 '{self.step_name}' {self.step_spent:.1f}/{self.step_seconds}s"]
+        lines += [f"  - {key}: {total:.1f}s ({count}회)" for key, (count, total) in ranked]
+        return "\n".join(lines)
+
+    def _exhausted(self):
+        return self.active and self.remaining() <= 0
+
+    def _abort(self, label):
+        message = f"⏱️ 대기 예산 소진으로 시나리오를 중단합니다. (마지막 대기: {self._owner(label)})\n{self.report()}"
+        logger.error(message)
+        raise WaitBudgetExceeded(message)
+
+    @contextmanager
+    def waiting(self, label, timeout):
+        """
+        with wait_budget.waiting("요소 이름", timeout) as allowed: 형태로 대기 1회를 예산에서 차감합니다.
+        :param timeout: 원래 대기 시간
+        :return(yield): 예산을 반영한 대기 시간
+        """
+        if self._exhausted():
+            self._abort(label)
+        allowed = self.clamp(timeout)
+        started = time.monotonic()
+        try:
+            with instrumentation.span(label, SpanCategory.WAIT, timeout=allowed):
+                yield allowed
+        except TimeoutException:
+            self.charge(label, time.monotonic() - started)
+            if self._exhausted():
+                self._abort(label)
+            raise
+        else:
+            self.charge(label, time.monotonic() - started)
+
+    def sleep(self, seconds, label="sleep"):
+        """
+        예산 이내에서 sleep합니다. 예산이 없으면 즉시 중단합니다.
+        """
+        if self._exhausted():
+            self._abort(label)
+        allowed = self.clamp(seconds)
+        with instrumentation.span(label, SpanCategory.SLEEP, seconds=allowed):
+            time.sleep(allowed)
+        self.charge(label, allowed)
+
+
+wait_budget = WaitBudget()
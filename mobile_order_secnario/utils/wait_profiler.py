@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+sleep/대기 시간 프로파일러 pytest 플러그인입니다. (conftest.py의 pytest_plugins로 등록)
+테스트 실행 시간의 모든 초를 다섯 가지 항목으로 나누고, 항목마다 페이지 메서드별로 집계하여
+실행이 끝나면 '낭비 시간' 순위표를 남깁니다. pages/의 sleep 중 무엇부터 없앨지 정하는 데 사용합니다.
+
+    고정 sleep      short_sleep/medium_sleep/long_sleep, 페이지 코드의 time.sleep
+    대기 폴링        WebDriverWait/화면 대기/UI 안정화 대기 (폴링 중 발생한 명령 포함)
+    명령 지연        대기 밖에서 실행된 WebDriver 명령의 왕복 시간
+    스크린샷/IO      스크린샷 저장 (스크린샷 명령 포함)
+    Python 처리     위 항목에 속하지 않는 나머지 시간 (페이지 로직, 로깅, 파싱 등)
+
+사용법
+    pytest --profile-waits      # reports/profiles/wait_profile_<시각>.json + 로그 순위표
+"""
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from utils.config_manager import ConfigManager
+from utils.instrumentation import SpanCategory, instrumentation
+from utils.logger import logger
+
+
+class TimeBucket:
+    SLEEP = "고정 sleep"
+    WAIT = "대기 폴링"
+    COMMAND = "명령 지연"
+    SCREENSHOT = "스크린샷/IO"
+    OVERHEAD = "Python 처리"
+    ALL = (SLEEP, WAIT, COMMAND, SCREENSHOT, OVERHEAD)
+
+
+# -> 이 구간 안의 시간은 (안쪽 명령 포함) 모두 해당 항목으로 봅니다.
+_ENCLOSING_BUCKETS = {
+    SpanCategory.SLEEP: TimeBucket.SLEEP,
+    SpanCategory.WAIT: TimeBucket.WAIT,
+    SpanCategory.SCREENSHOT: TimeBucket.SCREENSHOT,
+}
+_OUTSIDE_PAGE = "(페이지 메서드 밖)"
+
+
+def _classify(span):
+    """
+    구간의 자기 시간(self time)이 속하는 항목과 라벨을 반환합니다. 가장 가까운 sleep/대기/스크린샷 구간이 우선합니다.
+    """
+    current = span
+    while current is not None and current.category != SpanCategory.TEST:
+        bucket = _ENCLOSING_BUCKETS.get(current.category)
+        if bucket:
+            return bucket, current.attrs.get("site") or current.name
+        current = current.parent
+    if span.category == SpanCategory.COMMAND:
+        return TimeBucket.COMMAND, span.name
+    return TimeBucket.OVERHEAD, "-"
+
+
+def _page_method(span):
+    """
+    구간을 실행한 가장 바깥쪽 페이지 메서드 이름을 반환합니다.
+    """
+    found = None
+    while span is not None:
+        if span.category == SpanCategory.PAGE:
+            found = span
+        span = span.parent
+    return found.name if found else _OUTSIDE_PAGE
+
+
+class WaitProfiler:
+    """
+    [싱글턴 패턴 적용] 측정 구간의 자기 시간을 (항목, 페이지 메서드, 라벨) 단위로 누적하는 클래스입니다. (config.json 'WaitProfiler')
+    자기 시간 = 구간 시간 - 자식 구간 시간이므로, 테스트 구간 아래의 모든 시간이 정확히 한 번씩 집계됩니다.
+    프로파일 중에는 페이지 코드의 time.sleep도 sleep 구간으로 측정합니다.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            with self._lock:
+                if not hasattr(self, '_initialized'):
+                    config_manager = ConfigManager()
+                    profiler_config = config_manager.config.get("WaitProfiler", {})
+                    self.enabled = profiler_config.get("enabled", False)
+                    self.top = profiler_config.get("top", 20)
+                    self.profile_dir = os.path.join(config_manager.project_root, 'reports', 'profiles')
+                    self.totals = {}
+                    self.wall_time = 0.0
+                    self._child_time = {}
+                    self._original_sleep = None
+                    self._initialized = True
+
+    def start(self):
+        instrumentation.add_listener(self.on_span)
+        self._patch_sleep()
+
+    def stop(self):
+        instrumentation.remove_listener(self.on_span)
+        if self._original_sleep is not None:
+            time.sleep = self._original_sleep
+            self._original_sleep = None
+
+    def _patch_sleep(self):
+        """
+        time.sleep을 감싸 측정 구간 밖에서 직접 호출된 sleep을 'time.sleep(초) @ 파일:줄' sleep 구간으로 기록합니다.
+        (이미 sleep/대기 구간 안에서의 호출 - WebDriverWait 폴링 등 - 과 테스트 밖의 호출은 그대로 실행)
+        """
+        if self._original_sleep is not None:
+            return
+        original_sleep = self._original_sleep = time.sleep
+
+        def sleep(seconds):
+            current = instrumentation.current()
+            if current is None or current.category in _ENCLOSING_BUCKETS:
+                return original_sleep(seconds)
+            caller = sys._getframe(1)
+            site = f"time.sleep({seconds}) @ {os.path.basename(caller.f_code.co_filename)}:{caller.f_lineno}"
+            with instrumentation.span("time.sleep", SpanCategory.SLEEP, seconds=seconds, site=site):
+                return original_sleep(seconds)
+
+        time.sleep = sleep
+
+    def on_span(self, span):
+        children = self._child_time.pop(span, 0.0)
+        if span.parent is not None:
+            self._child_time[span.parent] = self._child_time.get(span.parent, 0.0) + span.duration
+        if span.category == SpanCategory.TEST:
+            self.wall_time += span.duration
+        if span.ancestor(SpanCategory.TEST) is None:
+            return
+        self_time = max(0.0, span.duration - children)
+        bucket, label = _classify(span)
+        key = (bucket, _page_method(span), label)
+        count, total = self.totals.get(key, (0, 0.0))
+        # -> 호출 횟수는 항목을 결정한 구간 자신일 때만 셉니다. (대기 안의 명령마다 대기 횟수가 늘지 않도록)
+        counted = span.category in _ENCLOSING_BUCKETS or bucket in (TimeBucket.COMMAND, TimeBucket.OVERHEAD)
+        self.totals[key] = (count + (1 if counted else 0), total + self_time)
+
+    def bucket_totals(self):
+        totals = dict.fromkeys(TimeBucket.ALL, 0.0)
+        for (bucket, _, _), (_, seconds) in self.totals.items():
+            totals[bucket] += seconds
+        return totals
+
+    def ranked(self):
+        """
+        Python 처리를 제외한 (항목, 페이지 메서드, 라벨)을 낭비 시간이 큰 순으로 반환합니다.
+        """
+        rows = [{"bucket": bucket, "page_method": page_method, "label": label, "count": count,
+                 "seconds": round(seconds, 3)}
+                for (bucket, page_method, label), (count, seconds) in self.totals.items()
+                if bucket != TimeBucket.OVERHEAD]
+        return sorted(rows, key=lambda row: row["seconds"], reverse=True)
+
+    def report(self):
+        """
+        항목별 합계와 낭비 시간 순위표를 로그와 reports/profiles/wait_profile_<시각>.json으로 남깁니다.
+        """
+        if not self.totals:
+            return None
+        buckets = self.bucket_totals()
+        wall = self.wall_time or sum(buckets.values())
+        lines = [f"⏳ 시간 사용 프로파일 (테스트 실행 {wall:.1f}s)"]
+        lines += [f"  {bucket:<10} {seconds:8.1f}s ({seconds / wall * 100 if wall else 0:5.1f}%)"
+                  for bucket, seconds in buckets.items()]
+        ranked = self.ranked()
+        lines.append(f"  낭비 시간 상위 {min(self.top, len(ranked))}개 (항목 / 페이지 메서드 / 라벨):")
+        lines += [f"  {index:>3}. {row['seconds']:7.1f}s  {row['bucket']} / {row['page_method']} / {row['label']}"
+                  f" ({row['count']}회)"
+                  for index, row in enumerate(ranked[:self.top], start=1)]
+        logger.info("\n".join(lines))
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        file_path = os.path.join(self.profile_dir, f"wait_profile_{timestamp}.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({"wall_time": round(wall, 3),
+                       "buckets": {bucket: round(seconds, 3) for bucket, seconds in buckets.items()},
+                       "ranked": ranked}, f, ensure_ascii=False, indent=2)
+        return file_path
+
+
+wait_profiler = WaitProfiler()
+
+
+# --- pytest 훅 ---
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile-waits",
+        action="store_true",
+        default=False,
+        help="실행 시간을 고정 sleep/대기 폴링/명령 지연/스크린샷·IO/Python 처리로 나눈 낭비 시간 순위표를 남김",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--profile-waits"):
+        wait_profiler.enabled = True
+    if wait_profiler.enabled:
+        wait_profiler.start()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if wait_profiler.enabled:
+        wait_profiler.stop()
+        wait_profiler.report()